@@ -4,12 +4,57 @@ Create macOS App Bundle for QCAN Explorer
 This script creates a proper .app bundle for macOS with the correct icon and metadata.
 """
 
+import argparse
+import compileall
+import ctypes
+import ctypes.util
 import os
 import shutil
 import sys
+import tempfile
 from pathlib import Path
 
-def create_app_bundle():
+
+def _clonefile(src, dst) -> bool:
+    """Clone a file with clonefile(2) on APFS; returns False if unsupported"""
+    if sys.platform != "darwin":
+        return False
+    
+    try:
+        libsystem = ctypes.CDLL(ctypes.util.find_library("System"), use_errno=True)
+        clonefile = libsystem.clonefile
+    except (OSError, AttributeError, TypeError):
+        return False
+    
+    clonefile.argtypes = [ctypes.c_char_p, ctypes.c_char_p, ctypes.c_uint32]
+    clonefile.restype = ctypes.c_int
+    return clonefile(os.fsencode(src), os.fsencode(dst), 0) == 0
+
+
+def _fast_copy(src, dst):
+    """Copy a file using the cheapest mechanism the platform offers"""
+    # APFS copy-on-write clone is constant time; otherwise shutil.copyfile
+    # already uses fcopyfile (macOS) or sendfile (Linux) in the kernel
+    if not _clonefile(src, dst):
+        shutil.copyfile(src, dst)
+    shutil.copystat(src, dst)
+
+
+def zip_app_bundle(bundle_path: Path) -> Path:
+    """Archive an app bundle as a single .zip file for distribution"""
+    with tempfile.TemporaryDirectory() as staging_dir:
+        # Stage a clean copy so caches and Finder metadata stay out of the archive
+        staged_bundle = Path(staging_dir) / bundle_path.name
+        shutil.copytree(bundle_path, staged_bundle, symlinks=True,
+                        ignore=shutil.ignore_patterns("__pycache__", ".DS_Store"))
+        
+        archive = shutil.make_archive(str(bundle_path), "zip",
+                                      root_dir=staging_dir, base_dir=bundle_path.name)
+        
+    return Path(archive)
+
+
+def create_app_bundle(zip_bundle: bool = False):
     """Create a macOS .app bundle"""
     app_name = "QCAN Explorer"
     bundle_name = f"{app_name}.app"
@@ -20,26 +65,34 @@ def create_app_bundle():
     macos_path = contents_path / "MacOS"
     resources_path = contents_path / "Resources"
     
+    # Scan the working directory once instead of probing each file separately
+    entries = {entry.name: entry for entry in os.scandir(".")}
+    
     # Clean up existing bundle
-    if bundle_path.exists():
-        shutil.rmtree(bundle_path)
+    shutil.rmtree(bundle_path, ignore_errors=True)
     
     # Create directories
     macos_path.mkdir(parents=True)
     resources_path.mkdir(parents=True)
     
     # Copy Info.plist
-    if Path("Info.plist").exists():
-        shutil.copy2("Info.plist", contents_path / "Info.plist")
+    if "Info.plist" in entries and entries["Info.plist"].is_file():
+        _fast_copy(entries["Info.plist"].path, contents_path / "Info.plist")
     
     # Copy logo as icon
-    if Path("logo.png").exists():
-        shutil.copy2("logo.png", resources_path / "logo.png")
+    if "logo.png" in entries and entries["logo.png"].is_file():
+        _fast_copy(entries["logo.png"].path, resources_path / "logo.png")
     
-    # Create launcher script
+    # Precompile the application so the first launch skips bytecode compilation
+    if "main.py" in entries:
+        compileall.compile_file(entries["main.py"].path, quiet=1)
+    if "src" in entries:
+        compileall.compile_dir(entries["src"].path, quiet=1)
+    
+    # Create launcher script (importing main lets Python use its cached bytecode)
     launcher_script = f"""#!/bin/bash
 cd "$(dirname "$0")/../../../"
-python3 main.py
+exec python3 -c 'import main; main.main()'
 """
     
     launcher_path = macos_path / app_name
@@ -53,7 +106,16 @@ python3 main.py
     print(f"📁 Bundle location: {bundle_path.absolute()}")
     print(f"🚀 You can now double-click {bundle_name} to launch QCAN Explorer!")
     
+    if zip_bundle:
+        archive_path = zip_app_bundle(bundle_path)
+        print(f"📦 Distribution archive: {archive_path.absolute()}")
+    
     return bundle_path
 
 if __name__ == "__main__":
-    create_app_bundle()
+    parser = argparse.ArgumentParser(description="Create a macOS .app bundle for QCAN Explorer")
+    parser.add_argument("--zip", action="store_true",
+                        help="also write a zipped copy of the bundle for distribution")
+    args = parser.parse_args()
+    
+    create_app_bundle(zip_bundle=args.zip)
@@ -0,0 +1,17 @@
+"""
+Shared setup for the example demos
+Resolves the example paths once and puts the application sources on sys.path
+"""
+
+import os
+import sys
+
+# Paths resolved once at import time
+EXAMPLES_DIR = os.path.dirname(os.path.abspath(__file__))
+SRC_PATH = os.path.join(os.path.dirname(EXAMPLES_DIR), 'src')
+SYM_PATH = os.path.join(EXAMPLES_DIR, 'sym', 'virtual_can_network.sym')
+LOGS_DIR = os.path.join(EXAMPLES_DIR, 'logs')
+
+# Add src to path
+if SRC_PATH not in sys.path:
+    sys.path.insert(0, SRC_PATH)
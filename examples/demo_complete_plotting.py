@@ -6,15 +6,15 @@ Demonstrates both real-time and trace file plotting capabilities
 
 import sys
 import os
-import time
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Resolve example paths and add src to path
+from _bootstrap import SYM_PATH, LOGS_DIR
 
+from PyQt6.QtCore import QTimer
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QPushButton, QHBoxLayout
 from gui.plotting_tab import PlottingTab
 from canbus.interface_manager import CANInterfaceManager
-from utils.sym_parser import SymParser
+from utils.sym_parser import load_sym_file_cached
 
 
 class CompletePlottingDemo(QMainWindow):
@@ -78,6 +78,9 @@ class CompletePlottingDemo(QMainWindow):
         # Create CAN manager and plotting tab
         self.can_manager = CANInterfaceManager()
         self.plotting_tab = PlottingTab(self.can_manager)
+        self.trace_reader = None
+        self.trace_writer = None
+        self.trace_logging = None
         
         # Load SYM file for signal definitions
         self.load_sym_file()
@@ -87,12 +90,9 @@ class CompletePlottingDemo(QMainWindow):
         
     def load_sym_file(self):
         """Load the virtual CAN SYM file"""
-        sym_path = os.path.join(os.path.dirname(__file__), 'sym', 'virtual_can_network.sym')
+        parser = load_sym_file_cached(SYM_PATH)
         
-        parser = SymParser()
-        success = parser.parse_file(sym_path)
-        
-        if success:
+        if parser:
             self.plotting_tab.set_sym_parser(parser)
             print(f"✅ Loaded SYM file with {len(parser.messages)} messages for plotting")
         else:
@@ -137,49 +137,75 @@ class CompletePlottingDemo(QMainWindow):
         success = self.can_manager.connect('virtual', 'virtual0', 500000)
         
         if success:
-            # Create a temporary logging session
-            from gui.logging_tab import LoggingTab
-            
-            temp_logging = LoggingTab(self.can_manager)
-            temp_logging.start_logging()
+            self._begin_trace_capture()
+        else:
+            print("❌ Failed to connect to virtual CAN for trace creation")
             
-            # Record for 8 seconds
-            time.sleep(8)
+    def _begin_trace_capture(self):
+        """Start logging and let the event loop collect messages for 8 seconds"""
+        # Create a temporary logging session
+        from gui.logging_tab import LoggingTab
+        
+        self.trace_logging = LoggingTab(self.can_manager)
+        self.trace_logging.start_logging()
+        self.create_trace_btn.setEnabled(False)
+        
+        # Record for 8 seconds without blocking the GUI thread
+        QTimer.singleShot(8000, self._finish_trace_capture)
+        
+    def _finish_trace_capture(self):
+        """Stop logging and write the captured messages to a trace file"""
+        temp_logging = self.trace_logging
+        self.trace_logging = None
+        self.create_trace_btn.setEnabled(True)
+        
+        temp_logging.stop_logging()
+        message_count = len(temp_logging.logged_messages)
+        
+        if message_count > 0:
+            # Save as trace file in the background
+            trace_filename = os.path.join(LOGS_DIR, 'demo_trace.trc')
             
-            temp_logging.stop_logging()
-            message_count = len(temp_logging.logged_messages)
+            from gui.logging_tab import LogWriter
             
-            if message_count > 0:
-                # Save as trace file
-                trace_filename = 'examples/logs/demo_trace.trc'
-                
-                from gui.logging_tab import LogWriter
-                log_writer = LogWriter(trace_filename, 'TRC', temp_logging.logged_messages)
-                log_writer.run()
-                
+            def on_write_finished(result):
                 print(f"✅ Created demo trace file: {trace_filename}")
                 print(f"   Contains {message_count} messages over 8 seconds")
-            else:
-                print("❌ No messages recorded for trace")
                 
-            self.can_manager.disconnect()
+            def on_write_error(error):
+                print(f"❌ Failed to write trace file: {error}")
+                
+            self.trace_writer = LogWriter(temp_logging.logged_messages, trace_filename, 'TRC')
+            self.trace_writer.finished.connect(on_write_finished)
+            self.trace_writer.error_occurred.connect(on_write_error)
+            self.trace_writer.start()
         else:
-            print("❌ Failed to connect to virtual CAN for trace creation")
+            print("❌ No messages recorded for trace")
+            
+        self.can_manager.disconnect()
             
     def start_trace_demo(self):
         """Start trace file plotting demo"""
         print("📁 Starting TRACE FILE plotting demo...")
         
         # Check if we have a demo trace file
-        trace_file = 'examples/logs/demo_trace.trc'
-        if not os.path.exists(trace_file):
-            trace_file = 'examples/logs/virtual_can_trace.trc'
+        # One directory listing answers both lookups; LogReader reports any
+        # file that disappears before it is opened through error_occurred
+        logs_dir = LOGS_DIR
+        try:
+            log_names = set(os.listdir(logs_dir))
+        except FileNotFoundError:
+            log_names = set()
             
-        if not os.path.exists(trace_file):
+        for candidate in ('demo_trace.trc', 'virtual_can_trace.trc'):
+            if candidate in log_names:
+                trace_file = os.path.join(logs_dir, candidate)
+                break
+        else:
             print("❌ No demo trace file found. Click 'Create Sample Trace' first.")
             return
             
-        # Load the trace file
+        # Load the trace file in the background; the whole file arrives in one batch
         try:
             from gui.logging_tab import LogReader
             
@@ -187,36 +213,37 @@ class CompletePlottingDemo(QMainWindow):
             self.plotting_tab.clear_plots()
             self.plotting_tab.trace_messages = []
             
-            # Load trace
-            log_reader = LogReader(trace_file)
-            
-            trace_messages = []
-            def on_message_loaded(msg):
-                trace_messages.append(msg)
-                
-            log_reader.message_loaded.connect(on_message_loaded)
-            log_reader.run()
-            
-            # Set trace data
-            self.plotting_tab.trace_messages = trace_messages
-            self.plotting_tab.is_trace_mode = True
-            self.plotting_tab.on_trace_file_loaded(len(trace_messages))
-            
-            # Auto-select signals for demo
-            signals_to_plot = [
-                ('Engine_Data', 'EngineRPM'),
-                ('Vehicle_Speed_Data', 'VehicleSpeed'),
-                ('Electrical_System_Data', 'BatteryVoltage'),
-            ]
-            
-            for message_name, signal_name in signals_to_plot:
-                self.plotting_tab.on_signal_toggled(message_name, signal_name, True)
-                
-            print(f"✅ Loaded and plotted trace file with {len(trace_messages)} messages")
-            print("📈 Historical signal data now displayed on plot")
+            self.trace_reader = LogReader(trace_file)
+            self.trace_reader.batch_loaded.connect(self._install_trace_batch)
+            self.trace_reader.error_occurred.connect(self._on_trace_error)
+            self.trace_reader.start()
             
         except Exception as e:
             print(f"❌ Error loading trace file: {e}")
+            
+    def _install_trace_batch(self, trace_messages):
+        """Hand a fully loaded trace to the plotting tab"""
+        # Set trace data
+        self.plotting_tab.trace_messages = trace_messages
+        self.plotting_tab.is_trace_mode = True
+        self.plotting_tab.on_trace_file_loaded(len(trace_messages))
+        
+        # Auto-select signals for demo
+        signals_to_plot = [
+            ('Engine_Data', 'EngineRPM'),
+            ('Vehicle_Speed_Data', 'VehicleSpeed'),
+            ('Electrical_System_Data', 'BatteryVoltage'),
+        ]
+        
+        for message_name, signal_name in signals_to_plot:
+            self.plotting_tab.on_signal_toggled(message_name, signal_name, True)
+            
+        print(f"✅ Loaded and plotted trace file with {len(trace_messages)} messages")
+        print("📈 Historical signal data now displayed on plot")
+        
+    def _on_trace_error(self, error):
+        """Report a trace file that could not be read"""
+        print(f"❌ Error loading trace file: {error}")
 
 
 def main():
@@ -8,13 +8,13 @@ import sys
 import os
 import time
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Resolve example paths and add src to path
+from _bootstrap import SYM_PATH, LOGS_DIR
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QPushButton, QHBoxLayout
 from gui.logging_tab import LoggingTab
 from canbus.interface_manager import CANInterfaceManager
-from utils.sym_parser import SymParser
+from utils.sym_parser import load_sym_file_cached
 
 
 class EnhancedLoggingDemo(QMainWindow):
@@ -76,12 +76,9 @@ class EnhancedLoggingDemo(QMainWindow):
         
     def load_sym_file(self):
         """Load the virtual CAN SYM file for tooltips"""
-        sym_path = os.path.join(os.path.dirname(__file__), 'sym', 'virtual_can_network.sym')
+        parser = load_sym_file_cached(SYM_PATH)
         
-        parser = SymParser()
-        success = parser.parse_file(sym_path)
-        
-        if success:
+        if parser:
             self.logging_tab.set_sym_parser(parser)
             print(f"✅ Loaded SYM file for hover tooltips")
         else:
@@ -104,7 +101,7 @@ class EnhancedLoggingDemo(QMainWindow):
             
     def load_example_trc(self):
         """Load the example TRC file"""
-        trc_path = os.path.join(os.path.dirname(__file__), 'logs', 'example.trc')
+        trc_path = os.path.join(LOGS_DIR, 'example.trc')
         
         if os.path.exists(trc_path):
             # Clear current display
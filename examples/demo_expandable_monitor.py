@@ -5,16 +5,15 @@ Demonstrates the new expandable message tree in the Monitor tab
 """
 
 import sys
-import os
 import time
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Resolve example paths and add src to path
+from _bootstrap import SYM_PATH
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QPushButton, QHBoxLayout
 from gui.monitor_tab import MessageTreeWidget
 from canbus.interface_manager import CANInterfaceManager
-from utils.sym_parser import SymParser
+from utils.sym_parser import load_sym_file_cached
 
 
 class ExpandableMonitorDemo(QMainWindow):
@@ -78,12 +77,9 @@ class ExpandableMonitorDemo(QMainWindow):
         
     def load_sym_file(self):
         """Load the virtual CAN SYM file"""
-        sym_path = os.path.join(os.path.dirname(__file__), 'sym', 'virtual_can_network.sym')
+        parser = load_sym_file_cached(SYM_PATH)
         
-        parser = SymParser()
-        success = parser.parse_file(sym_path)
-        
-        if success:
+        if parser:
             self.message_tree.set_sym_parser(parser)
             print(f"✅ Loaded SYM file with {len(parser.messages)} message definitions")
         else:
@@ -150,8 +146,8 @@ class ExpandableMonitorDemo(QMainWindow):
         ]
         
         print(f"\n📨 Adding {len(test_messages)} test messages...")
-        for i, msg in enumerate(test_messages):
-            self.message_tree.add_message(msg)
+        self.message_tree.add_messages(test_messages)
+        for msg in test_messages:
             print(f"  Added: 0x{msg.arbitration_id:X} - {self.message_tree.get_message_name(msg.arbitration_id)}")
             
         print(f"\n🌳 Tree now has {self.message_tree.topLevelItemCount()} message types")
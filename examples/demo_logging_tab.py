@@ -5,16 +5,15 @@ Demonstrates the redesigned logging functionality with text-based display and ho
 """
 
 import sys
-import os
 import time
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Resolve example paths and add src to path
+from _bootstrap import SYM_PATH
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel
 from gui.logging_tab import LoggingTab
 from canbus.interface_manager import CANInterfaceManager
-from utils.sym_parser import SymParser
+from utils.sym_parser import load_sym_file_cached
 
 
 class LoggingDemo(QMainWindow):
@@ -63,12 +62,9 @@ class LoggingDemo(QMainWindow):
         
     def load_sym_file(self):
         """Load the virtual CAN SYM file for tooltips"""
-        sym_path = os.path.join(os.path.dirname(__file__), 'sym', 'virtual_can_network.sym')
+        parser = load_sym_file_cached(SYM_PATH)
         
-        parser = SymParser()
-        success = parser.parse_file(sym_path)
-        
-        if success:
+        if parser:
             self.logging_tab.set_sym_parser(parser)
             print(f"✅ Loaded SYM file for hover tooltips")
         else:
@@ -5,16 +5,25 @@ Demonstrates the enhanced Monitor tab with decoded signals display
 """
 
 import sys
-import os
-import time
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Resolve example paths and add src to path
+from _bootstrap import SYM_PATH
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel
+from PyQt6.QtCore import QTimer
 from gui.monitor_tab import MonitorTab
 from canbus.interface_manager import CANInterfaceManager
-from utils.sym_parser import SymParser
+from utils.sym_parser import load_sym_file_cached
+
+# Demo frames with known values, encoded once at import time
+DEMO_FRAMES = (
+    # Engine data with specific values
+    (0x100, b'\x05\xDC\x32\x5A\x3C\x00\x00\x00'),  # RPM=1500, Load=50, Temp=90, Throttle=60
+    # Vehicle speed
+    (0x101, b'\x19\x64\x12\x34\x56\x78\x00\x00'),  # Speed=65.0 km/h, Odometer=2018915346
+    # Body control
+    (0x200, b'\x0F\x50\x03\x00\x00\x00\x00\x00'),  # All doors open, window 80%, lights on
+)
 
 
 class DemoWindow(QMainWindow):
@@ -50,12 +59,9 @@ class DemoWindow(QMainWindow):
         
     def load_sym_file(self):
         """Load the virtual CAN SYM file"""
-        sym_path = os.path.join(os.path.dirname(__file__), 'sym', 'virtual_can_network.sym')
-        
-        parser = SymParser()
-        success = parser.parse_file(sym_path)
+        parser = load_sym_file_cached(SYM_PATH)
         
-        if success:
+        if parser:
             self.monitor_tab.set_sym_parser(parser)
             print(f"✅ Loaded SYM file with {len(parser.messages)} message definitions")
         else:
@@ -80,24 +86,23 @@ class DemoWindow(QMainWindow):
             
     def inject_demo_messages(self):
         """Inject some demo messages to show decoding"""
+        # Paced by a timer so the GUI thread never blocks between frames
+        self.demo_frame_index = 0
+        self.inject_timer = QTimer(self)
+        self.inject_timer.timeout.connect(self.inject_next_demo_frame)
+        
         # Wait a moment for virtual messages to start
-        time.sleep(1)
+        QTimer.singleShot(1000, lambda: self.inject_timer.start(100))
         
-        # Inject some specific messages to demonstrate decoding
-        demo_messages = [
-            # Engine data with specific values
-            (0x100, b'\x05\xDC\x32\x5A\x3C\x00\x00\x00'),  # RPM=1500, Load=50, Temp=90, Throttle=60
-            # Vehicle speed
-            (0x101, b'\x19\x64\x12\x34\x56\x78\x00\x00'),  # Speed=65.0 km/h, Odometer=2018915346
-            # Body control
-            (0x200, b'\x0F\x50\x03\x00\x00\x00\x00\x00'),  # All doors open, window 80%, lights on
-        ]
+    def inject_next_demo_frame(self):
+        """Inject the next precomputed demo frame"""
+        msg_id, data = DEMO_FRAMES[self.demo_frame_index]
+        self.can_manager.inject_virtual_message(msg_id, data)
+        self.demo_frame_index += 1
         
-        for msg_id, data in demo_messages:
-            self.can_manager.inject_virtual_message(msg_id, data)
-            time.sleep(0.1)
-            
-        print("✅ Injected demo messages with known values")
+        if self.demo_frame_index == len(DEMO_FRAMES):
+            self.inject_timer.stop()
+            print("✅ Injected demo messages with known values")
 
 
 def main():
@@ -129,9 +134,9 @@ def main():
     print("   Close the window or press Ctrl+C to stop early")
     
     try:
-        # Run for 30 seconds
-        app.processEvents()
-        time.sleep(30)
+        # Run the event loop for 30 seconds so messages are drained as they arrive
+        QTimer.singleShot(30_000, app.quit)
+        app.exec()
         
     except KeyboardInterrupt:
         print("\n⏹️  Demo stopped by user")
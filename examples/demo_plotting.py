@@ -5,16 +5,15 @@ Demonstrates real-time signal plotting functionality
 """
 
 import sys
-import os
 import time
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Resolve example paths and add src to path
+from _bootstrap import SYM_PATH
 
 from PyQt6.QtWidgets import QApplication, QMainWindow, QVBoxLayout, QWidget, QLabel, QPushButton, QHBoxLayout
 from gui.plotting_tab import PlottingTab
 from canbus.interface_manager import CANInterfaceManager
-from utils.sym_parser import SymParser
+from utils.sym_parser import load_sym_file_cached
 
 
 class PlottingDemo(QMainWindow):
@@ -81,12 +80,9 @@ class PlottingDemo(QMainWindow):
         
     def load_sym_file(self):
         """Load the virtual CAN SYM file"""
-        sym_path = os.path.join(os.path.dirname(__file__), 'sym', 'virtual_can_network.sym')
+        parser = load_sym_file_cached(SYM_PATH)
         
-        parser = SymParser()
-        success = parser.parse_file(sym_path)
-        
-        if success:
+        if parser:
             self.plotting_tab.set_sym_parser(parser)
             print(f"✅ Loaded SYM file with {len(parser.messages)} messages for plotting")
         else:
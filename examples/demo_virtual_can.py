@@ -4,15 +4,84 @@ Virtual CAN Network Demo
 Demonstrates QCAN Explorer's virtual CAN network with symbolic decoding
 """
 
+import struct
 import sys
-import os
 import time
+from functools import lru_cache
+from typing import Dict, Optional
 
-# Add src to path
-sys.path.insert(0, os.path.join(os.path.dirname(__file__), '..', 'src'))
+# Resolve example paths and add src to path
+from _bootstrap import SYM_PATH
+
+from PyQt6.QtCore import QCoreApplication, QTimer
 
 from canbus.interface_manager import CANInterfaceManager
-from utils.sym_parser import SymParser
+from utils.sym_parser import load_sym_file_cached
+
+
+# struct codes for byte-aligned little-endian unsigned fields, by bit length
+_STRUCT_CODES = {8: 'B', 16: 'H', 32: 'I', 64: 'Q'}
+
+
+def _compile_struct(variables) -> Optional[struct.Struct]:
+    """Build a Struct reading every variable in one call, or None if any is not byte-aligned"""
+    fmt = '<'
+    position = 0
+    for var in variables:
+        code = _STRUCT_CODES.get(var.bit_length)
+        if code is None or var.start_bit % 8 or var.start_bit < position:
+            return None  # Sub-byte, odd-sized, overlapping or out-of-order field
+            
+        fmt += 'x' * ((var.start_bit - position) // 8) + code
+        position = var.start_bit + var.bit_length
+    return struct.Struct(fmt)
+
+
+@lru_cache(maxsize=4)
+def build_decode_table(parser) -> Dict[int, tuple]:
+    """Precompute per-message signal layouts once per SYM file
+    
+    Maps CAN ID -> (message name, layout, unpacker), where each layout row is
+    (name, unit suffix, shift, mask, end bit, factor, offset) and unpacker is a
+    Struct covering all rows when every field is byte-aligned.
+    """
+    table = {}
+    for can_id, msg_def in parser.messages_by_id.items():
+        layout = tuple(
+            (var.name, f" {var.unit}" if var.unit else "", var.start_bit,
+             (1 << var.bit_length) - 1, var.start_bit + var.bit_length, var.factor, var.offset)
+            for var in msg_def.variables
+        )
+        table[can_id] = (msg_def.name, layout, _compile_struct(msg_def.variables))
+    return table
+
+
+@lru_cache(maxsize=4096)
+def _decode_cached(parser, can_id: int, data: bytes) -> str:
+    """Decode one payload; repeated (message, payload) pairs hit the cache"""
+    # Find matching message definition
+    entry = build_decode_table(parser).get(can_id)
+    if entry is None:
+        return f"Unknown message ID: 0x{can_id:X}"
+        
+    msg_name, layout, unpacker = entry
+    lines = [f"📋 {msg_name} (0x{can_id:X}):"]
+    
+    if unpacker is not None and len(data) >= unpacker.size:
+        # Byte-aligned message: all fields in a single C-level unpack
+        lines.extend(f"  {name}: {raw * factor + offset:.2f}{unit}"
+                     for (name, unit, _, _, _, factor, offset), raw
+                     in zip(layout, unpacker.unpack_from(data)))
+        return "\n".join(lines) + "\n"
+    
+    # Convert the payload once, then extract each variable with a shift and mask
+    raw = int.from_bytes(data, byteorder='little')
+    total_bits = len(data) * 8
+    
+    lines.extend(f"  {name}: {((raw >> shift) & mask) * factor + offset:.2f}{unit}"
+                 for name, unit, shift, mask, end_bit, factor, offset in layout
+                 if end_bit <= total_bits)
+    return "\n".join(lines) + "\n"
 
 
 def decode_message_with_sym(parser, msg):
@@ -20,40 +89,8 @@ def decode_message_with_sym(parser, msg):
     if not parser or not parser.messages:
         return "No SYM file loaded"
     
-    # Find matching message definition
-    for msg_name, msg_def in parser.messages.items():
-        if msg_def.can_id == msg.arbitration_id:
-            decoded = f"📋 {msg_name} (0x{msg.arbitration_id:X}):\n"
-            
-            # Decode each variable
-            for var in msg_def.variables:
-                if var.start_bit + var.bit_length <= len(msg.data) * 8:
-                    # Extract bits (simplified - assumes byte-aligned)
-                    start_byte = var.start_bit // 8
-                    end_byte = (var.start_bit + var.bit_length - 1) // 8 + 1
-                    
-                    if end_byte <= len(msg.data):
-                        # Extract raw value
-                        raw_bytes = msg.data[start_byte:end_byte]
-                        raw_value = int.from_bytes(raw_bytes, byteorder='little')
-                        
-                        # Apply bit masking for partial bytes
-                        if var.start_bit % 8 != 0 or var.bit_length % 8 != 0:
-                            # Simplified bit extraction
-                            bit_offset = var.start_bit % 8
-                            mask = (1 << var.bit_length) - 1
-                            raw_value = (raw_value >> bit_offset) & mask
-                        
-                        # Apply scaling
-                        scaled_value = raw_value * var.factor + var.offset
-                        
-                        # Format output
-                        unit_str = f" {var.unit}" if var.unit else ""
-                        decoded += f"  {var.name}: {scaled_value:.2f}{unit_str}\n"
-            
-            return decoded
-    
-    return f"Unknown message ID: 0x{msg.arbitration_id:X}"
+    # Keyed on the parser object itself so a reloaded SYM file never reuses stale text
+    return _decode_cached(parser, msg.arbitration_id, bytes(msg.data))
 
 
 def main():
@@ -61,16 +98,17 @@ def main():
     print("🚀 QCAN Explorer Virtual CAN Network Demo")
     print("=" * 50)
     
+    # Received frames are delivered by a Qt timer, so the demo needs an event loop
+    app = QCoreApplication(sys.argv)
+    
     # Create interface manager
     manager = CANInterfaceManager()
     
     # Load SYM file
     print("📁 Loading SYM file...")
-    parser = SymParser()
-    sym_path = os.path.join(os.path.dirname(__file__), 'sym', 'virtual_can_network.sym')
-    sym_success = parser.parse_file(sym_path)
+    parser = load_sym_file_cached(SYM_PATH)
     
-    if sym_success:
+    if parser:
         print(f"✅ Loaded {len(parser.messages)} message definitions")
         print(f"   Title: {parser.title}")
     else:
@@ -90,26 +128,31 @@ def main():
     
     # Message counter for demo
     message_count = 0
-    last_message_time = time.time()
+    next_print_time = time.monotonic() + 2.0
     
-    # Set up message callback
-    def on_message_received(msg):
-        nonlocal message_count, last_message_time
-        message_count += 1
+    # Set up message callback, called once per drained batch
+    def on_messages_received(batch):
+        nonlocal message_count, next_print_time
+        message_count += len(batch)
         
-        # Only show messages every 2 seconds to avoid spam
-        if time.time() - last_message_time >= 2.0:
-            print(f"\n📨 Message #{message_count}:")
-            print(f"   Raw: ID=0x{msg.arbitration_id:X}, Data={msg.data.hex()}")
-            
-            # Decode with SYM file
-            decoded = decode_message_with_sym(parser, msg)
-            print(decoded)
+        # Only show a message every 2 seconds to avoid spam; other frames are
+        # only counted, never decoded or formatted
+        now = time.monotonic()
+        if now < next_print_time:
+            return
             
-            last_message_time = time.time()
+        msg = batch[-1]
+        print(f"\n📨 Message #{message_count}:")
+        print(f"   Raw: ID=0x{msg.arbitration_id:X}, Data={msg.data.hex()}")
+        
+        # Decode with SYM file
+        decoded = decode_message_with_sym(parser, msg)
+        print(decoded)
+        
+        next_print_time = now + 2.0
     
     # Connect the callback
-    manager.message_received.connect(on_message_received)
+    manager.messages_received_batch.connect(on_messages_received)
     
     print("\n🎯 Demo running... (Press Ctrl+C to stop)")
     print("   - Virtual CAN messages are being generated")
@@ -118,7 +161,8 @@ def main():
     
     try:
         # Run for 30 seconds
-        time.sleep(30)
+        QTimer.singleShot(30_000, app.quit)
+        app.exec()
         
     except KeyboardInterrupt:
         print("\n⏹️  Demo stopped by user")
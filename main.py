@@ -4,9 +4,11 @@ QCAN Explorer - Modern CAN Network Analysis Tool
 Main application entry point
 """
 
+import gc
 import sys
 import os
 import platform
+from functools import lru_cache
 from PyQt6.QtWidgets import QApplication, QStyleFactory
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QIcon, QPalette, QColor
@@ -19,6 +21,32 @@ if src_path not in sys.path:
 from gui.main_window import MainWindow
 
 
+# Dark theme colors, applied in order by setup_application_style
+_PALETTE_SPEC = (
+    (QPalette.ColorRole.Window, QColor(53, 53, 53)),
+    (QPalette.ColorRole.WindowText, QColor(Qt.GlobalColor.white)),
+    (QPalette.ColorRole.Base, QColor(25, 25, 25)),
+    (QPalette.ColorRole.AlternateBase, QColor(53, 53, 53)),
+    # Fix tooltip colors to ensure visibility
+    (QPalette.ColorRole.ToolTipBase, QColor(255, 255, 204)),  # Light yellow background
+    (QPalette.ColorRole.ToolTipText, QColor(Qt.GlobalColor.black)),  # Black text
+    (QPalette.ColorRole.Text, QColor(Qt.GlobalColor.white)),
+    (QPalette.ColorRole.Button, QColor(53, 53, 53)),
+    (QPalette.ColorRole.ButtonText, QColor(Qt.GlobalColor.white)),
+    (QPalette.ColorRole.BrightText, QColor(Qt.GlobalColor.red)),
+    (QPalette.ColorRole.Link, QColor(42, 130, 218)),
+    (QPalette.ColorRole.Highlight, QColor(42, 130, 218)),
+    (QPalette.ColorRole.HighlightedText, QColor(Qt.GlobalColor.black)),
+)
+
+# Young-generation GC threshold: every received frame allocates a CANMessage, so
+# the default (700) runs a collection every few milliseconds on a busy bus
+_GC_GEN0_THRESHOLD = 10000
+
+# Set once the macOS bundle name has been patched in this process
+_mac_bundle_configured = False
+
+
 def setup_application_style(app):
     """Set up the application's visual style"""
     # Use Fusion style for a modern look
@@ -26,23 +54,38 @@ def setup_application_style(app):
     
     # Set up dark theme
     palette = QPalette()
-    palette.setColor(QPalette.ColorRole.Window, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.WindowText, Qt.GlobalColor.white)
-    palette.setColor(QPalette.ColorRole.Base, QColor(25, 25, 25))
-    palette.setColor(QPalette.ColorRole.AlternateBase, QColor(53, 53, 53))
-    # Fix tooltip colors to ensure visibility
-    palette.setColor(QPalette.ColorRole.ToolTipBase, QColor(255, 255, 204))  # Light yellow background
-    palette.setColor(QPalette.ColorRole.ToolTipText, Qt.GlobalColor.black)   # Black text
-    palette.setColor(QPalette.ColorRole.Text, Qt.GlobalColor.white)
-    palette.setColor(QPalette.ColorRole.Button, QColor(53, 53, 53))
-    palette.setColor(QPalette.ColorRole.ButtonText, Qt.GlobalColor.white)
-    palette.setColor(QPalette.ColorRole.BrightText, Qt.GlobalColor.red)
-    palette.setColor(QPalette.ColorRole.Link, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.Highlight, QColor(42, 130, 218))
-    palette.setColor(QPalette.ColorRole.HighlightedText, Qt.GlobalColor.black)
+    for role, color in _PALETTE_SPEC:
+        palette.setColor(role, color)
     app.setPalette(palette)
 
 
+@lru_cache(maxsize=1)
+def load_app_icon() -> QIcon:
+    """Load the application icon once per process"""
+    return QIcon("logo.png")
+
+
+def configure_mac_bundle():
+    """Ensure the app name appears correctly in the macOS menu bar"""
+    global _mac_bundle_configured
+    if _mac_bundle_configured:
+        return
+    _mac_bundle_configured = True
+    
+    try:
+        import objc
+        from Foundation import NSBundle
+        bundle = NSBundle.mainBundle()
+        if bundle:
+            info = bundle.localizedInfoDictionary() or bundle.infoDictionary()
+            if info:
+                info['CFBundleName'] = 'QCAN Explorer'
+                info['CFBundleDisplayName'] = 'QCAN Explorer'
+    except ImportError:
+        # objc not available, use alternative approach
+        pass
+
+
 def main():
     """Main application entry point"""
     # Create QApplication instance
@@ -55,7 +98,7 @@ def main():
     
     # Set application icon
     try:
-        app_icon = QIcon("logo.png")
+        app_icon = load_app_icon()
         if not app_icon.isNull():
             app.setWindowIcon(app_icon)
     except Exception as e:
@@ -65,19 +108,7 @@ def main():
     if platform.system() == "Darwin":
         # Set the application bundle identifier for macOS
         app.setProperty("com.qcan.explorer.bundle", "com.qcan.explorer")
-        # Ensure the app name appears correctly in the menu bar
-        try:
-            import objc
-            from Foundation import NSBundle
-            bundle = NSBundle.mainBundle()
-            if bundle:
-                info = bundle.localizedInfoDictionary() or bundle.infoDictionary()
-                if info:
-                    info['CFBundleName'] = 'QCAN Explorer'
-                    info['CFBundleDisplayName'] = 'QCAN Explorer'
-        except ImportError:
-            # objc not available, use alternative approach
-            pass
+        configure_mac_bundle()
     
     # Set up application style
     setup_application_style(app)
@@ -86,6 +117,12 @@ def main():
     main_window = MainWindow()
     main_window.show()
     
+    # The window and its models live for the whole session: move them out of the
+    # collector's reach, and collect per-frame garbage in larger, rarer passes
+    gc.collect()
+    gc.freeze()
+    gc.set_threshold(_GC_GEN0_THRESHOLD, *gc.get_threshold()[1:])
+    
     # Start the application event loop
     sys.exit(app.exec())
 
@@ -3,134 +3,283 @@ Hardware Discovery System
 Automatically discovers and enumerates available CAN hardware interfaces
 """
 
+import importlib
+import os
 import platform
 import subprocess
 import re
-from typing import List, Dict, Set
-from pathlib import Path
+import time
+from collections import defaultdict
+from contextlib import suppress
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+from types import ModuleType
+from typing import Callable, Iterator, List, Dict, Optional, Set, Tuple
 
 from .network import HardwareInterface
 
+# python-can is needed for vendor probes and bus tests; discovery still lists
+# virtual and SocketCAN interfaces without it
+try:
+    import can
+except ImportError:
+    can = None
+
+# Failures a driver probe is expected to raise when hardware or drivers are
+# missing (python-can's Kvaser backend raises NameError without canlib);
+# anything else is a bug and is allowed to surface
+_PROBE_ERRORS = (OSError, ImportError, NameError) + ((can.CanError,) if can is not None else ())
+
+# Optional netlink access for SocketCAN discovery; falls back to the ip command
+try:
+    from pyroute2 import IPRoute, NetlinkError
+except ImportError:
+    IPRoute = None
+    NetlinkError = None
+
+_NETLINK_ERRORS = _PROBE_ERRORS + ((NetlinkError,) if NetlinkError is not None else ())
+
+# Link type of CAN network interfaces (ARPHRD_CAN)
+ARPHRD_CAN = 280
+
+# Kernel name prefixes of CAN netdevs (can, vcan, vxcan, slcan drivers)
+_CAN_NAME_PREFIXES = ('can', 'vcan', 'vxcan', 'slcan')
+
+# Header line of `ip link show`, e.g. "2: can0: <NOARP,UP,LOWER_UP> mtu 16 ..."
+_IP_LINK_RE = re.compile(r'^\d+:\s+(?P<name>[^:@\s]+)(?:@\S+)?:\s+<(?P<flags>[^>]*)>', re.MULTILINE)
+
+# (channel, name, description) of virtual0 through virtual3, formatted once
+_VIRTUAL_INTERFACE_FIELDS = tuple(
+    (f'virtual{i}', f'Virtual CAN {i}', f'Virtual CAN interface for testing and simulation (Channel {i})')
+    for i in range(4)
+)
+
+# Vendor backend modules by name; None records an import that failed, so
+# later refreshes skip both the import and the driver probe
+_VENDOR_MODULES: Dict[str, Optional[ModuleType]] = {}
+
+
+def _load_vendor_module(name: str) -> Optional[ModuleType]:
+    """Import a python-can vendor backend once and remember the outcome"""
+    if name in _VENDOR_MODULES:
+        return _VENDOR_MODULES[name]
+        
+    try:
+        module = importlib.import_module(name)
+    except ImportError:
+        module = None
+    _VENDOR_MODULES[name] = module
+    return module
+
 
 class HardwareDiscovery:
     """Discovers available CAN hardware interfaces"""
     
+    # Seconds a discovery result is reused before the probes run again
+    CACHE_TTL = 30.0
+    
+    # Seconds a deep capability test result is reused
+    CAPABILITY_TTL = 60.0
+    
     def __init__(self):
         self.system = platform.system().lower()
         self.discovered_interfaces: List[HardwareInterface] = []
+        self._cache_ts: Optional[float] = None
+        
+        # Lookup indexes rebuilt after each discovery
+        self._by_type: Dict[str, List[HardwareInterface]] = {}
+        self._available: List[HardwareInterface] = []
+        
+        # (interface type, channel) -> (test time, passed) for deep capability queries
+        self._cap_cache: Dict[Tuple[str, str], Tuple[float, bool]] = {}
+        
+        # Physical probes that can find anything on this platform, chosen once
+        self._discovery_methods = self._select_discovery_methods()
+        
+    def _select_discovery_methods(self) -> List[Tuple[str, Callable]]:
+        """Pick the vendor probes with drivers for the current platform"""
+        socketcan = ('SocketCAN', self._discover_socketcan_interfaces)
+        pcan = ('PCAN', self._discover_pcan_interfaces)
+        vector = ('Vector', self._discover_vector_interfaces)
+        kvaser = ('Kvaser', self._discover_kvaser_interfaces)
         
-    def discover_interfaces(self) -> List[HardwareInterface]:
-        """Discover all available CAN hardware interfaces"""
+        if self.system == 'linux':
+            return [socketcan, pcan, kvaser]  # Vector XL has no Linux driver
+        if self.system == 'windows':
+            return [pcan, vector, kvaser]  # No SocketCAN outside Linux
+        if self.system == 'darwin':
+            return [pcan]  # PCBUSB is the only supported macOS driver
+        return [socketcan, pcan, vector, kvaser]
+        
+    def discover_interfaces(self, force: bool = False) -> List[HardwareInterface]:
+        """Discover all available CAN hardware interfaces, reusing a recent result unless forced"""
+        if (not force and self._cache_ts is not None
+                and time.monotonic() - self._cache_ts < self.CACHE_TTL):
+            return self.discovered_interfaces
+            
         # Use the safer discovery method by default
-        return self.discover_interfaces_safe()
+        interfaces = self.discover_interfaces_safe()
+        self._cache_ts = time.monotonic()
+        return interfaces
+        
+    def invalidate_cache(self):
+        """Force the next discovery to probe the hardware again"""
+        self._cache_ts = None
         
     def _discover_virtual_interfaces(self) -> List[HardwareInterface]:
         """Discover virtual CAN interfaces"""
+        # Fresh objects each time: the manager flips `available` on connect, so
+        # instances must not be shared between discoveries
+        return [HardwareInterface('virtual', channel, name, description, True)
+                for channel, name, description in _VIRTUAL_INTERFACE_FIELDS]
+        
+    @staticmethod
+    def _expired(deadline: Optional[float]) -> bool:
+        """Whether a probe's wall-clock budget is used up"""
+        return deadline is not None and time.monotonic() >= deadline
+        
+    def _discover_socketcan_interfaces(self, deadline: Optional[float] = None) -> List[HardwareInterface]:
+        """Discover SocketCAN interfaces (Linux)"""
         interfaces = []
+        seen = set()  # Channel names already reported, for O(1) dedupe
         
-        # Create multiple virtual interfaces for testing
-        for i in range(4):  # virtual0 through virtual3
+        # Query the kernel over netlink when possible, otherwise parse ip's output
+        links = self._netlink_can_links()
+        if links is None:
+            links = [] if self._expired(deadline) else self._ip_command_can_links()
+            
+        for interface_name, state in links:
+            if interface_name in seen:
+                continue
+                
+            if state == 'UP':
+                description = f'SocketCAN interface {interface_name} (Active)'
+            elif state == 'DOWN':
+                description = f'SocketCAN interface {interface_name} (Down)'
+            else:
+                description = f'SocketCAN interface {interface_name} (Unknown state)'
+                
             interface = HardwareInterface(
-                interface_type='virtual',
-                channel=f'virtual{i}',
-                name=f'Virtual CAN {i}',
-                description=f'Virtual CAN interface for testing and simulation (Channel {i})',
+                interface_type='socketcan',
+                channel=interface_name,
+                name=f'SocketCAN {interface_name}',
+                description=description,
                 available=True
             )
             interfaces.append(interface)
+            seen.add(interface_name)
+            
+        # Also check /sys/class/net for CAN interfaces. Attributes are opened
+        # relative to directory fds, so the kernel resolves only the last path
+        # component instead of walking from / for every file
+        if os.open not in os.supports_dir_fd:
+            return interfaces  # No openat(); no sysfs on this platform either
+            
+        try:
+            net_fd = os.open('/sys/class/net', os.O_RDONLY | os.O_DIRECTORY)
+        except OSError:
+            # Filesystem access failed (no sysfs on this platform)
+            return interfaces
+            
+        try:
+            for interface_name in os.listdir(net_fd):
+                if self._expired(deadline):
+                    break
+                    
+                # Skip interfaces we already found, and names no CAN driver
+                # uses, before touching sysfs
+                if interface_name in seen or not interface_name.startswith(_CAN_NAME_PREFIXES):
+                    continue
+                    
+                try:
+                    iface_fd = os.open(interface_name, os.O_RDONLY | os.O_DIRECTORY, dir_fd=net_fd)
+                except OSError:
+                    continue
+                    
+                try:
+                    # CAN interfaces have type 280 (ARPHRD_CAN)
+                    if self._read_sysfs_attr(iface_fd, 'type') != b'280':
+                        continue
+                        
+                    # Check if interface is up
+                    operstate = self._read_sysfs_attr(iface_fd, 'operstate')
+                finally:
+                    os.close(iface_fd)
+                    
+                if operstate is not None:
+                    operstate = operstate.decode('ascii', 'replace')
+                    available = operstate in ['up', 'down', 'unknown']
+                    description = f'SocketCAN interface {interface_name} (State: {operstate})'
+                else:
+                    available = True
+                    description = f'SocketCAN interface {interface_name} (Hardware detected)'
+                    
+                interface = HardwareInterface(
+                    interface_type='socketcan',
+                    channel=interface_name,
+                    name=f'SocketCAN {interface_name}',
+                    description=description,
+                    available=available
+                )
+                interfaces.append(interface)
+                seen.add(interface_name)
+                
+        except OSError:
+            # Directory listing failed
+            pass
+        finally:
+            os.close(net_fd)
             
         return interfaces
         
-    def _discover_socketcan_interfaces(self) -> List[HardwareInterface]:
-        """Discover SocketCAN interfaces (Linux)"""
-        interfaces = []
+    @staticmethod
+    def _read_sysfs_attr(dir_fd: int, name: str, size: int = 32) -> Optional[bytes]:
+        """Read a short sysfs attribute relative to a directory fd, or None if missing"""
+        try:
+            fd = os.open(name, os.O_RDONLY, dir_fd=dir_fd)
+        except OSError:
+            return None
+        try:
+            return os.read(fd, size).strip()
+        except OSError:
+            return None
+        finally:
+            os.close(fd)
+            
+    def _netlink_can_links(self) -> Optional[List[Tuple[str, str]]]:
+        """List (name, operstate) of CAN links with one RTM_GETLINK dump, or None if unavailable"""
+        if IPRoute is None:
+            return None
+            
+        try:
+            with IPRoute() as ipr:
+                return [(link.get_attr('IFLA_IFNAME'), link.get_attr('IFLA_OPERSTATE') or 'UNKNOWN')
+                        for link in ipr.get_links() if link.get('ifi_type') == ARPHRD_CAN]
+        except _NETLINK_ERRORS:
+            # Netlink not supported on this platform
+            return None
+            
+    def _ip_command_can_links(self) -> List[Tuple[str, str]]:
+        """List (name, state) of CAN links by parsing `ip link show type can`"""
+        links = []
         
         try:
             # Check for CAN network interfaces using ip command
             result = subprocess.run(['ip', 'link', 'show', 'type', 'can'], 
                                   capture_output=True, text=True, timeout=5)
             
-            if result.returncode == 0 and result.stdout.strip():
-                # Parse output for CAN interfaces
-                # Format: "2: can0: <NOARP,UP,LOWER_UP> mtu 16 qdisc pfifo_fast state UP mode DEFAULT group default qlen 10"
-                lines = result.stdout.strip().split('\n')
-                for line in lines:
-                    if ':' in line and 'can' in line:
-                        parts = line.split(':')
-                        if len(parts) >= 2:
-                            interface_name = parts[1].strip().split()[0]
-                            
-                            # Get interface state
-                            if 'UP' in line:
-                                state = 'UP'
-                                available = True
-                                description = f'SocketCAN interface {interface_name} (Active)'
-                            elif 'DOWN' in line:
-                                state = 'DOWN'
-                                available = True
-                                description = f'SocketCAN interface {interface_name} (Down)'
-                            else:
-                                state = 'UNKNOWN'
-                                available = True
-                                description = f'SocketCAN interface {interface_name} (Unknown state)'
-                            
-                            interface = HardwareInterface(
-                                interface_type='socketcan',
-                                channel=interface_name,
-                                name=f'SocketCAN {interface_name}',
-                                description=description,
-                                available=available
-                            )
-                            interfaces.append(interface)
-                            
+            if result.returncode == 0:
+                # One pass over the header lines; the admin UP flag is matched
+                # exactly, so LOWER_UP alone no longer reads as 'UP'
+                for match in _IP_LINK_RE.finditer(result.stdout):
+                    flags = match.group('flags').split(',')
+                    state = 'UP' if 'UP' in flags else 'DOWN'
+                    links.append((match.group('name'), state))
+                    
         except (subprocess.TimeoutExpired, subprocess.SubprocessError, FileNotFoundError):
             # SocketCAN tools not available or command failed
             pass
             
-        # Also check /sys/class/net for CAN interfaces
-        try:
-            net_path = Path('/sys/class/net')
-            if net_path.exists():
-                for interface_dir in net_path.iterdir():
-                    if interface_dir.is_dir():
-                        type_file = interface_dir / 'type'
-                        if type_file.exists():
-                            try:
-                                # CAN interfaces have type 280 (ARPHRD_CAN)
-                                with open(type_file, 'r') as f:
-                                    if f.read().strip() == '280':
-                                        interface_name = interface_dir.name
-                                        
-                                        # Check if we already found this interface
-                                        if not any(iface.channel == interface_name for iface in interfaces):
-                                            # Check if interface is up
-                                            operstate_file = interface_dir / 'operstate'
-                                            if operstate_file.exists():
-                                                with open(operstate_file, 'r') as f:
-                                                    operstate = f.read().strip()
-                                                    available = operstate in ['up', 'down', 'unknown']
-                                                    description = f'SocketCAN interface {interface_name} (State: {operstate})'
-                                            else:
-                                                available = True
-                                                description = f'SocketCAN interface {interface_name} (Hardware detected)'
-                                            
-                                            interface = HardwareInterface(
-                                                interface_type='socketcan',
-                                                channel=interface_name,
-                                                name=f'SocketCAN {interface_name}',
-                                                description=description,
-                                                available=available
-                                            )
-                                            interfaces.append(interface)
-                                            
-                            except (IOError, ValueError):
-                                continue
-                                
-        except Exception:
-            # Filesystem access failed
-            pass
-            
-        return interfaces
+        return links
         
     def _discover_windows_interfaces(self) -> List[HardwareInterface]:
         """Discover CAN interfaces on Windows"""
@@ -150,247 +299,281 @@ class HardwareDiscovery:
         
         return interfaces
         
-    def _discover_pcan_interfaces(self) -> List[HardwareInterface]:
+    def _enumerate_vendor_channels(self, interface_type: str) -> List[Dict]:
+        """List attached channels with the vendor driver's own enumeration call
+        
+        python-can wraps PCAN_ATTACHED_CHANNELS, xlGetDriverConfig and
+        canGetNumberOfChannels here, so no bus is opened (or reset) per channel.
+        """
+        if can is None or _load_vendor_module(f'can.interfaces.{interface_type}') is None:
+            return []
+            
+        # Vendor library or driver not available
+        with suppress(*_PROBE_ERRORS):
+            return can.detect_available_configs(interfaces=[interface_type])
+        return []
+            
+    def _pcan_attached_channels(self) -> Optional[List[Dict]]:
+        """Read every attached PCAN channel with one PCAN_ATTACHED_CHANNELS call
+        
+        Returns None when the driver does not support the query (e.g. macOS),
+        so the caller can fall back to python-can's own detection.
+        """
+        pcan = _load_vendor_module('can.interfaces.pcan.basic')
+        if pcan is None:
+            return None
+            
+        try:
+            status, channel_info = pcan.PCANBasic().GetValue(pcan.PCAN_NONEBUS, pcan.PCAN_ATTACHED_CHANNELS)
+            if status != pcan.PCAN_ERROR_OK:
+                return None
+                
+            # Handle value -> channel name, built once per query instead of per channel
+            names = {handle.value: name for name, handle in pcan.PCAN_CHANNEL_NAMES.items()}
+            return [
+                {
+                    'channel': names[info.channel_handle],
+                    'device_name': info.device_name.decode('latin-1'),
+                    'channel_condition': info.channel_condition,
+                }
+                for info in channel_info if info.channel_handle in names
+            ]
+            
+        except _PROBE_ERRORS:
+            # PCAN driver not installed
+            return None
+            
+    def _discover_pcan_interfaces(self, deadline: Optional[float] = None) -> List[HardwareInterface]:
         """Discover PEAK PCAN interfaces"""
         interfaces = []
         
-        try:
-            # Try to import PCAN library
-            import can.interfaces.pcan
+        configs = self._pcan_attached_channels()
+        if configs is None:
+            configs = [] if self._expired(deadline) else self._enumerate_vendor_channels('pcan')
             
-            # Try to import the PCAN API directly for hardware detection
-            try:
-                from can.interfaces.pcan.pcan import PcanBus
-                import can.interfaces.pcan.pcan as pcan_module
-                
-                # PCAN channel definitions
-                pcan_channels = [
-                    ('PCAN_USBBUS1', 0x51, 'PEAK USB CAN 1'),
-                    ('PCAN_USBBUS2', 0x52, 'PEAK USB CAN 2'),
-                    ('PCAN_USBBUS3', 0x53, 'PEAK USB CAN 3'),
-                    ('PCAN_USBBUS4', 0x54, 'PEAK USB CAN 4'),
-                    ('PCAN_USBBUS5', 0x55, 'PEAK USB CAN 5'),
-                    ('PCAN_USBBUS6', 0x56, 'PEAK USB CAN 6'),
-                    ('PCAN_USBBUS7', 0x57, 'PEAK USB CAN 7'),
-                    ('PCAN_USBBUS8', 0x58, 'PEAK USB CAN 8'),
-                    ('PCAN_PCIBUS1', 0x41, 'PEAK PCI CAN 1'),
-                    ('PCAN_PCIBUS2', 0x42, 'PEAK PCI CAN 2'),
-                    ('PCAN_ISABUS1', 0x21, 'PEAK ISA CAN 1'),
-                    ('PCAN_ISABUS2', 0x22, 'PEAK ISA CAN 2'),
-                ]
+        for config in configs:
+            channel_name = str(config.get('channel', config.get('name', '')))
+            if not channel_name:
+                continue
                 
-                # Try to detect actual PCAN hardware
-                for channel_name, channel_id, display_name in pcan_channels:
-                    try:
-                        # Try to get channel status - this will fail if hardware not present
-                        # We'll create a temporary bus instance to test availability
-                        test_bus = can.Bus(channel=channel_name, bustype='pcan', bitrate=500000)
-                        test_bus.shutdown()
-                        
-                        # If we get here, the interface exists
-                        interface = HardwareInterface(
-                            interface_type='pcan',
-                            channel=channel_name,
-                            name=display_name,
-                            description=f'PEAK CAN interface {channel_name} (Hardware detected)',
-                            available=True
-                        )
-                        interfaces.append(interface)
-                        
-                    except Exception:
-                        # Hardware not available for this channel
-                        continue
-                        
-            except ImportError:
-                # PCAN API not fully available, fall back to basic detection
-                pass
+            # PCAN_USBBUS1 -> PEAK USB CAN 1
+            match = re.match(r'PCAN_([A-Z]+)BUS(\d+)$', channel_name)
+            display_name = (f'PEAK {match.group(1)} CAN {match.group(2)}' if match
+                            else config.get('device_name') or channel_name)
+            
+            # An occupied channel is attached but already opened by another application
+            condition = config.get('channel_condition')
+            if condition is not None and not condition & 0x01:  # PCAN_CHANNEL_AVAILABLE
+                available = False
+                description = f'PEAK CAN interface {channel_name} (In use by another application)'
+            else:
+                available = True
+                description = f'PEAK CAN interface {channel_name} (Hardware detected)'
                 
-        except ImportError:
-            # PCAN library not available at all
-            pass
+            interface = HardwareInterface(
+                interface_type='pcan',
+                channel=channel_name,
+                name=display_name,
+                description=description,
+                available=available
+            )
+            interfaces.append(interface)
             
         return interfaces
         
-    def _discover_vector_interfaces(self) -> List[HardwareInterface]:
+    def _discover_vector_interfaces(self, deadline: Optional[float] = None) -> List[HardwareInterface]:
         """Discover Vector CAN interfaces"""
         interfaces = []
-        
-        try:
-            # Try to import Vector library
-            import can.interfaces.vector
+        if self._expired(deadline):
+            return interfaces
             
-            # Try to detect actual Vector hardware
-            try:
-                from can.interfaces.vector.vector import VectorBus
-                
-                # Vector hardware detection is more complex
-                # We'll try to enumerate available channels
-                for channel in range(8):  # Check up to 8 channels
-                    try:
-                        # Try to create a bus instance to test if hardware exists
-                        test_bus = can.Bus(channel=channel, bustype='vector', bitrate=500000)
-                        test_bus.shutdown()
-                        
-                        # If successful, hardware exists
-                        interface = HardwareInterface(
-                            interface_type='vector',
-                            channel=str(channel),
-                            name=f'Vector CAN {channel + 1}',
-                            description=f'Vector CAN interface (Channel {channel}, Hardware detected)',
-                            available=True
-                        )
-                        interfaces.append(interface)
-                        
-                    except Exception:
-                        # Hardware not available for this channel
-                        continue
-                        
-            except ImportError:
-                # Vector API not fully available
-                pass
+        for config in self._enumerate_vendor_channels('vector'):
+            channel = config.get('channel')
+            if channel is None:
+                continue
                 
-        except ImportError:
-            # Vector library not available at all
-            pass
+            interface = HardwareInterface(
+                interface_type='vector',
+                channel=str(channel),
+                name=f'Vector CAN {int(channel) + 1}',
+                description=f'Vector CAN interface (Channel {channel}, Hardware detected)',
+                available=True
+            )
+            interfaces.append(interface)
             
         return interfaces
         
-    def _discover_kvaser_interfaces(self) -> List[HardwareInterface]:
+    def _discover_kvaser_interfaces(self, deadline: Optional[float] = None) -> List[HardwareInterface]:
         """Discover Kvaser CAN interfaces"""
         interfaces = []
-        
-        try:
-            # Try to import Kvaser library
-            import can.interfaces.kvaser
+        if self._expired(deadline):
+            return interfaces
             
-            # Try to detect actual Kvaser hardware
-            try:
-                from can.interfaces.kvaser.kvaser import KvaserBus
-                
-                # Kvaser hardware detection
-                for channel in range(8):  # Check up to 8 channels
-                    try:
-                        # Try to create a bus instance to test if hardware exists
-                        test_bus = can.Bus(channel=channel, bustype='kvaser', bitrate=500000)
-                        test_bus.shutdown()
-                        
-                        # If successful, hardware exists
-                        interface = HardwareInterface(
-                            interface_type='kvaser',
-                            channel=str(channel),
-                            name=f'Kvaser CAN {channel + 1}',
-                            description=f'Kvaser CAN interface (Channel {channel}, Hardware detected)',
-                            available=True
-                        )
-                        interfaces.append(interface)
-                        
-                    except Exception:
-                        # Hardware not available for this channel
-                        continue
-                        
-            except ImportError:
-                # Kvaser API not fully available
-                pass
+        for config in self._enumerate_vendor_channels('kvaser'):
+            channel = config.get('channel')
+            if channel is None:
+                continue
                 
-        except ImportError:
-            # Kvaser library not available at all
-            pass
+            interface = HardwareInterface(
+                interface_type='kvaser',
+                channel=str(channel),
+                name=f'Kvaser CAN {int(channel) + 1}',
+                description=f'Kvaser CAN interface (Channel {channel}, Hardware detected)',
+                available=True
+            )
+            interfaces.append(interface)
             
         return interfaces
         
+    def _index_interfaces(self, interfaces: List[HardwareInterface]):
+        """Store a discovery result and rebuild the type and availability indexes"""
+        # One entry per (type, channel), keeping the first probe that reported it
+        unique: Dict[Tuple[str, str], HardwareInterface] = {}
+        for iface in interfaces:
+            unique.setdefault((iface.interface_type, iface.channel), iface)
+        interfaces = list(unique.values())
+        
+        by_type = defaultdict(list)
+        for iface in interfaces:
+            by_type[iface.interface_type].append(iface)
+            
+        self.discovered_interfaces = interfaces
+        self._by_type = dict(by_type)
+        self._available = [iface for iface in interfaces if iface.available]
+        
     def get_interfaces_by_type(self, interface_type: str) -> List[HardwareInterface]:
-        """Get interfaces of a specific type"""
-        return [iface for iface in self.discovered_interfaces 
-                if iface.interface_type == interface_type]
+        """Get interfaces of a specific type (shared list, treat as read-only)"""
+        return self._by_type.get(interface_type, [])
                 
     def get_available_interfaces(self) -> List[HardwareInterface]:
-        """Get only available interfaces"""
-        return [iface for iface in self.discovered_interfaces if iface.available]
+        """Get only available interfaces (shared list, treat as read-only)"""
+        return self._available
         
-    def refresh_discovery(self) -> List[HardwareInterface]:
+    def refresh_discovery(self, force: bool = True) -> List[HardwareInterface]:
         """Refresh hardware discovery"""
-        return self.discover_interfaces()
+        return self.discover_interfaces(force=force)
         
     def test_interface_availability(self, interface: HardwareInterface) -> bool:
         """Test if a specific interface is actually available"""
-        try:
-            # For virtual interfaces, always return True
-            if interface.interface_type == 'virtual':
-                return True
-                
-            # For physical interfaces, attempt a quick connection test
-            import can
+        # For virtual interfaces, always return True
+        if interface.interface_type == 'virtual':
+            return True
             
-            # Try to create a bus instance with a short timeout
-            bus_config = {
-                'channel': interface.channel,
-                'bustype': interface.interface_type,
-                'bitrate': 500000  # Standard test bitrate
-            }
+        # For physical interfaces, attempt a quick connection test
+        if can is None:
+            return False
             
+        # Vendor drivers answer from their status/config tables, without
+        # initializing the controller or disturbing a live bus
+        if interface.interface_type == 'pcan':
+            return self._pcan_channel_available(interface.channel)
+        if interface.interface_type in ('vector', 'kvaser'):
+            return any(str(config.get('channel')) == interface.channel
+                       for config in self._enumerate_vendor_channels(interface.interface_type))
+            
+        # Try to create a bus instance with a short timeout
+        bus_config = {
+            'channel': interface.channel,
+            'bustype': interface.interface_type,
+            'bitrate': 500000  # Standard test bitrate
+        }
+        
+        # Hardware not available, driver not installed or channel rejected
+        with suppress(ValueError, *_PROBE_ERRORS):
             # Create bus instance to test hardware availability
             test_bus = can.Bus(**bus_config)
             test_bus.shutdown()
             return True
+        return False
             
-        except Exception as e:
-            # Hardware not available or driver not installed
+    def _pcan_channel_available(self, channel_name: str) -> bool:
+        """Check a PCAN channel with a PCAN_CHANNEL_CONDITION status query"""
+        pcan = _load_vendor_module('can.interfaces.pcan.basic')
+        if pcan is None or channel_name not in pcan.PCAN_CHANNEL_NAMES:
             return False
             
-    def discover_interfaces_safe(self) -> List[HardwareInterface]:
-        """Safely discover interfaces with timeout protection"""
-        interfaces = []
-        
-        # Always add virtual interfaces first (these are always available)
-        interfaces.extend(self._discover_virtual_interfaces())
+        with suppress(*_PROBE_ERRORS):
+            status, condition = pcan.PCANBasic().GetValue(
+                pcan.PCAN_CHANNEL_NAMES[channel_name], pcan.PCAN_CHANNEL_CONDITION)
+            return status == pcan.PCAN_ERROR_OK and bool(condition & pcan.PCAN_CHANNEL_AVAILABLE)
+        return False
         
+    def discover_interfaces_iter(self) -> Iterator[HardwareInterface]:
+        """Yield interfaces as soon as each probe finishes (virtual ones immediately)"""
+        yield from self._discover_virtual_interfaces()
+        for _, discovered in self._iter_probe_results():
+            yield from discovered
+            
+    def _iter_probe_results(self) -> Iterator[Tuple[int, List[HardwareInterface]]]:
+        """Run the physical probes concurrently, yielding (probe index, result) in completion order"""
         # Discover physical interfaces with timeout protection
-        discovery_methods = [
-            ('SocketCAN', self._discover_socketcan_interfaces),
-            ('PCAN', self._discover_pcan_interfaces),
-            ('Vector', self._discover_vector_interfaces),
-            ('Kvaser', self._discover_kvaser_interfaces),
-        ]
-        
-        for method_name, method in discovery_methods:
-            try:
-                # Run discovery method with timeout protection
-                import signal
-                
-                def timeout_handler(signum, frame):
-                    raise TimeoutError(f"{method_name} discovery timed out")
-                
-                # Set timeout (only on Unix systems)
-                if hasattr(signal, 'SIGALRM'):
-                    old_handler = signal.signal(signal.SIGALRM, timeout_handler)
-                    signal.alarm(5)  # 5 second timeout
-                
-                discovered = method()
-                interfaces.extend(discovered)
+        discovery_methods = self._discovery_methods
+        
+        # Probes block on subprocess/driver I/O, so run them side by side; unlike
+        # SIGALRM this is safe off the main thread and bounds the total wait.
+        # Each probe also gets the deadline and skips remaining steps once past it
+        deadline = time.monotonic() + 5.0  # 5 second timeout
+        executor = ThreadPoolExecutor(max_workers=len(discovery_methods),
+                                      thread_name_prefix='can-discovery')
+        futures = {executor.submit(method, deadline): (index, method_name)
+                   for index, (method_name, method) in enumerate(discovery_methods)}
+        
+        try:
+            for future in as_completed(futures, timeout=max(0.0, deadline - time.monotonic())):
+                index, method_name = futures[future]
+                try:
+                    discovered = future.result()
+                except _PROBE_ERRORS as e:
+                    # Discovery method failed; other exceptions are bugs and propagate
+                    print(f"Warning: {method_name} discovery failed: {e}")
+                    continue
+                yield index, discovered
                 
-                # Clear timeout
-                if hasattr(signal, 'SIGALRM'):
-                    signal.alarm(0)
-                    signal.signal(signal.SIGALRM, old_handler)
+        except FutureTimeoutError:
+            for future, (_, method_name) in futures.items():
+                if not future.done():
+                    print(f"Warning: {method_name} discovery failed: timed out")
                     
-            except (TimeoutError, Exception) as e:
-                # Discovery method failed or timed out
-                print(f"Warning: {method_name} discovery failed: {e}")
-                continue
-                
-        self.discovered_interfaces = interfaces
-        return interfaces
+        finally:
+            # Don't wait for a hung probe; its thread finishes in the background
+            executor.shutdown(wait=False)
             
-    def get_interface_capabilities(self, interface: HardwareInterface) -> Set[str]:
-        """Get detailed capabilities for an interface"""
-        capabilities = set(interface.capabilities)
+    def discover_interfaces_safe(self) -> List[HardwareInterface]:
+        """Safely discover interfaces with timeout protection"""
+        # Always add virtual interfaces first (these are always available)
+        interfaces = self._discover_virtual_interfaces()
+        
+        # Probes finish in any order; slot results by probe so the list stays stable
+        results: List[List[HardwareInterface]] = [[] for _ in self._discovery_methods]
+        for index, discovered in self._iter_probe_results():
+            results[index] = discovered
+        for discovered in results:
+            interfaces.extend(discovered)
+            
+        self._index_interfaces(interfaces)
+        return self.discovered_interfaces
+        
+    def get_interface_capabilities(self, interface: HardwareInterface, deep: bool = False) -> Set[str]:
+        """Get detailed capabilities for an interface
         
+        Only a deep query opens the bus to test it (which can disturb live traffic);
+        those results are reused for CAPABILITY_TTL seconds per interface.
+        """
+        capabilities = set(interface.capabilities)
+        if not deep:
+            return capabilities
+            
         # Add dynamic capabilities based on testing or detection
-        if self.test_interface_availability(interface):
-            capabilities.add('tested_available')
+        key = (interface.interface_type, interface.channel)
+        cached = self._cap_cache.get(key)
+        now = time.monotonic()
+        if cached is not None and now - cached[0] < self.CAPABILITY_TTL:
+            tested_ok = cached[1]
         else:
-            capabilities.add('test_failed')
+            tested_ok = self.test_interface_availability(interface)
+            self._cap_cache[key] = (now, tested_ok)
             
+        capabilities.add('tested_available' if tested_ok else 'test_failed')
         return capabilities
         
     def get_recommended_interfaces(self) -> List[HardwareInterface]:
@@ -404,10 +587,10 @@ class HardwareDiscovery:
             
         # Recommend first available physical interface of each type
         for interface_type in ['pcan', 'vector', 'kvaser', 'socketcan']:
-            interfaces = self.get_interfaces_by_type(interface_type)
-            available = [iface for iface in interfaces if iface.available]
-            if available:
-                recommended.append(available[0])
+            available = next((iface for iface in self.get_interfaces_by_type(interface_type)
+                              if iface.available), None)
+            if available is not None:
+                recommended.append(available)
                 
         return recommended
         
@@ -419,17 +602,12 @@ class HardwareDiscovery:
             'discovery_time': None,  # Would be set to current time
             'total_interfaces': len(self.discovered_interfaces),
             'available_interfaces': len(self.get_available_interfaces()),
-            'interfaces_by_type': {},
+            # Counts come straight from the per-type index (same first-seen order)
+            'interfaces_by_type': {iface_type: len(ifaces) for iface_type, ifaces in self._by_type.items()},
             'interfaces': []
         }
         
-        # Group by type
-        for interface in self.discovered_interfaces:
-            if interface.interface_type not in report['interfaces_by_type']:
-                report['interfaces_by_type'][interface.interface_type] = 0
-            report['interfaces_by_type'][interface.interface_type] += 1
-            
-        # Add interface details
+        # Add interface details in a single pass
         for interface in self.discovered_interfaces:
             interface_data = {
                 'type': interface.interface_type,
@@ -6,124 +6,238 @@ Use MultiNetworkManager for new development.
 Legacy module kept for backward compatibility only.
 """
 
+import heapq
+import importlib.util
+import itertools
 import threading
 import time
-from typing import Dict, List, Optional, Callable
+import warnings
+from collections import deque
+from contextlib import suppress
+from functools import lru_cache
+from queue import Queue, Empty, Full
+from typing import Dict, List, Optional, Callable, Tuple
 from dataclasses import dataclass
-from queue import Queue, Empty
 
 import can
-from can import Message, Listener
+from can import Message
+from can.broadcastmanager import CyclicSendTaskABC, RestartableCyclicTaskABC
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 from .messages import CANMessage
 from .virtual_can import VirtualCANNetwork, VirtualCANBus
 
 
-class MessageListener(Listener):
-    """Custom CAN message listener"""
+# Channel label for frames whose bus does not report one
+_UNKNOWN_CHANNEL = 'unknown'
+
+# Failures opening a bus when hardware or drivers are missing (python-can's
+# Kvaser backend raises NameError without canlib); anything else is a bug
+_BUS_OPEN_ERRORS = (can.CanError, OSError, NameError)
+
+
+def to_can_message(msg: Message) -> CANMessage:
+    """Convert a python-can Message to a received CANMessage"""
+    return CANMessage.from_can_msg(msg, 'rx', default_channel=_UNKNOWN_CHANNEL)
+
+
+@lru_cache(maxsize=1)
+def _available_interface_types() -> Tuple[str, ...]:
+    """Interface types whose python-can backend is installed, checked once
+    
+    find_spec locates each backend without executing it, so no vendor
+    driver library is loaded just to fill an interface list.
+    """
+    # Always add virtual for testing (first in list)
+    interfaces = ['virtual']
+    
+    # Check for common interface types
+    for interface_type in ('socketcan', 'pcan', 'vector', 'kvaser'):
+        try:
+            if importlib.util.find_spec(f'can.interfaces.{interface_type}') is not None:
+                interfaces.append(interface_type)
+        except ImportError:
+            pass
+            
+    return tuple(interfaces)
+
+
+class InterfaceStats:
+    """Interface counters; slotted attributes avoid a string-keyed dict lookup per frame"""
     
-    def __init__(self, callback: Callable[[CANMessage], None]):
-        self.callback = callback
+    __slots__ = ('tx_count', 'rx_count', 'error_count', 'tx_dropped', 'start_time')
+    
+    def __init__(self):
+        self.reset(None)
         
-    def on_message_received(self, msg: Message):
-        """Handle received CAN message"""
-        can_msg = CANMessage(
-            timestamp=msg.timestamp,
-            arbitration_id=msg.arbitration_id,
-            data=msg.data,
-            is_extended_id=msg.is_extended_id,
-            is_remote_frame=msg.is_remote_frame,
-            is_error_frame=msg.is_error_frame,
-            channel=getattr(msg, 'channel', 'unknown'),
-            direction='rx'
-        )
-        self.callback(can_msg)
+    def reset(self, start_time: Optional[float]):
+        """Zero all counters and set the connection start time"""
+        self.tx_count = 0
+        self.rx_count = 0
+        self.error_count = 0
+        self.tx_dropped = 0  # Frames refused because the TX queue was full
+        self.start_time = start_time
+        
+    @property
+    def message_count(self) -> int:
+        """Total frames in both directions, derived instead of counted per frame"""
+        return self.rx_count + self.tx_count
+        
+    def as_dict(self) -> Dict:
+        """Counters in the dict form returned by get_statistics"""
+        stats = {name: getattr(self, name) for name in self.__slots__}
+        stats['message_count'] = self.message_count
+        return stats
+
+
+class PeriodicTask:
+    """A message sent periodically, by the bus's cyclic sender or from the timer heap"""
+    
+    __slots__ = ('msg_id', 'data', 'period_ms', 'is_extended', 'enabled', 'removed', 'last_sent', 'cyclic')
+    
+    def __init__(self, msg_id: int, data: bytes, period_ms: int, is_extended: bool):
+        self.msg_id = msg_id
+        self.data = bytes(data)
+        self.period_ms = period_ms
+        self.is_extended = is_extended
+        self.enabled = True
+        self.removed = False  # Lazily dropped when it reaches the top of the heap
+        self.last_sent = 0  # time.monotonic_ns() of the last send
+        self.cyclic: Optional[CyclicSendTaskABC] = None  # Backend task, when the bus runs it
 
 
 class CANInterfaceManager(QObject):
     """Manages CAN interface connections and message handling"""
     
     # Signals
-    message_received = pyqtSignal(object)  # CANMessage
+    message_received = pyqtSignal(object)  # CANMessage (only with emit_per_message)
+    messages_received_batch = pyqtSignal(list)  # List[CANMessage], once per drain
     message_transmitted = pyqtSignal(object)  # CANMessage
     error_occurred = pyqtSignal(str)
     connection_changed = pyqtSignal(bool)
     
+    # Emitted by the TX worker after bus.send succeeds or fails; queued onto the GUI thread
+    _tx_sent = pyqtSignal(object)  # CANMessage
+    _tx_failed = pyqtSignal(str)  # error message
+    
+    # RX ring shared by the notifier thread (append only) and the GUI thread
+    # (popleft only); deque append/popleft are atomic, so no lock is needed
+    RX_RING_SIZE = 16384
+    RX_DRAIN_INTERVAL_MS = 20
+    RX_DRAIN_BATCH = 500
+    
+    # Bounded TX queue drained by a worker thread; send_message only enqueues
+    TX_QUEUE_SIZE = 256
+    TX_BATCH_SIZE = 32       # Frames sent back to back per worker wakeup
+    TX_SEND_TIMEOUT = 0.1    # Seconds a backend may block waiting for TX buffer space
+    
+    # python-can bustype for each supported hardware interface type
+    _BUS_TYPES = {
+        'socketcan': 'socketcan',
+        'pcan': 'pcan',
+        'vector': 'vector',
+        'kvaser': 'kvaser',
+    }
+    
+    # Set after the first instance has issued the deprecation warning
+    _deprecation_warned = False
+    
     def __init__(self):
         super().__init__()
+        if not CANInterfaceManager._deprecation_warned:
+            CANInterfaceManager._deprecation_warned = True
+            warnings.warn("CANInterfaceManager is deprecated; use MultiNetworkManager",
+                          DeprecationWarning, stacklevel=2)
+            
         self.bus: Optional[can.Bus] = None
         self.notifier: Optional[can.Notifier] = None
-        self.listener: Optional[MessageListener] = None
+        self.listener: Optional[Callable[[Message], None]] = None
         self.is_connected_flag = False
         
         # Virtual CAN support
         self.virtual_network: Optional[VirtualCANNetwork] = None
         self.is_virtual = False
         
+        # Channel label stamped on transmitted frames, read once per bus
+        self._channel_info = _UNKNOWN_CHANNEL
+        
         # Statistics
-        self.stats = {
-            'message_count': 0,
-            'tx_count': 0,
-            'rx_count': 0,
-            'error_count': 0,
-            'start_time': None
-        }
-        
-        # Message queues for different purposes
-        self.message_queue = Queue()
-        self.periodic_tasks = []
-        
-        # Timer for periodic message sending
+        self.stats = InterfaceStats()
+        
+        # Fixed-capacity RX ring; when full, appending drops the oldest message
+        # so a burst costs bounded memory instead of growing without limit
+        self.message_queue = deque(maxlen=self.RX_RING_SIZE)
+        
+        # Periodic tasks, plus a min-heap of (next due time in monotonic ns, sequence, task)
+        # so a timer tick only touches the tasks that are actually due
+        self._pt_tasks: List[PeriodicTask] = []
+        self._pt_heap: List[tuple] = []
+        self._pt_seq = itertools.count()
+        
+        # Single-shot timer armed for the earliest due task
         self.periodic_timer = QTimer()
+        self.periodic_timer.setSingleShot(True)
         self.periodic_timer.timeout.connect(self._send_periodic_messages)
         
+        # TX worker state (recreated per connection)
+        self.tx_queue: Queue = Queue(maxsize=self.TX_QUEUE_SIZE)
+        self.tx_thread: Optional[threading.Thread] = None
+        self._tx_stop = threading.Event()
+        self.tx_batch_delay = 0.0  # Optional pause between TX batches, in seconds
+        self._tx_sent.connect(self._on_tx_sent)
+        self._tx_failed.connect(self._on_tx_failed)
+        
+        # Timer draining message_queue on the GUI thread
+        self.rx_timer = QTimer()
+        self.rx_timer.timeout.connect(self._drain_rx_queue)
+        # Received frames are delivered in batches; the per-message signal is
+        # only emitted for consumers that opt in
+        self.emit_per_message = False
+        
     def connect(self, interface_type: str, channel: str, bitrate: int = 500000) -> bool:
-        """Connect to CAN interface"""
-        try:
-            # Disconnect if already connected
-            if self.is_connected_flag:
-                self.disconnect()
-                
-            # Handle virtual CAN network
-            if interface_type.lower() == 'virtual':
-                return self._connect_virtual(channel, bitrate)
-                
-            # Create bus instance based on interface type
-            if interface_type.lower() == 'socketcan':
-                self.bus = can.interface.Bus(channel=channel, bustype='socketcan', bitrate=bitrate)
-            elif interface_type.lower() == 'pcan':
-                self.bus = can.interface.Bus(channel=channel, bustype='pcan', bitrate=bitrate)
-            elif interface_type.lower() == 'vector':
-                self.bus = can.interface.Bus(channel=channel, bustype='vector', bitrate=bitrate)
-            elif interface_type.lower() == 'kvaser':
-                self.bus = can.interface.Bus(channel=channel, bustype='kvaser', bitrate=bitrate)
-            else:
-                # Try to create a virtual bus for testing
-                self.bus = can.interface.Bus(channel=channel, bustype='virtual', bitrate=bitrate)
-                
-            # Set up message listener
-            self.listener = MessageListener(self._on_message_received)
-            self.notifier = can.Notifier(self.bus, [self.listener])
+        """Connect to CAN interface
+        
+        Raises ValueError for an unsupported interface type; a bus that fails to
+        open is reported through error_occurred and returns False.
+        """
+        interface_type = interface_type.lower()
+        if interface_type != 'virtual' and interface_type not in self._BUS_TYPES:
+            raise ValueError(f"Unsupported interface type: {interface_type}")
             
-            # Update connection state
-            self.is_connected_flag = True
-            self.is_virtual = False
-            self.stats['start_time'] = time.time()
-            self.stats['message_count'] = 0
-            self.stats['tx_count'] = 0
-            self.stats['rx_count'] = 0
-            self.stats['error_count'] = 0
+        # Disconnect if already connected
+        if self.is_connected_flag:
+            self.disconnect()
             
-            # Start periodic message timer
-            self.periodic_timer.start(100)  # Check every 100ms
+        # Handle virtual CAN network
+        if interface_type == 'virtual':
+            return self._connect_virtual(channel, bitrate)
             
-            self.connection_changed.emit(True)
-            return True
-            
-        except Exception as e:
+        # Create bus instance based on interface type
+        try:
+            self.bus = can.interface.Bus(channel=channel, bustype=self._BUS_TYPES[interface_type],
+                                         bitrate=bitrate)
+        except _BUS_OPEN_ERRORS as e:
             self.error_occurred.emit(f"Failed to connect: {str(e)}")
             return False
+        self._channel_info = getattr(self.bus, 'channel_info', _UNKNOWN_CHANNEL)
+        
+        # The notifier thread appends raw Messages straight onto the RX ring (a
+        # C-level call, no Python frame); conversion happens when the GUI drains it
+        self.listener = self.message_queue.append
+        self.notifier = can.Notifier(self.bus, [self.listener])
+        
+        # Update connection state
+        self.is_connected_flag = True
+        self.is_virtual = False
+        self.stats.reset(time.time())
+        
+        # Start TX worker, periodic message and RX drain timers
+        self._start_tx_worker()
+        self._arm_periodic_timer()
+        self.rx_timer.start(self.RX_DRAIN_INTERVAL_MS)
+        
+        self.connection_changed.emit(True)
+        return True
             
     def _connect_virtual(self, channel: str, bitrate: int) -> bool:
         """Connect to virtual CAN network"""
@@ -134,21 +248,20 @@ class CANInterfaceManager(QObject):
             # Create virtual bus
             self.bus = VirtualCANBus(channel=channel)
             self.bus.set_virtual_network(self.virtual_network)
+            self._channel_info = getattr(self.bus, 'channel_info', _UNKNOWN_CHANNEL)
             
             # Update connection state
             self.is_connected_flag = True
             self.is_virtual = True
-            self.stats['start_time'] = time.time()
-            self.stats['message_count'] = 0
-            self.stats['tx_count'] = 0
-            self.stats['rx_count'] = 0
-            self.stats['error_count'] = 0
+            self.stats.reset(time.time())
             
             # Start virtual network
             self.virtual_network.start()
             
-            # Start periodic message timer
-            self.periodic_timer.start(100)  # Check every 100ms
+            # Start TX worker, periodic message and RX drain timers
+            self._start_tx_worker()
+            self._arm_periodic_timer()
+            self.rx_timer.start(self.RX_DRAIN_INTERVAL_MS)
             
             self.connection_changed.emit(True)
             return True
@@ -160,8 +273,10 @@ class CANInterfaceManager(QObject):
     def disconnect(self):
         """Disconnect from CAN interface"""
         try:
-            # Stop periodic timer
+            # Stop periodic sending and the TX worker (queued frames are discarded)
             self.periodic_timer.stop()
+            self._clear_periodic_tasks()
+            self._stop_tx_worker()
             
             # Stop virtual network if active
             if self.virtual_network:
@@ -173,17 +288,18 @@ class CANInterfaceManager(QObject):
                 self.notifier.stop()
                 self.notifier = None
                 
-            # Clean up listener
+            # Clean up listener and deliver anything still queued
             self.listener = None
+            self.rx_timer.stop()
+            while self.message_queue:
+                self._drain_rx_queue()
             
             # Close bus
             if self.bus:
                 self.bus.shutdown()
                 self.bus = None
+                self._channel_info = _UNKNOWN_CHANNEL
                 
-            # Clear periodic tasks
-            self.periodic_tasks.clear()
-            
             self.is_connected_flag = False
             self.is_virtual = False
             self.connection_changed.emit(False)
@@ -196,69 +312,201 @@ class CANInterfaceManager(QObject):
         return self.is_connected_flag
         
     def send_message(self, msg_id: int, data: bytes, is_extended: bool = False) -> bool:
-        """Send a single CAN message"""
+        """Queue a single CAN message for transmission
+        
+        Returns True once the frame is queued for the TX worker, not when it is on
+        the wire; False if not connected or the queue is full (counted in tx_dropped).
+        tx_count and message_transmitted follow only once the worker has sent it.
+        """
         if not self.is_connected_flag or not self.bus:
             self.error_occurred.emit("Not connected to CAN interface")
             return False
             
         try:
-            msg = Message(
-                arbitration_id=msg_id,
-                data=data,
-                is_extended_id=is_extended
-            )
-            
-            self.bus.send(msg)
-            
-            # Create CANMessage for tracking
-            can_msg = CANMessage(
-                timestamp=time.time(),
-                arbitration_id=msg_id,
-                data=data,
-                is_extended_id=is_extended,
-                is_remote_frame=False,
-                is_error_frame=False,
-                channel=getattr(self.bus, 'channel_info', 'unknown'),
-                direction='tx'
-            )
-            
-            self.stats['tx_count'] += 1
-            self.stats['message_count'] += 1
-            self.message_transmitted.emit(can_msg)
+            # One CANMessage per send serves both the TX queue and the tracking signal;
+            # the worker turns it into a python-can Message
+            can_msg = CANMessage(time.time(), msg_id, data, is_extended, False, False,
+                                 self._channel_info, 'tx')
             
+            try:
+                self.tx_queue.put_nowait(can_msg)
+            except Full:
+                # Count drops instead of signalling an error for every frame of a burst
+                self.stats.tx_dropped += 1
+                return False
+                
             return True
             
         except Exception as e:
             self.error_occurred.emit(f"Failed to send message: {str(e)}")
-            self.stats['error_count'] += 1
+            self.stats.error_count += 1
             return False
             
+    def _start_tx_worker(self):
+        """Start a TX worker thread for the current bus"""
+        self.tx_queue = Queue(maxsize=self.TX_QUEUE_SIZE)
+        self._tx_stop = threading.Event()
+        
+        # python-can backends block up to the timeout for buffer space (SocketCAN
+        # waits on the socket instead of failing with ENOBUFS); the virtual bus takes no timeout
+        send_timeout = None if self.is_virtual else self.TX_SEND_TIMEOUT
+        self.tx_thread = threading.Thread(
+            target=self._tx_worker,
+            args=(self.bus, self.tx_queue, self._tx_stop, send_timeout),
+            name='can-tx', daemon=True
+        )
+        self.tx_thread.start()
+        
+    def _stop_tx_worker(self):
+        """Stop the TX worker and discard frames still queued"""
+        self._tx_stop.set()
+        if self.tx_thread is not None:
+            self.tx_thread.join(timeout=1.0)
+            self.tx_thread = None
+            
+        with suppress(Empty):
+            while True:
+                self.tx_queue.get_nowait()
+                
+    def _tx_worker(self, bus, tx_queue: Queue, stop: threading.Event, send_timeout: Optional[float]):
+        """Send queued frames, coalescing whatever is waiting into back-to-back batches"""
+        # python-can backends serialize the frame inside send() and keep no reference,
+        # so one Message is refilled for every frame; the virtual bus hands messages to
+        # its listeners, so it gets a fresh one each time
+        scratch = Message() if send_timeout is not None else None
+        
+        while not stop.is_set():
+            try:
+                batch = [tx_queue.get(timeout=0.1)]
+            except Empty:
+                continue
+                
+            with suppress(Empty):
+                while len(batch) < self.TX_BATCH_SIZE:
+                    batch.append(tx_queue.get_nowait())
+                    
+            for frame in batch:
+                try:
+                    if scratch is None:
+                        bus.send(Message(arbitration_id=frame.arbitration_id, data=frame.data,
+                                         is_extended_id=frame.is_extended_id))
+                    else:
+                        scratch.arbitration_id = frame.arbitration_id
+                        scratch.is_extended_id = frame.is_extended_id
+                        scratch.data = frame.data
+                        scratch.dlc = len(frame.data)
+                        bus.send(scratch, timeout=send_timeout)
+                except (can.CanError, OSError, ValueError) as e:
+                    self._tx_failed.emit(f"Failed to send message: {str(e)}")
+                else:
+                    self._tx_sent.emit(frame)
+                    
+            if self.tx_batch_delay:
+                time.sleep(self.tx_batch_delay)
+                
+    def _on_tx_sent(self, can_msg: CANMessage):
+        """Count a frame the TX worker put on the bus and report it as transmitted"""
+        self.stats.tx_count += 1
+        self.message_transmitted.emit(can_msg)
+        
+    def _on_tx_failed(self, error: str):
+        """Count a frame the TX worker failed to send and report the error"""
+        self.stats.error_count += 1
+        self.error_occurred.emit(error)
+        
     def add_periodic_message(self, msg_id: int, data: bytes, period_ms: int, is_extended: bool = False):
         """Add a message to be sent periodically"""
-        task = {
-            'id': msg_id,
-            'data': data,
-            'period_ms': period_ms,
-            'is_extended': is_extended,
-            'last_sent': 0,
-            'enabled': True
-        }
-        self.periodic_tasks.append(task)
+        task = PeriodicTask(msg_id, data, period_ms, is_extended)
+        self._pt_tasks.append(task)
+        self._schedule_periodic_task(task)
+        
+    def _schedule_periodic_task(self, task: PeriodicTask):
+        """Start a task on the bus's cyclic sender, falling back to the timer heap"""
+        if self._start_cyclic_task(task):
+            return
+            
+        # First send is due immediately
+        heapq.heappush(self._pt_heap, (time.monotonic_ns(), next(self._pt_seq), task))
+        self._arm_periodic_timer()
+        
+    def _start_cyclic_task(self, task: PeriodicTask) -> bool:
+        """Let the bus transmit the task itself; False if it has to use the timer heap
+        
+        python-can buses send cyclic frames in the backend (the kernel broadcast
+        manager on SocketCAN) without waking this process. Those frames bypass
+        send_message, so they are not counted in tx_count or emitted as transmitted.
+        """
+        if self.bus is None or self.is_virtual:
+            return False
+            
+        msg = Message(arbitration_id=task.msg_id, data=task.data, is_extended_id=task.is_extended)
+        try:
+            task.cyclic = self.bus.send_periodic(msg, max(task.period_ms, 1) / 1000.0, store_task=False)
+        except (can.CanError, NotImplementedError, OSError) as e:
+            print(f"Warning: cyclic send unavailable on this bus, using timer: {e}")
+            return False
+        return True
         
     def remove_periodic_message(self, msg_id: int):
         """Remove a periodic message"""
-        self.periodic_tasks = [task for task in self.periodic_tasks if task['id'] != msg_id]
+        for task in self._pt_tasks:
+            if task.msg_id == msg_id:
+                task.removed = True
+                self._stop_cyclic_task(task)
+        self._pt_tasks = [task for task in self._pt_tasks if not task.removed]
         
     def set_periodic_message_enabled(self, msg_id: int, enabled: bool):
         """Enable/disable a periodic message"""
-        for task in self.periodic_tasks:
-            if task['id'] == msg_id:
-                task['enabled'] = enabled
+        for task in self._pt_tasks:
+            if task.msg_id == msg_id:
+                task.enabled = enabled
+                cyclic = task.cyclic
+                if cyclic is None:
+                    break
+                    
+                # Backend tasks are paused and resumed rather than skipped per tick
+                if not enabled:
+                    cyclic.stop()
+                elif isinstance(cyclic, RestartableCyclicTaskABC):
+                    cyclic.start()
+                else:
+                    task.cyclic = None
+                    self._schedule_periodic_task(task)
                 break
                 
+    def _stop_cyclic_task(self, task: PeriodicTask):
+        """Stop a task's backend cyclic sender, if it has one"""
+        if task.cyclic is not None:
+            with suppress(can.CanError, OSError):
+                task.cyclic.stop()
+            task.cyclic = None
+            
+    def _clear_periodic_tasks(self):
+        """Remove all periodic messages"""
+        for task in self._pt_tasks:
+            task.removed = True
+            self._stop_cyclic_task(task)
+        self._pt_tasks.clear()
+        self._pt_heap.clear()
+        
+    @property
+    def periodic_tasks(self) -> List[Dict]:
+        """Snapshot of the periodic tasks in the legacy list-of-dicts form"""
+        return [
+            {
+                'id': task.msg_id,
+                'data': task.data,
+                'period_ms': task.period_ms,
+                'is_extended': task.is_extended,
+                'last_sent': task.last_sent,
+                'enabled': task.enabled
+            }
+            for task in self._pt_tasks
+        ]
+        
     def get_statistics(self) -> Dict:
         """Get interface statistics"""
-        stats = self.stats.copy()
+        stats = self.stats.as_dict()
         if stats['start_time']:
             stats['uptime'] = time.time() - stats['start_time']
         else:
@@ -267,62 +515,74 @@ class CANInterfaceManager(QObject):
         
     def _on_message_received(self, msg: CANMessage):
         """Handle received CAN message"""
-        self.stats['rx_count'] += 1
-        self.stats['message_count'] += 1
-        self.message_received.emit(msg)
+        self.message_queue.append(msg)
         
     def _on_virtual_message_received(self, msg: CANMessage):
-        """Handle virtual CAN message"""
-        self.stats['rx_count'] += 1
-        self.stats['message_count'] += 1
-        # Use QueuedConnection to ensure thread-safe signal emission
-        self.message_received.emit(msg)
+        """Handle virtual CAN message (called on the virtual network thread)"""
+        self.message_queue.append(msg)
+        
+    def _drain_rx_queue(self, max_messages: Optional[int] = None):
+        """Convert queued frames and deliver them with one batch signal"""
+        queue = self.message_queue
+        count = min(len(queue), max_messages or self.RX_DRAIN_BATCH)
+        if not count:
+            return
+            
+        # The queue holds raw python-can Messages and ready CANMessages (virtual)
+        batch = []
+        for _ in range(count):
+            item = queue.popleft()
+            batch.append(item if isinstance(item, CANMessage) else to_can_message(item))
+            
+        self.stats.rx_count += count
+        self.messages_received_batch.emit(batch)
         
+        # Per-message signal kept for slots that opted in; these emits are same-thread
+        if self.emit_per_message:
+            for msg in batch:
+                self.message_received.emit(msg)
+                
     def _send_periodic_messages(self):
         """Send periodic messages that are due"""
-        current_time = time.time() * 1000  # Convert to milliseconds
+        # Integer nanoseconds: exact arithmetic, so due times never drift over long sessions
+        now = time.monotonic_ns()
+        heap = self._pt_heap
         
-        for task in self.periodic_tasks:
-            if not task['enabled']:
+        while heap and heap[0][0] <= now:
+            due, _, task = heapq.heappop(heap)
+            if task.removed:
                 continue
                 
-            if current_time - task['last_sent'] >= task['period_ms']:
-                self.send_message(task['id'], task['data'], task['is_extended'])
-                task['last_sent'] = current_time
+            if task.enabled:
+                self.send_message(task.msg_id, task.data, task.is_extended)
+                task.last_sent = now
                 
-    def get_available_interfaces(self) -> List[str]:
-        """Get list of available CAN interfaces"""
-        interfaces = []
-        
-        # Always add virtual for testing (first in list)
-        interfaces.append('virtual')
-        
-        # Check for common interface types
-        try:
-            import can.interfaces.socketcan
-            interfaces.append('socketcan')
-        except ImportError:
-            pass
+            # Keep the original cadence; after a stall skip ahead instead of bursting
+            period = max(task.period_ms, 1) * 1_000_000
+            next_due = due + period
+            if next_due <= now:
+                next_due = now + period
+            heapq.heappush(heap, (next_due, next(self._pt_seq), task))
             
-        try:
-            import can.interfaces.pcan
-            interfaces.append('pcan')
-        except ImportError:
-            pass
+        self._arm_periodic_timer()
+        
+    def _arm_periodic_timer(self):
+        """Start the single-shot timer for the earliest due task"""
+        # Drop removed tasks sitting at the top so they don't cause empty wakeups
+        heap = self._pt_heap
+        while heap and heap[0][2].removed:
+            heapq.heappop(heap)
             
-        try:
-            import can.interfaces.vector
-            interfaces.append('vector')
-        except ImportError:
-            pass
+        if not self.is_connected_flag or not heap:
+            self.periodic_timer.stop()
+            return
             
-        try:
-            import can.interfaces.kvaser
-            interfaces.append('kvaser')
-        except ImportError:
-            pass
+        delay_ms = max(0, -((time.monotonic_ns() - heap[0][0]) // 1_000_000))  # Rounded up
+        self.periodic_timer.start(delay_ms)
         
-        return interfaces
+    def get_available_interfaces(self) -> List[str]:
+        """Get list of available CAN interfaces"""
+        return list(_available_interface_types())
         
     def get_virtual_network(self) -> Optional[VirtualCANNetwork]:
         """Get the virtual CAN network instance"""
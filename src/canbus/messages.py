@@ -2,12 +2,42 @@
 CAN Message Data Structures
 """
 
-from dataclasses import dataclass
+import sys
+from dataclasses import dataclass, field
+from typing import Dict, Optional
 
+import numpy as np
 
-@dataclass
+
+# Flag bits stored in the 'flags' field of CAN_FRAME_DTYPE
+FRAME_FLAG_EXTENDED = 0x01
+FRAME_FLAG_REMOTE = 0x02
+FRAME_FLAG_ERROR = 0x04
+
+# Compact structured layout for bulk frame storage (e.g. loaded trace files).
+# Only the first 8 data bytes are kept; 'dlc' holds the full payload length.
+CAN_FRAME_DTYPE = np.dtype([
+    ('timestamp', 'f8'),
+    ('arbitration_id', 'u4'),
+    ('bus_number', 'u2'),
+    ('dlc', 'u1'),
+    ('flags', 'u1'),
+    ('direction', 'u1'),  # 0 = rx, 1 = tx
+    ('data', 'u1', 8),
+])
+
+
+# Slotted dataclasses need Python 3.10+; older interpreters keep a per-instance __dict__
+_DATACLASS_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_DATACLASS_SLOTS)
 class CANMessage:
-    """CAN Message data structure"""
+    """CAN Message data structure
+    
+    `data` is the receiver's payload buffer forwarded as-is (bytes or the
+    bytearray python-can hands over), never copied on the receive path.
+    """
     timestamp: float
     arbitration_id: int
     data: bytes
@@ -17,3 +47,110 @@ class CANMessage:
     channel: str
     direction: str  # 'rx' or 'tx'
     bus_number: int = 0  # Bus number for multi-network identification
+    network_id: str = ''  # Originating network, so network signals carry the message alone
+    _data_hex: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    
+    @property
+    def data_hex(self) -> str:
+        """Payload as space-separated uppercase hex, formatted once per message"""
+        if self._data_hex is None:
+            self._data_hex = bytes(self.data).hex(' ').upper()
+        return self._data_hex
+        
+    @classmethod
+    def from_can_msg(cls, msg, direction: str = 'rx', bus_number: int = 0,
+                     default_channel: str = 'unknown', network_id: str = '') -> 'CANMessage':
+        """Build from a python-can Message on the receive hot path
+        
+        Fields are passed positionally, which roughly halves the generated
+        __init__ call cost compared with keyword arguments.
+        """
+        channel = msg.channel
+        return cls(msg.timestamp, msg.arbitration_id, msg.data, msg.is_extended_id,
+                   msg.is_remote_frame, msg.is_error_frame,
+                   default_channel if channel is None else channel, direction, bus_number, network_id)
+
+
+# Zero tuples that pad an n-byte payload out to the 8-byte 'data' field
+_PAYLOAD_PADDING = tuple((0,) * n for n in range(9))
+
+
+def store_frame(frames: np.ndarray, index: int, msg: CANMessage):
+    """Write a CANMessage into row `index` of a CAN_FRAME_DTYPE array"""
+    flags = ((FRAME_FLAG_EXTENDED if msg.is_extended_id else 0) |
+             (FRAME_FLAG_REMOTE if msg.is_remote_frame else 0) |
+             (FRAME_FLAG_ERROR if msg.is_error_frame else 0))
+    data = msg.data
+    length = len(data)
+    
+    # Unpack the payload straight into the tuple numpy wants; only short
+    # frames need padding and only CAN FD frames need slicing
+    if length == 8:
+        payload = tuple(data)
+    elif length < 8:
+        payload = tuple(data) + _PAYLOAD_PADDING[8 - length]
+    else:
+        payload = tuple(data[:8])
+        
+    # One whole-record assignment is several times cheaper than per-field writes
+    frames[index] = (msg.timestamp, msg.arbitration_id, msg.bus_number, length,
+                     flags, 1 if msg.direction == 'tx' else 0, payload)
+
+
+def load_frame(frames: np.ndarray, index: int, channel: str = '') -> CANMessage:
+    """Rebuild a CANMessage from row `index` of a CAN_FRAME_DTYPE array"""
+    frame = frames[index]
+    flags = int(frame['flags'])
+    return CANMessage(
+        timestamp=float(frame['timestamp']),
+        arbitration_id=int(frame['arbitration_id']),
+        data=frame['data'][:frame['dlc']].tobytes(),
+        is_extended_id=bool(flags & FRAME_FLAG_EXTENDED),
+        is_remote_frame=bool(flags & FRAME_FLAG_REMOTE),
+        is_error_frame=bool(flags & FRAME_FLAG_ERROR),
+        channel=channel,
+        direction='tx' if frame['direction'] else 'rx',
+        bus_number=int(frame['bus_number'])
+    )
+
+
+class FrameRing:
+    """Fixed-capacity ring holding the most recent frames in one CAN_FRAME_DTYPE array
+    
+    Frames come back from `get` without channel or network_id. CAN FD frames with
+    more than 8 data bytes do not fit a row, so the original message is kept for them.
+    """
+    
+    def __init__(self, capacity: int = 65536):
+        # Round up to a power of two so wrapping is a bit mask
+        capacity = 1 << max(capacity - 1, 0).bit_length()
+        self.frames = np.zeros(capacity, dtype=CAN_FRAME_DTYPE)
+        self.mask = capacity - 1
+        self.total = 0  # Frames appended since the last clear
+        self.long_frames: Dict[int, CANMessage] = {}  # Ring slot -> CAN FD message
+        
+    def __len__(self) -> int:
+        return min(self.total, len(self.frames))
+        
+    def append(self, msg: CANMessage):
+        """Store a message, overwriting the oldest frame once full"""
+        slot = self.total & self.mask
+        store_frame(self.frames, slot, msg)
+        if len(msg.data) > 8:
+            self.long_frames[slot] = msg
+        elif self.long_frames:
+            self.long_frames.pop(slot, None)
+        self.total += 1
+        
+    def get(self, index: int) -> Optional[CANMessage]:
+        """Return the message appended at `index`, or None if it has been overwritten"""
+        if not self.total - len(self) <= index < self.total:
+            return None
+        slot = index & self.mask
+        msg = self.long_frames.get(slot)
+        return msg if msg is not None else load_frame(self.frames, slot)
+        
+    def clear(self):
+        """Drop all frames without reallocating"""
+        self.total = 0
+        self.long_frames.clear()
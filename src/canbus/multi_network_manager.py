@@ -3,17 +3,67 @@ Multi-Network CAN Manager
 Manages multiple CAN networks and hardware interfaces simultaneously
 """
 
+import gzip
+import itertools
 import json
+import logging
+import os
+import shutil
+import threading
 import time
-from typing import Dict, List, Optional, Set
+import weakref
+import zlib
+from contextlib import contextmanager
+from types import MappingProxyType
+from typing import Dict, Iterator, List, Mapping, Optional, Set, Tuple
 from pathlib import Path
 
-from PyQt6.QtCore import QObject, pyqtSignal, QTimer
+from PyQt6.QtCore import QObject, Qt, pyqtSignal, pyqtSlot, QMetaObject, QThread, QTimer, QThreadPool
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    import pyudev
+except ImportError:
+    pyudev = None
 
 from .network import CANNetwork, NetworkConfiguration, HardwareInterface, ConnectionState
 from .hardware_discovery import HardwareDiscovery
 
 
+logger = logging.getLogger(__name__)
+
+# Hardware polling intervals: a slow safety net when hot-plug events are delivered
+DISCOVERY_POLL_MS = 10000
+DISCOVERY_HOTPLUG_POLL_MS = 60000
+HOTPLUG_DEBOUNCE_MS = 200
+
+# Compact profiles at least this large are gzipped on disk; smaller ones stay plain JSON
+PROFILE_GZIP_THRESHOLD = 64 * 1024
+_GZIP_MAGIC = b'\x1f\x8b'
+
+
+def _encode_configuration(configurations: Dict, indent: bool = False) -> bytes:
+    """Serialize configurations to UTF-8 JSON, compact unless indent is set, using orjson when installed"""
+    if orjson is not None:
+        return orjson.dumps(configurations, option=orjson.OPT_INDENT_2 if indent else None)
+    if indent:
+        return json.dumps(configurations, indent=2).encode('utf-8')
+    return json.dumps(configurations, separators=(',', ':')).encode('utf-8')
+
+
+def _decode_configuration(raw: bytes) -> Dict:
+    """Parse a profile file's bytes, gzipped or plain JSON"""
+    if raw[:2] == _GZIP_MAGIC:
+        raw = gzip.decompress(raw)
+    if orjson is not None:
+        return orjson.loads(raw)
+    return json.loads(raw)
+
+
 class MultiNetworkManager(QObject):
     """Manages multiple CAN networks and their connections"""
     
@@ -21,10 +71,15 @@ class MultiNetworkManager(QObject):
     network_added = pyqtSignal(str)  # network_id
     network_removed = pyqtSignal(str)  # network_id
     network_state_changed = pyqtSignal(str, object)  # network_id, ConnectionState
-    message_received = pyqtSignal(str, object)  # network_id, CANMessage
-    message_transmitted = pyqtSignal(str, object)  # network_id, CANMessage
+    message_received = pyqtSignal(str, object)  # network_id, CANMessage (only with emit_per_message)
+    messages_received = pyqtSignal(list)  # [(network_id, CANMessage), ...] at most every 10 ms
+    message_transmitted = pyqtSignal(str, object)  # network_id, CANMessage (only with emit_per_message)
+    messages_transmitted = pyqtSignal(list)  # [(network_id, CANMessage), ...] at most every 10 ms
+    messages_exchanged = pyqtSignal(list)  # Received and transmitted [(network_id, CANMessage), ...] in timestamp order
     error_occurred = pyqtSignal(str, str)  # network_id, error_message
     hardware_discovered = pyqtSignal(list)  # List[HardwareInterface]
+    _hotplug_event = pyqtSignal()  # emitted from the udev observer thread
+    _discovery_done = pyqtSignal(object, bool)  # interfaces (None on failure), force; from a pool worker
     
     def __init__(self):
         super().__init__()
@@ -34,6 +89,25 @@ class MultiNetworkManager(QObject):
         self.hardware_interfaces: Dict[str, HardwareInterface] = {}
         self.hardware_discovery = HardwareDiscovery()
         
+        # Read-only views handed to the GUI's polling timers instead of fresh copies
+        self._networks_view = MappingProxyType(self.networks)
+        self._hardware_tuple: Optional[Tuple[HardwareInterface, ...]] = None  # Rebuilt after discovery
+        
+        # Discovery probes drivers with blocking I/O, so it runs on the thread pool;
+        # requests made while a probe is running are coalesced into one follow-up
+        self._discovery_in_flight = False
+        self._discovery_pending: Optional[bool] = None  # force flag of the queued follow-up
+        self._auto_reconnect_pending = True  # Reconnect saved networks after the first successful discovery
+        self._discovery_done.connect(self._on_discovery_done)
+        
+        # Lookup indexes: bus number -> network, and hardware key -> id of the
+        # network last connected to it (checked against is_connected() on use)
+        self._bus_to_network: Dict[int, CANNetwork] = {}
+        self._hw_to_network: Dict[str, str] = {}
+        
+        # Connected networks by id, kept current by _on_network_state_changed
+        self._connected_networks: Dict[str, CANNetwork] = {}
+        
         # Global statistics
         self.global_stats = {
             'total_networks': 0,
@@ -43,40 +117,156 @@ class MultiNetworkManager(QObject):
             'start_time': time.time()
         }
         
+        # Running totals fed by the message and error slots, so polling statistics is O(1)
+        self._start_monotonic = time.monotonic()
+        self._agg_messages = 0
+        self._agg_errors = 0
+        
         # Configuration management
         self.config_file = Path("network_profiles.json")
         self.auto_save = True
         
+        # Changes mark the configuration dirty; one debounced write happens on a
+        # thread pool worker. Snapshots are numbered so an older write never
+        # lands after a newer one.
+        self._config_dirty = False
+        self._config_seq = 0
+        self._config_written_seq = 0
+        self._config_lock = threading.Lock()
+        self._save_timer = QTimer()
+        self._save_timer.setSingleShot(True)
+        self._save_timer.setInterval(500)
+        self._save_timer.timeout.connect(self._save_in_background)
+        
+        # Messages are delivered in batches to cut per-frame signal dispatch; the
+        # per-message signals are only emitted for consumers that opt in
+        self.emit_per_message = False
+        self.rx_batch = []
+        self.tx_batch = []
+        self.batch_timer = QTimer()
+        self.batch_timer.setSingleShot(True)
+        self.batch_timer.timeout.connect(self._flush_batches)
+        
         # Discovery and monitoring
         self.discovery_timer = QTimer()
         self.discovery_timer.timeout.connect(self.discover_hardware)
-        self.discovery_timer.start(10000)  # Discover every 10 seconds
         
-        # Initial hardware discovery
+        # Device plug events trigger a debounced rediscovery; polling remains as a fallback
+        self.hotplug_timer = QTimer()
+        self.hotplug_timer.setSingleShot(True)
+        self.hotplug_timer.setInterval(HOTPLUG_DEBOUNCE_MS)
+        self.hotplug_timer.timeout.connect(lambda: self.discover_hardware(force=True))
+        self._hotplug_event.connect(self.hotplug_timer.start)
+        self.hotplug_observer = self._start_hotplug_observer()
+        # Stops the observer thread at interpreter exit even if shutdown() never runs
+        self._hotplug_finalizer = weakref.finalize(
+            self, self.hotplug_observer.send_stop if self.hotplug_observer else lambda: None)
+        self._is_shut_down = False
+        self.discovery_timer.start(DISCOVERY_HOTPLUG_POLL_MS if self.hotplug_observer
+                                   else DISCOVERY_POLL_MS)
+        
+        # Initial hardware discovery; networks auto-reconnect once its results arrive
         self.discover_hardware()
         
-        # Auto-reconnect networks after hardware discovery
-        QTimer.singleShot(2000, self.auto_reconnect_networks)  # Wait 2s for hardware discovery
+    def _start_hotplug_observer(self):
+        """Watch udev for USB and network (vcan/socketcan) device changes, or return None if unsupported"""
+        if pyudev is None:
+            return None
+            
+        try:
+            monitor = pyudev.Monitor.from_netlink(pyudev.Context())
+            monitor.filter_by(subsystem='usb')
+            monitor.filter_by(subsystem='net')
+            
+            # The observer thread must not keep the manager alive, or the finalizer never runs
+            on_device_event = weakref.WeakMethod(self._on_device_event)
+            
+            def callback(device):
+                handler = on_device_event()
+                if handler is not None:
+                    handler(device)
+                    
+            observer = pyudev.MonitorObserver(monitor, callback=callback, name='can-hotplug')
+            observer.daemon = True
+            observer.start()
+            return observer
+        except Exception as e:
+            logger.warning("Hot-plug monitoring unavailable, polling for hardware: %s", e)
+            return None
+            
+    def _on_device_event(self, device):
+        """Called on the udev observer thread; hand the event to the manager's thread"""
+        self._hotplug_event.emit()
+        
+    def discover_hardware(self, force: bool = False):
+        """Discover available hardware interfaces on a worker thread (periodic calls reuse recent results)"""
+        if self._discovery_in_flight:
+            self._discovery_pending = bool(self._discovery_pending) or force
+            return
+            
+        self._discovery_in_flight = True
+        QThreadPool.globalInstance().start(lambda: self._run_discovery(force))
         
-    def discover_hardware(self):
-        """Discover available hardware interfaces"""
+    def _run_discovery(self, force: bool):
+        """Worker body: probe interfaces and hand the result back to the manager's thread"""
+        try:
+            interfaces = self.hardware_discovery.discover_interfaces(force=force)
+        except Exception as e:
+            self.error_occurred.emit("system", f"Hardware discovery failed: {str(e)}")
+            interfaces = None
+        self._discovery_done.emit(interfaces, force)
+        
+    def _on_discovery_done(self, interfaces: Optional[List[HardwareInterface]], force: bool):
+        """Apply a finished discovery, then start any request that arrived meanwhile"""
+        self._discovery_in_flight = False
+        if interfaces is not None:
+            self._apply_discovered_hardware(interfaces, force)
+            if self._auto_reconnect_pending:
+                self._auto_reconnect_pending = False
+                self.auto_reconnect_networks()
+            
+        if self._discovery_pending is not None:
+            pending, self._discovery_pending = self._discovery_pending, None
+            self.discover_hardware(force=pending)
+            
+    def _apply_discovered_hardware(self, interfaces: List[HardwareInterface], force: bool):
+        """Diff discovered interfaces into the hardware dict and notify views of changes"""
         try:
-            interfaces = self.hardware_discovery.discover_interfaces()
+            discovered = {interface.key: interface for interface in interfaces}
             
-            # Update hardware interfaces dict
-            self.hardware_interfaces.clear()
-            for interface in interfaces:
-                key = f"{interface.interface_type}:{interface.channel}"
-                self.hardware_interfaces[key] = interface
+            # Update the hardware dict in place: known interfaces keep their object,
+            # so the in-use flag set by connect_network survives rediscovery
+            current = self.hardware_interfaces
+            added = discovered.keys() - current.keys()
+            removed = current.keys() - discovered.keys()
+            changed = False
+            for key, interface in discovered.items():
+                existing = current.get(key)
+                if existing is None:
+                    current[key] = interface
+                elif (existing.available != interface.available and
+                      not self._is_hardware_in_use(key)):
+                    existing.available = interface.available
+                    changed = True
+            for key in removed:
+                del current[key]
+                
+            # Only notify views when something changed (or on an explicit refresh)
+            if added or removed or changed:
+                self._hardware_tuple = None
+            elif not force:
+                return
                 
-            self.hardware_discovered.emit(interfaces)
+            self.hardware_discovered.emit(list(self.get_available_hardware()))
             
         except Exception as e:
             self.error_occurred.emit("system", f"Hardware discovery failed: {str(e)}")
             
-    def get_available_hardware(self) -> List[HardwareInterface]:
-        """Get list of available hardware interfaces"""
-        return list(self.hardware_interfaces.values())
+    def get_available_hardware(self) -> Tuple[HardwareInterface, ...]:
+        """Get the discovered hardware interfaces (a tuple shared until the next discovery)"""
+        if self._hardware_tuple is None:
+            self._hardware_tuple = tuple(self.hardware_interfaces.values())
+        return self._hardware_tuple
         
     def get_available_hardware_for_type(self, interface_type: str) -> List[HardwareInterface]:
         """Get hardware interfaces of a specific type"""
@@ -91,19 +281,21 @@ class MultiNetworkManager(QObject):
             
         network = CANNetwork(config)
         
-        # Connect network signals
+        # Connect network signals; networks relay frames onto this thread, so the
+        # per-frame slots are bound directly and skip Qt's per-emit thread check
         network.connection_state_changed.connect(self._on_network_state_changed)
-        network.message_received.connect(self._on_message_received)
-        network.message_transmitted.connect(self._on_message_transmitted)
+        network.messages_received.connect(self._on_messages_received, Qt.ConnectionType.DirectConnection)
+        network.message_transmitted.connect(self._on_message_transmitted, Qt.ConnectionType.DirectConnection)
         network.error_occurred.connect(self._on_error_occurred)
         
         # Add to networks
         self.networks[config.network_id] = network
+        self._bus_to_network[config.bus_number] = network
         self.global_stats['total_networks'] += 1
         
         # Auto-save configuration
         if self.auto_save:
-            self.save_configuration()
+            self.schedule_save()
             
         self.network_added.emit(config.network_id)
         return config.network_id
@@ -121,11 +313,13 @@ class MultiNetworkManager(QObject):
             
         # Remove from networks
         del self.networks[network_id]
+        self._connected_networks.pop(network_id, None)
+        self.reindex_networks()
         self.global_stats['total_networks'] -= 1
         
         # Auto-save configuration
         if self.auto_save:
-            self.save_configuration()
+            self.schedule_save()
             
         self.network_removed.emit(network_id)
         return True
@@ -134,8 +328,12 @@ class MultiNetworkManager(QObject):
         """Get a network by ID"""
         return self.networks.get(network_id)
         
-    def get_all_networks(self) -> Dict[str, CANNetwork]:
-        """Get all networks"""
+    def get_all_networks(self) -> Mapping[str, CANNetwork]:
+        """Get all networks as a read-only live view (no copy per call)"""
+        return self._networks_view
+        
+    def snapshot_networks(self) -> Dict[str, CANNetwork]:
+        """Get a copy of all networks, safe to keep while networks are added or removed"""
         return self.networks.copy()
         
     def connect_network(self, network_id: str, hardware_key: str) -> bool:
@@ -162,11 +360,12 @@ class MultiNetworkManager(QObject):
             
             if success:
                 hardware.available = False  # Mark as in use
+                self._hw_to_network[hardware_key] = network_id
                 self.global_stats['active_connections'] += 1
                 
                 # Save hardware interface for auto-reconnect
                 network.config.last_hardware_interface = hardware_key
-                self.save_configuration()
+                self.schedule_save()
                 
             return success
             
@@ -183,10 +382,12 @@ class MultiNetworkManager(QObject):
         
         if network.is_connected():
             # Free up hardware interface
-            if network.hardware:
-                hardware_key = f"{network.hardware.interface_type}:{network.hardware.channel}"
+            hardware_key = network.hardware_key
+            if hardware_key:
                 if hardware_key in self.hardware_interfaces:
                     self.hardware_interfaces[hardware_key].available = True
+                if self._hw_to_network.get(hardware_key) == network_id:
+                    del self._hw_to_network[hardware_key]
                     
             network.disconnect()
             self.global_stats['active_connections'] -= 1
@@ -195,7 +396,7 @@ class MultiNetworkManager(QObject):
         
     def auto_reconnect_networks(self):
         """Automatically reconnect networks to their last used hardware interfaces"""
-        print("🔄 Attempting auto-reconnect to saved hardware interfaces...")
+        logger.info("Attempting auto-reconnect to saved hardware interfaces")
         
         reconnected_count = 0
         
@@ -214,28 +415,42 @@ class MultiNetworkManager(QObject):
                     
                     # Only try to reconnect if hardware is available
                     if hardware.available and not self._is_hardware_in_use(hardware_key, network_id):
-                        print(f"🔌 Auto-reconnecting {network.config.name} to {hardware_key}")
+                        logger.info("Auto-reconnecting %s to %s", network.config.name, hardware_key)
                         
                         success = self.connect_network(network_id, hardware_key)
                         if success:
                             reconnected_count += 1
-                            print(f"✅ Auto-reconnected {network.config.name} to {hardware_key}")
+                            logger.info("Auto-reconnected %s to %s", network.config.name, hardware_key)
                         else:
-                            print(f"❌ Failed to auto-reconnect {network.config.name} to {hardware_key}")
+                            logger.warning("Failed to auto-reconnect %s to %s", network.config.name, hardware_key)
                     else:
-                        print(f"⚠️ Hardware {hardware_key} not available for {network.config.name}")
+                        logger.info("Hardware %s not available for %s", hardware_key, network.config.name)
                 else:
-                    print(f"⚠️ Saved hardware {hardware_key} not found for {network.config.name}")
+                    logger.info("Saved hardware %s not found for %s", hardware_key, network.config.name)
                     
         if reconnected_count > 0:
-            print(f"🎉 Auto-reconnected {reconnected_count} network(s) to saved hardware interfaces")
+            logger.info("Auto-reconnected %d network(s) to saved hardware interfaces", reconnected_count)
         else:
-            print("ℹ️ No networks auto-reconnected (none had saved interfaces or hardware unavailable)")
+            logger.info("No networks auto-reconnected (none had saved interfaces or hardware unavailable)")
         
     def disconnect_all_networks(self):
         """Disconnect all networks"""
-        for network_id in list(self.networks.keys()):
-            self.disconnect_network(network_id)
+        # Only connected networks need work; snapshot them since each disconnect
+        # drops its network from _connected_networks
+        connected = list(self._connected_networks.items())
+        for network_id, network in connected:
+            network.disconnect()
+            
+        # Release every hardware interface they held in one pass
+        disconnected = {network_id for network_id, _ in connected}
+        for hardware_key, owner in list(self._hw_to_network.items()):
+            if owner in disconnected:
+                hardware = self.hardware_interfaces.get(hardware_key)
+                if hardware is not None:
+                    hardware.available = True
+                del self._hw_to_network[hardware_key]
+                
+        self.global_stats['active_connections'] -= len(connected)
             
     def send_message(self, network_id: str, msg_id: int, data: bytes, is_extended: bool = False) -> bool:
         """Send a message on a specific network"""
@@ -247,16 +462,14 @@ class MultiNetworkManager(QObject):
     def broadcast_message(self, msg_id: int, data: bytes, is_extended: bool = False, 
                          exclude_networks: Set[str] = None) -> int:
         """Broadcast a message to all connected networks"""
-        if exclude_networks is None:
-            exclude_networks = set()
+        # Snapshot the targets: an error dialog raised from send_message runs a nested
+        # event loop whose slots can connect or disconnect networks
+        targets = tuple(self._connected_networks.values())
+        if exclude_networks:
+            targets = [network for network_id, network in self._connected_networks.items()
+                       if network_id not in exclude_networks]
             
-        sent_count = 0
-        for network_id, network in self.networks.items():
-            if network_id not in exclude_networks and network.is_connected():
-                if network.send_message(msg_id, data, is_extended):
-                    sent_count += 1
-                    
-        return sent_count
+        return sum(1 for network in targets if network.send_message(msg_id, data, is_extended))
         
     def add_periodic_message(self, network_id: str, msg_id: int, data: bytes, 
                            period_ms: int, is_extended: bool = False) -> bool:
@@ -285,40 +498,89 @@ class MultiNetworkManager(QObject):
     def get_global_statistics(self) -> Dict:
         """Get global statistics across all networks"""
         stats = self.global_stats.copy()
-        
-        # Calculate aggregated statistics
-        total_messages = 0
-        total_errors = 0
-        
-        for network in self.networks.values():
-            network_stats = network.get_statistics()
-            total_messages += network_stats.get('message_count', 0)
-            total_errors += network_stats.get('error_count', 0)
-            
-        stats['total_messages'] = total_messages
-        stats['total_errors'] = total_errors
-        stats['uptime'] = time.time() - stats['start_time']
+        stats['total_messages'] = self._agg_messages + len(self.rx_batch) + len(self.tx_batch)
+        stats['total_errors'] = self._agg_errors
+        stats['uptime'] = time.monotonic() - self._start_monotonic
         
         return stats
         
-    def save_configuration(self, filename: Optional[str] = None) -> bool:
-        """Save network configurations to file"""
+    def save_configuration(self, filename: Optional[str] = None, indent: bool = False) -> bool:
+        """Save network configurations to file (indent=True for a human-readable export)"""
+        if filename:
+            return self._write_configuration(Path(filename), self._configuration_snapshot(),
+                                             indent=indent, durable=True)
+            
+        # Writing the profile file now supersedes any pending debounced save
+        self._save_timer.stop()
+        self._config_dirty = False
+        self._config_seq += 1
+        return self._write_configuration(self.config_file, self._configuration_snapshot(),
+                                         self._config_seq, indent, durable=True)
+        
+    @contextmanager
+    def bulk_update(self) -> Iterator[None]:
+        """Suspend auto-save for a batch of changes and schedule one save at the end"""
+        previous, self.auto_save = self.auto_save, False
         try:
-            if filename:
-                config_file = Path(filename)
-            else:
-                config_file = self.config_file
+            yield
+        finally:
+            self.auto_save = previous
+            if previous:
+                self.schedule_save()
                 
-            configurations = {}
-            for network_id, network in self.networks.items():
-                configurations[network_id] = network.config.to_dict()
-                
-            with open(config_file, 'w') as f:
-                json.dump(configurations, f, indent=2)
+    def schedule_save(self):
+        """Mark the configuration dirty and (re)start the debounced save"""
+        self._config_dirty = True
+        self._save_timer.start()
+        
+    def _save_in_background(self):
+        """Snapshot the configuration on this thread and write it on a worker"""
+        if not self._config_dirty:
+            return
+            
+        self._config_dirty = False
+        self._config_seq += 1
+        config_file, configurations, seq = self.config_file, self._configuration_snapshot(), self._config_seq
+        QThreadPool.globalInstance().start(
+            lambda: self._write_configuration(config_file, configurations, seq))
+        
+    def _configuration_snapshot(self) -> Dict[str, Dict]:
+        """Plain-dict copy of every network configuration"""
+        return {network_id: network.config.to_dict_cached() for network_id, network in self.networks.items()}
+        
+    def _write_configuration(self, config_file: Path, configurations: Dict,
+                             seq: Optional[int] = None, indent: bool = False, durable: bool = False) -> bool:
+        """Atomically write configurations; a profile snapshot older than the last written one is skipped
+        
+        Durable (explicit) saves fsync the new file and keep the previous one as a .bak
+        rollback; debounced background saves skip both.
+        """
+        try:
+            payload = _encode_configuration(configurations, indent)
+            if not indent and len(payload) >= PROFILE_GZIP_THRESHOLD:
+                payload = gzip.compress(payload, compresslevel=1)
+            with self._config_lock:
+                if seq is not None:
+                    if seq <= self._config_written_seq:
+                        return True
+                    self._config_written_seq = seq
+                    
+                # Write a sibling temp file and rename it over the target, so a
+                # crash mid-write never leaves a truncated profile file
+                tmp_file = config_file.with_name(config_file.name + '.tmp')
+                with open(tmp_file, 'wb') as f:
+                    f.write(payload)
+                    if durable:
+                        f.flush()
+                        os.fsync(f.fileno())
+                        
+                if durable and config_file.exists():
+                    shutil.copyfile(config_file, config_file.with_name(config_file.name + '.bak'))
+                os.replace(tmp_file, config_file)
                 
             return True
             
-        except Exception as e:
+        except (OSError, TypeError, ValueError) as e:  # orjson.JSONEncodeError is a TypeError
             self.error_occurred.emit("system", f"Failed to save configuration: {str(e)}")
             return False
             
@@ -333,17 +595,31 @@ class MultiNetworkManager(QObject):
             if not config_file.exists():
                 return True  # No configuration file is not an error
                 
-            with open(config_file, 'r') as f:
-                configurations = json.load(f)
+            try:
+                configurations = _decode_configuration(config_file.read_bytes())
+            except (ValueError, EOFError, gzip.BadGzipFile, zlib.error):
+                # Unreadable profile: fall back to the backup kept by the last explicit save
+                backup_file = config_file.with_name(config_file.name + '.bak')
+                if not backup_file.exists():
+                    raise
+                logger.warning("%s is corrupt, loading %s", config_file, backup_file)
+                raw = backup_file.read_bytes()
+                configurations = _decode_configuration(raw)
                 
+                # Put the good copy back, so the next save does not roll the corrupt file over the backup
+                with self._config_lock:
+                    config_file.write_bytes(raw)
+                    
             # Clear existing networks (disconnect first)
             self.disconnect_all_networks()
             self.networks.clear()
+            self.reindex_networks()
             
             # Load configurations
-            for network_id, config_data in configurations.items():
-                config = NetworkConfiguration.from_dict(config_data)
-                self.create_network(config)
+            with self.bulk_update():
+                for network_id, config_data in configurations.items():
+                    config = NetworkConfiguration.from_dict(config_data)
+                    self.create_network(config)
                 
             return True
             
@@ -353,92 +629,145 @@ class MultiNetworkManager(QObject):
             
     def create_default_networks(self):
         """Create some default network configurations"""
-        # Virtual CAN network for testing
-        virtual_config = NetworkConfiguration()
-        virtual_config.name = "Bus 1 - Virtual CAN"
-        virtual_config.description = "Virtual CAN network for testing and simulation"
-        virtual_config.bus_number = 1
-        virtual_config.bitrate = 500000
-        self.create_network(virtual_config)
-        
-        # High-speed CAN network
-        hs_can_config = NetworkConfiguration()
-        hs_can_config.name = "Bus 2 - High-Speed CAN"
-        hs_can_config.description = "High-speed CAN network (500 kbps)"
-        hs_can_config.bus_number = 2
-        hs_can_config.bitrate = 500000
-        self.create_network(hs_can_config)
-        
-        # Low-speed CAN network
-        ls_can_config = NetworkConfiguration()
-        ls_can_config.name = "Bus 3 - Low-Speed CAN"
-        ls_can_config.description = "Low-speed CAN network (125 kbps)"
-        ls_can_config.bus_number = 3
-        ls_can_config.bitrate = 125000
-        self.create_network(ls_can_config)
+        with self.bulk_update():
+            # Virtual CAN network for testing
+            virtual_config = NetworkConfiguration()
+            virtual_config.name = "Bus 1 - Virtual CAN"
+            virtual_config.description = "Virtual CAN network for testing and simulation"
+            virtual_config.bus_number = 1
+            virtual_config.bitrate = 500000
+            self.create_network(virtual_config)
+            
+            # High-speed CAN network
+            hs_can_config = NetworkConfiguration()
+            hs_can_config.name = "Bus 2 - High-Speed CAN"
+            hs_can_config.description = "High-speed CAN network (500 kbps)"
+            hs_can_config.bus_number = 2
+            hs_can_config.bitrate = 500000
+            self.create_network(hs_can_config)
+            
+            # Low-speed CAN network
+            ls_can_config = NetworkConfiguration()
+            ls_can_config.name = "Bus 3 - Low-Speed CAN"
+            ls_can_config.description = "Low-speed CAN network (125 kbps)"
+            ls_can_config.bus_number = 3
+            ls_can_config.bitrate = 125000
+            self.create_network(ls_can_config)
+        
+    def reindex_networks(self):
+        """Rebuild the lookup indexes, e.g. after a network's configuration was edited in place"""
+        self._bus_to_network = {network.config.bus_number: network
+                                for network in reversed(list(self.networks.values()))}
+        self._hw_to_network = {key: network_id for key, network_id in self._hw_to_network.items()
+                               if network_id in self.networks}
         
     def _is_hardware_in_use(self, hardware_key: str, exclude_network: str = None) -> bool:
         """Check if a hardware interface is already in use"""
-        for network_id, network in self.networks.items():
-            if network_id == exclude_network:
-                continue
-                
-            if (network.hardware and network.is_connected() and
-                f"{network.hardware.interface_type}:{network.hardware.channel}" == hardware_key):
-                return True
-                
-        return False
+        owner = self._hw_to_network.get(hardware_key)
+        if owner is None or owner == exclude_network:
+            return False
+            
+        # The connection may have dropped on its own since it was recorded
+        network = self.networks.get(owner)
+        return network is not None and network.is_connected()
         
     def _is_bus_number_used(self, bus_number: int) -> bool:
         """Check if a bus number is already in use"""
-        for network in self.networks.values():
-            if network.config.bus_number == bus_number:
-                return True
-        return False
+        return bus_number in self._bus_to_network
         
     def _get_next_available_bus_number(self) -> int:
         """Get the next available bus number"""
-        used_numbers = {network.config.bus_number for network in self.networks.values()}
-        bus_number = 1
-        while bus_number in used_numbers:
-            bus_number += 1
-        return bus_number
+        used_numbers = self._bus_to_network
+        return next(bus_number for bus_number in itertools.count(1) if bus_number not in used_numbers)
         
     def get_network_by_bus_number(self, bus_number: int) -> Optional['CANNetwork']:
         """Get network by bus number"""
-        for network in self.networks.values():
-            if network.config.bus_number == bus_number:
-                return network
-        return None
+        return self._bus_to_network.get(bus_number)
         
     def get_all_bus_numbers(self) -> List[int]:
         """Get all active bus numbers"""
-        return sorted([network.config.bus_number for network in self.networks.values()])
+        return sorted(self._bus_to_network)
         
     def _on_network_state_changed(self, network_id: str, state: ConnectionState):
         """Handle network state changes"""
+        network = self.networks.get(network_id)
+        if state == ConnectionState.CONNECTED and network is not None:
+            self._connected_networks[network_id] = network
+        else:
+            self._connected_networks.pop(network_id, None)
+            
         self.network_state_changed.emit(network_id, state)
         
-    def _on_message_received(self, network_id: str, message):
-        """Handle received messages from networks"""
-        self.message_received.emit(network_id, message)
+    def _on_messages_received(self, messages):
+        """Handle a batch of received messages from one network"""
+        if self.emit_per_message:
+            for message in messages:
+                self.message_received.emit(message.network_id, message)
+                
+        # First batch since the last flush arms the flush timer
+        if not self.batch_timer.isActive():
+            self.batch_timer.start(10)
+        self.rx_batch.extend([(message.network_id, message) for message in messages])
+        
+    def _flush_batches(self):
+        """Emit all messages received and transmitted since the last flush, one batch each plus a merged one"""
+        rx_batch, self.rx_batch = self.rx_batch, []
+        tx_batch, self.tx_batch = self.tx_batch, []
+        self._agg_messages += len(rx_batch) + len(tx_batch)
+        if rx_batch:
+            self.messages_received.emit(rx_batch)
+        if tx_batch:
+            self.messages_transmitted.emit(tx_batch)
+            
+        # Consumers that record both directions need them interleaved as they hit the bus
+        if rx_batch and tx_batch:
+            exchanged = rx_batch + tx_batch
+            exchanged.sort(key=lambda item: item[1].timestamp)
+        else:
+            exchanged = rx_batch or tx_batch
+        if exchanged:
+            self.messages_exchanged.emit(exchanged)
         
-    def _on_message_transmitted(self, network_id: str, message):
+    def _on_message_transmitted(self, message):
         """Handle transmitted messages from networks"""
-        self.message_transmitted.emit(network_id, message)
+        network_id = message.network_id
+        if self.emit_per_message:
+            self.message_transmitted.emit(network_id, message)
+            
+        if not self.batch_timer.isActive():
+            self.batch_timer.start(10)
+        self.tx_batch.append((network_id, message))
         
     def _on_error_occurred(self, network_id: str, error: str):
         """Handle errors from networks"""
+        self._agg_errors += 1
         self.error_occurred.emit(network_id, error)
         
     def shutdown(self):
-        """Shutdown the multi-network manager"""
+        """Shutdown the multi-network manager (safe to call from any thread, and more than once)"""
+        # Timers may only be stopped on the thread that owns them
+        if QThread.currentThread() != self.thread():
+            QMetaObject.invokeMethod(self, '_shutdown_impl', Qt.ConnectionType.BlockingQueuedConnection)
+            return
+        self._shutdown_impl()
+        
+    @pyqtSlot()
+    def _shutdown_impl(self):
+        """Stop timers, write the final configuration once and disconnect every network"""
+        if self._is_shut_down:
+            return
+        self._is_shut_down = True
+        
         # Stop discovery
         self.discovery_timer.stop()
+        self.hotplug_timer.stop()
+        self._hotplug_finalizer()
+        self.hotplug_observer = None
+        self.batch_timer.stop()
         
+        # Save configuration, including any change still waiting on the debounce
+        if self.auto_save or self._config_dirty:
+            self.save_configuration()
+            
         # Disconnect all networks
         self.disconnect_all_networks()
-        
-        # Save configuration
-        if self.auto_save:
-            self.save_configuration()
@@ -3,20 +3,35 @@ CAN Network and Connection Management
 Provides clean separation between logical networks and physical connections
 """
 
+import heapq
+import itertools
 import os
 import time
 import uuid
+from collections import deque
+from contextlib import suppress
 from dataclasses import dataclass, field
-from typing import Dict, List, Optional, Set, Callable
+from functools import cached_property
+from typing import Dict, List, Optional, Set
 from enum import Enum, auto
 
 import can
-from can import Message, Listener
+from can import Message
+from can.broadcastmanager import CyclicSendTaskABC
 from PyQt6.QtCore import QObject, pyqtSignal, QTimer
 
 from .messages import CANMessage
 from .virtual_can import VirtualCANNetwork, VirtualCANBus
 
+# Hot-path clock: one monotonic read per frame, converted to wall time only when displayed
+_mono = time.monotonic_ns
+_WALL_OFFSET_NS = time.time_ns() - time.monotonic_ns()
+
+
+def _mono_to_wall(mono_ns: int) -> float:
+    """Convert a time.monotonic_ns() reading to wall-clock seconds"""
+    return (mono_ns + _WALL_OFFSET_NS) / 1e9
+
 
 class ConnectionState(Enum):
     """Connection state enumeration"""
@@ -56,6 +71,31 @@ class HardwareInterface:
             self.capabilities.update(['hardware_filters', 'silent_mode', 'error_frames'])
         elif self.interface_type == 'socketcan':
             self.capabilities.update(['native_linux', 'error_frames'])
+            
+    @cached_property
+    def key(self) -> str:
+        """Hardware key ('type:channel') used to index interfaces, built once per interface"""
+        return f"{self.interface_type}:{self.channel}"
+
+
+# Serialized NetworkConfiguration fields read by from_dict, with the converter
+# applied to the stored value (None keeps it as-is)
+_CONFIG_FIELDS = (
+    ('network_id', None),
+    ('name', None),
+    ('description', None),
+    ('bus_number', None),
+    ('bitrate', None),
+    ('sample_point', None),
+    ('protocol', NetworkProtocol),
+    ('listen_only', None),
+    ('enable_error_frames', None),
+    ('auto_reconnect', None),
+    ('reconnect_delay', None),
+    ('message_filters', None),
+    ('symbol_file_path', None),
+    ('last_hardware_interface', None),
+)
 
 
 @dataclass 
@@ -75,9 +115,29 @@ class NetworkConfiguration:
     message_filters: List[Dict] = field(default_factory=list)
     symbol_file_path: str = ""  # Path to SYM file for this network
     last_hardware_interface: str = ""  # Last connected hardware interface (type:channel)
+    _dict_cache: Optional[Dict] = field(default=None, init=False, repr=False, compare=False)
     
+    def __setattr__(self, name, value):
+        # Assigning any field invalidates the memoized dictionary
+        object.__setattr__(self, name, value)
+        if name != '_dict_cache':
+            object.__setattr__(self, '_dict_cache', None)
+            
+    def to_dict_cached(self) -> Dict:
+        """to_dict() memoized until a field is reassigned; the result is shared, do not modify it
+        
+        In-place edits of message_filters are not detected; assign a new list instead.
+        """
+        if self._dict_cache is None:
+            self._dict_cache = self._build_dict()
+        return self._dict_cache
+        
     def to_dict(self) -> Dict:
-        """Convert to dictionary for serialization"""
+        """Convert to dictionary for serialization (a copy of the memoized dictionary)"""
+        return self.to_dict_cached().copy()
+        
+    def _build_dict(self) -> Dict:
+        """Build the serialized dictionary from the current field values"""
         return {
             'network_id': self.network_id,
             'name': self.name,
@@ -97,55 +157,28 @@ class NetworkConfiguration:
     
     @classmethod
     def from_dict(cls, data: Dict) -> 'NetworkConfiguration':
-        """Create from dictionary"""
+        """Create from dictionary; missing keys keep their defaults"""
         config = cls()
-        config.network_id = data.get('network_id', config.network_id)
-        config.name = data.get('name', config.name)
-        config.description = data.get('description', config.description)
-        config.bus_number = data.get('bus_number', config.bus_number)
-        config.bitrate = data.get('bitrate', config.bitrate)
-        config.sample_point = data.get('sample_point', config.sample_point)
-        config.protocol = NetworkProtocol(data.get('protocol', config.protocol.value))
-        config.listen_only = data.get('listen_only', config.listen_only)
-        config.enable_error_frames = data.get('enable_error_frames', config.enable_error_frames)
-        config.auto_reconnect = data.get('auto_reconnect', config.auto_reconnect)
-        config.reconnect_delay = data.get('reconnect_delay', config.reconnect_delay)
-        config.message_filters = data.get('message_filters', config.message_filters)
-        config.symbol_file_path = data.get('symbol_file_path', config.symbol_file_path)
-        config.last_hardware_interface = data.get('last_hardware_interface', config.last_hardware_interface)
+        
+        # A fresh instance has no memoized dict to invalidate, so skip __setattr__
+        for attr, convert in _CONFIG_FIELDS:
+            if attr in data:
+                value = data[attr]
+                object.__setattr__(config, attr, value if convert is None else convert(value))
         return config
 
 
-class CANNetworkListener(Listener):
-    """CAN message listener for a specific network"""
-    
-    def __init__(self, network_id: str, callback: Callable[[str, CANMessage], None]):
-        self.network_id = network_id
-        self.callback = callback
-        
-    def on_message_received(self, msg: Message):
-        """Handle received CAN message"""
-        can_msg = CANMessage(
-            timestamp=msg.timestamp,
-            arbitration_id=msg.arbitration_id,
-            data=msg.data,
-            is_extended_id=msg.is_extended_id,
-            is_remote_frame=msg.is_remote_frame,
-            is_error_frame=msg.is_error_frame,
-            channel=getattr(msg, 'channel', self.network_id),
-            direction='rx',
-            bus_number=getattr(self, 'bus_number', 0)  # Will be set by CANConnection
-        )
-        self.callback(self.network_id, can_msg)
-
-
 class CANConnection(QObject):
     """Represents a physical connection to a CAN interface"""
     
+    # Receive ring buffer filled by the notifier thread and drained on the GUI thread
+    RX_RING_SIZE = 16384
+    RX_DRAIN_INTERVAL_MS = 20
+    
     # Signals
     state_changed = pyqtSignal(str, object)  # network_id, ConnectionState
-    message_received = pyqtSignal(str, object)  # network_id, CANMessage
-    message_transmitted = pyqtSignal(str, object)  # network_id, CANMessage
+    messages_received = pyqtSignal(list)  # [CANMessage, ...] (each carries network_id), once per drain
+    message_transmitted = pyqtSignal(object)  # CANMessage (carries network_id)
     error_occurred = pyqtSignal(str, str)  # network_id, error_message
     
     def __init__(self, network_id: str, config: NetworkConfiguration, hardware: HardwareInterface):
@@ -158,14 +191,20 @@ class CANConnection(QObject):
         # CAN bus components
         self.bus: Optional[can.Bus] = None
         self.notifier: Optional[can.Notifier] = None
-        self.listener: Optional[CANNetworkListener] = None
+        
+        # Received frames: raw python-can Messages (or ready CANMessages from the
+        # virtual network), appended without locking and converted per drain
+        self._rx_buf = deque(maxlen=self.RX_RING_SIZE)
+        self.rx_timer = QTimer()
+        self.rx_timer.timeout.connect(self._drain_rx_buffer)
         
         # Virtual CAN support
         self.virtual_network: Optional[VirtualCANNetwork] = None
         
         # Statistics
+        # message_count is derived from rx_count + tx_count in get_statistics; times are
+        # monotonic ns here and reported as wall-clock seconds by get_statistics
         self.stats = {
-            'message_count': 0,
             'tx_count': 0,
             'rx_count': 0,
             'error_count': 0,
@@ -174,6 +213,9 @@ class CANConnection(QObject):
             'connection_time': None
         }
         
+        # Backend cyclic senders by message ID (see start_cyclic)
+        self._cyclic: Dict[int, CyclicSendTaskABC] = {}
+        
         # Reconnection timer
         self.reconnect_timer = QTimer()
         self.reconnect_timer.timeout.connect(self._attempt_reconnect)
@@ -208,13 +250,12 @@ class CANConnection(QObject):
             self.bus = can.interface.Bus(**bus_config)
             
             # Set up message listener
-            self.listener = CANNetworkListener(self.network_id, self._on_message_received)
-            self.listener.bus_number = self.config.bus_number  # Set bus number for listener
-            self.notifier = can.Notifier(self.bus, [self.listener])
+            # A bare deque.append is a valid python-can listener callable
+            self.notifier = can.Notifier(self.bus, [self._rx_buf.append])
+            self.rx_timer.start(self.RX_DRAIN_INTERVAL_MS)
             
             # Update statistics
-            self.stats['start_time'] = time.time()
-            self.stats['connection_time'] = time.time()
+            self.stats['start_time'] = self.stats['connection_time'] = _mono()
             self._reset_counters()
             
             self._set_state(ConnectionState.CONNECTED)
@@ -241,10 +282,10 @@ class CANConnection(QObject):
             
             # Start virtual network
             self.virtual_network.start()
+            self.rx_timer.start(self.RX_DRAIN_INTERVAL_MS)
             
             # Update statistics
-            self.stats['start_time'] = time.time()
-            self.stats['connection_time'] = time.time()
+            self.stats['start_time'] = self.stats['connection_time'] = _mono()
             self._reset_counters()
             
             self._set_state(ConnectionState.CONNECTED)
@@ -261,6 +302,10 @@ class CANConnection(QObject):
             # Stop reconnection attempts
             self.reconnect_timer.stop()
             
+            # Stop backend cyclic senders before the bus goes away
+            for msg_id in list(self._cyclic):
+                self.stop_cyclic(msg_id)
+                
             # Stop virtual network if active
             if self.virtual_network:
                 self.virtual_network.stop()
@@ -271,8 +316,9 @@ class CANConnection(QObject):
                 self.notifier.stop()
                 self.notifier = None
                 
-            # Clean up listener
-            self.listener = None
+            # Deliver frames still buffered, then stop draining
+            self.rx_timer.stop()
+            self._drain_rx_buffer()
             
             # Close bus
             if self.bus:
@@ -304,8 +350,9 @@ class CANConnection(QObject):
             self.bus.send(msg)
             
             # Create CANMessage for tracking
+            now = _mono()
             can_msg = CANMessage(
-                timestamp=time.time(),
+                timestamp=_mono_to_wall(now),
                 arbitration_id=msg_id,
                 data=data,
                 is_extended_id=is_extended,
@@ -313,13 +360,13 @@ class CANConnection(QObject):
                 is_error_frame=False,
                 channel=self.network_id,
                 direction='tx',
-                bus_number=self.config.bus_number
+                bus_number=self.config.bus_number,
+                network_id=self.network_id
             )
             
             self.stats['tx_count'] += 1
-            self.stats['message_count'] += 1
-            self.stats['last_message_time'] = time.time()
-            self.message_transmitted.emit(self.network_id, can_msg)
+            self.stats['last_message_time'] = now
+            self.message_transmitted.emit(can_msg)
             
             return True
             
@@ -328,6 +375,32 @@ class CANConnection(QObject):
             self.stats['error_count'] += 1
             return False
             
+    def start_cyclic(self, msg_id: int, data: bytes, period_ms: int, is_extended: bool = False) -> bool:
+        """Hand a periodic message to the bus's cyclic sender; False if the caller must schedule it
+        
+        python-can buses send cyclic frames in the backend (the kernel broadcast
+        manager on SocketCAN) without waking this process. Those frames bypass
+        send_message, so they are not counted in tx_count or emitted as transmitted.
+        """
+        if self.bus is None or self.virtual_network is not None or not self.is_connected():
+            return False
+            
+        self.stop_cyclic(msg_id)
+        msg = Message(arbitration_id=msg_id, data=data, is_extended_id=is_extended)
+        try:
+            self._cyclic[msg_id] = self.bus.send_periodic(msg, max(period_ms, 1) / 1000.0, store_task=False)
+        except (can.CanError, NotImplementedError, OSError) as e:
+            print(f"Warning: cyclic send unavailable on this bus, using timer: {e}")
+            return False
+        return True
+        
+    def stop_cyclic(self, msg_id: int):
+        """Stop the backend cyclic sender for a message ID, if any"""
+        cyclic = self._cyclic.pop(msg_id, None)
+        if cyclic is not None:
+            with suppress(can.CanError, OSError):
+                cyclic.stop()
+                
     def is_connected(self) -> bool:
         """Check if connection is active"""
         return self.state == ConnectionState.CONNECTED
@@ -335,16 +408,22 @@ class CANConnection(QObject):
     def get_statistics(self) -> Dict:
         """Get connection statistics"""
         stats = self.stats.copy()
+        stats['message_count'] = stats['rx_count'] + stats['tx_count']
+        now = _mono()
         if stats['start_time']:
-            stats['uptime'] = time.time() - stats['start_time']
+            stats['uptime'] = (now - stats['start_time']) / 1e9
         else:
             stats['uptime'] = 0
             
         if stats['connection_time']:
-            stats['connection_uptime'] = time.time() - stats['connection_time']
+            stats['connection_uptime'] = (now - stats['connection_time']) / 1e9
         else:
             stats['connection_uptime'] = 0
             
+        for key in ('start_time', 'last_message_time', 'connection_time'):
+            if stats[key]:
+                stats[key] = _mono_to_wall(stats[key])
+            
         return stats
         
     def _set_state(self, new_state: ConnectionState):
@@ -355,24 +434,37 @@ class CANConnection(QObject):
             
     def _reset_counters(self):
         """Reset message counters"""
-        self.stats['message_count'] = 0
         self.stats['tx_count'] = 0
         self.stats['rx_count'] = 0
         self.stats['error_count'] = 0
         
-    def _on_message_received(self, network_id: str, msg: CANMessage):
-        """Handle received CAN message"""
-        self.stats['rx_count'] += 1
-        self.stats['message_count'] += 1
-        self.stats['last_message_time'] = time.time()
-        self.message_received.emit(network_id, msg)
+    def _drain_rx_buffer(self):
+        """Convert every buffered frame and deliver them with one batch signal"""
+        # Taking the whole backlog each tick lets the batch grow with the bus load
+        buf = self._rx_buf
+        count = len(buf)
+        if not count:
+            return
+            
+        network_id, bus_number = self.network_id, self.config.bus_number
+        from_can_msg = CANMessage.from_can_msg
+        batch = []
+        for _ in range(count):
+            item = buf.popleft()
+            batch.append(item if type(item) is CANMessage
+                         else from_can_msg(item, 'rx', bus_number, network_id, network_id))
+            
+        self.stats['rx_count'] += count
+        self.stats['last_message_time'] = _mono()
+        self.messages_received.emit(batch)
         
     def _on_virtual_message_received(self, msg: CANMessage):
         """Handle virtual CAN message"""
         # Update network ID and bus number for virtual messages
         msg.channel = self.network_id
         msg.bus_number = self.config.bus_number
-        self._on_message_received(self.network_id, msg)
+        msg.network_id = self.network_id
+        self._rx_buf.append(msg)
         
     def _schedule_reconnect(self):
         """Schedule a reconnection attempt"""
@@ -393,8 +485,8 @@ class CANNetwork(QObject):
     
     # Signals
     connection_state_changed = pyqtSignal(str, object)  # network_id, ConnectionState
-    message_received = pyqtSignal(str, object)  # network_id, CANMessage
-    message_transmitted = pyqtSignal(str, object)  # network_id, CANMessage
+    messages_received = pyqtSignal(list)  # [CANMessage, ...] (each carries network_id)
+    message_transmitted = pyqtSignal(object)  # CANMessage (carries network_id)
     error_occurred = pyqtSignal(str, str)  # network_id, error_message
     
     def __init__(self, config: NetworkConfiguration, hardware: Optional[HardwareInterface] = None):
@@ -407,11 +499,20 @@ class CANNetwork(QObject):
         self.sym_parser: Optional[SymParser] = None
         self.load_symbol_file()
         
-        # Periodic message tasks
+        # Periodic message tasks, plus a min-heap of (next due time in monotonic ns, sequence, task)
+        # driving a single-shot timer armed for the earliest due task
         self.periodic_tasks = []
+        self._periodic_heap: List[tuple] = []
+        self._periodic_seq = itertools.count()
         self.periodic_timer = QTimer()
+        self.periodic_timer.setSingleShot(True)
         self.periodic_timer.timeout.connect(self._send_periodic_messages)
         
+    @property
+    def hardware_key(self) -> Optional[str]:
+        """Key of the assigned hardware interface, or None"""
+        return self.hardware.key if self.hardware else None
+        
     def set_hardware(self, hardware: HardwareInterface):
         """Set the hardware interface for this network"""
         if self.is_connected():
@@ -430,18 +531,19 @@ class CANNetwork(QObject):
         # Create new connection
         self.connection = CANConnection(self.config.network_id, self.config, self.hardware)
         
-        # Connect signals
-        self.connection.state_changed.connect(self.connection_state_changed.emit)
-        self.connection.message_received.connect(self.message_received.emit)
-        self.connection.message_transmitted.connect(self.message_transmitted.emit)
-        self.connection.error_occurred.connect(self.error_occurred.emit)
+        # Relay connection signals signal-to-signal, so Qt forwards each frame
+        # without calling back into Python
+        self.connection.state_changed.connect(self.connection_state_changed)
+        self.connection.messages_received.connect(self.messages_received)
+        self.connection.message_transmitted.connect(self.message_transmitted)
+        self.connection.error_occurred.connect(self.error_occurred)
         
         # Attempt connection
         success = self.connection.connect()
         
         if success:
-            # Start periodic message timer
-            self.periodic_timer.start(100)  # Check every 100ms
+            # Move periodic messages onto the bus's cyclic sender where supported
+            self._reschedule_periodic_messages()
             
         return success
         
@@ -454,6 +556,9 @@ class CANNetwork(QObject):
             self.connection.disconnect()
             self.connection = None
             
+        # Backend senders died with the connection; tasks go back to the timer heap
+        self._reschedule_periodic_messages()
+            
     def is_connected(self) -> bool:
         """Check if network is connected"""
         try:
@@ -474,22 +579,74 @@ class CANNetwork(QObject):
             'data': data,
             'period_ms': period_ms,
             'is_extended': is_extended,
-            'last_sent': 0,
-            'enabled': True
+            'last_sent': 0,  # time.monotonic_ns() of the last send
+            'enabled': True,
+            'removed': False,  # Lazily dropped when it reaches the top of the heap
+            'cyclic': False,  # Sent by the bus's cyclic sender instead of the timer heap
+            'scheduled': False  # Has an entry in the timer heap
         }
         self.periodic_tasks.append(task)
+        self._schedule_periodic_task(task)
         
     def remove_periodic_message(self, msg_id: int):
         """Remove a periodic message"""
-        self.periodic_tasks = [task for task in self.periodic_tasks if task['id'] != msg_id]
+        for task in self.periodic_tasks:
+            if task['id'] == msg_id:
+                task['removed'] = True
+                self._stop_cyclic_task(task)
+        self.periodic_tasks = [task for task in self.periodic_tasks if not task['removed']]
+        
+    def clear_periodic_messages(self):
+        """Remove all periodic messages"""
+        for task in self.periodic_tasks:
+            self._stop_cyclic_task(task)
+        self.periodic_tasks.clear()
+        self._periodic_heap.clear()
+        self.periodic_timer.stop()
         
     def set_periodic_message_enabled(self, msg_id: int, enabled: bool):
         """Enable/disable a periodic message"""
         for task in self.periodic_tasks:
             if task['id'] == msg_id:
                 task['enabled'] = enabled
+                
+                # Backend senders are stopped while disabled; the heap skips disabled tasks
+                if not enabled:
+                    self._stop_cyclic_task(task)
+                self._schedule_periodic_task(task)
                 break
                 
+    def _schedule_periodic_task(self, task: Dict):
+        """Start a task on the bus's cyclic sender, falling back to the timer heap"""
+        if task['cyclic']:
+            return
+            
+        if (task['enabled'] and self.connection and
+                self.connection.start_cyclic(task['id'], task['data'], task['period_ms'], task['is_extended'])):
+            task['cyclic'] = True
+            return
+            
+        if not task['scheduled']:
+            # First send is due immediately
+            task['scheduled'] = True
+            heapq.heappush(self._periodic_heap, (time.monotonic_ns(), next(self._periodic_seq), task))
+        self._arm_periodic_timer()
+        
+    def _stop_cyclic_task(self, task: Dict):
+        """Stop a task's backend cyclic sender, if it has one"""
+        if task['cyclic']:
+            task['cyclic'] = False
+            if self.connection:
+                self.connection.stop_cyclic(task['id'])
+                
+    def _reschedule_periodic_messages(self):
+        """Reassign every task to the cyclic sender or the timer heap after the connection changed"""
+        for task in self.periodic_tasks:
+            if not self.is_connected():
+                task['cyclic'] = False  # Backend senders stop with their connection
+            self._schedule_periodic_task(task)
+        self._arm_periodic_timer()
+                
     def get_statistics(self) -> Dict:
         """Get network statistics"""
         if self.connection:
@@ -525,34 +682,60 @@ class CANNetwork(QObject):
             return {}
         
         # Find message definition
-        for msg_name, msg_def in self.sym_parser.messages.items():
-            if msg_def.can_id == msg_id:
-                decoded = {}
-                for var in msg_def.variables:
-                    # Simplified decoding - could be enhanced
-                    if var.start_bit + var.bit_length <= len(data) * 8:
-                        # Extract and decode variable value
-                        # This is a simplified implementation
-                        start_byte = var.start_bit // 8
-                        if start_byte < len(data):
-                            raw_value = data[start_byte]  # Simplified
-                            scaled_value = raw_value * var.factor + var.offset
-                            decoded[var.name] = {
-                                'value': scaled_value,
-                                'unit': var.unit,
-                                'raw': raw_value
-                            }
-                return decoded
-        return {}
+        msg_def = self.sym_parser.get_message_by_id(msg_id)
+        if msg_def is None:
+            return {}
+            
+        decoded = {}
+        for var in msg_def.variables:
+            # Simplified decoding - could be enhanced
+            if var.start_bit + var.bit_length <= len(data) * 8:
+                # Extract and decode variable value
+                # This is a simplified implementation
+                start_byte = var.start_bit // 8
+                if start_byte < len(data):
+                    raw_value = data[start_byte]  # Simplified
+                    scaled_value = raw_value * var.factor + var.offset
+                    decoded[var.name] = {
+                        'value': scaled_value,
+                        'unit': var.unit,
+                        'raw': raw_value
+                    }
+        return decoded
     
     def _send_periodic_messages(self):
         """Send periodic messages that are due"""
-        current_time = time.time() * 1000  # Convert to milliseconds
+        now = time.monotonic_ns()
+        heap = self._periodic_heap
         
-        for task in self.periodic_tasks:
-            if not task['enabled']:
+        while heap and heap[0][0] <= now:
+            due, _, task = heapq.heappop(heap)
+            if task['removed'] or task['cyclic']:
+                task['scheduled'] = False
                 continue
                 
-            if current_time - task['last_sent'] >= task['period_ms']:
-                if self.send_message(task['id'], task['data'], task['is_extended']):
-                    task['last_sent'] = current_time
+            if task['enabled'] and self.send_message(task['id'], task['data'], task['is_extended']):
+                task['last_sent'] = now
+                
+            # Keep the original cadence; after a stall skip ahead instead of bursting
+            period = max(task['period_ms'], 1) * 1_000_000
+            next_due = due + period
+            if next_due <= now:
+                next_due = now + period
+            heapq.heappush(heap, (next_due, next(self._periodic_seq), task))
+            
+        self._arm_periodic_timer()
+        
+    def _arm_periodic_timer(self):
+        """Start the single-shot timer for the earliest due task"""
+        # Drop removed tasks sitting at the top so they don't cause empty wakeups
+        heap = self._periodic_heap
+        while heap and (heap[0][2]['removed'] or heap[0][2]['cyclic']):
+            heapq.heappop(heap)[2]['scheduled'] = False
+            
+        if not heap or not self.is_connected():
+            self.periodic_timer.stop()
+            return
+            
+        delay_ms = max(0, -((time.monotonic_ns() - heap[0][0]) // 1_000_000))  # Rounded up
+        self.periodic_timer.start(delay_ms)
@@ -6,6 +6,7 @@ import os
 import csv
 import json
 import time
+from collections import deque
 from datetime import datetime, timezone
 from typing import List, Dict
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
@@ -16,7 +17,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
 from PyQt6.QtCore import Qt, QTimer, pyqtSlot, QThread, pyqtSignal
 from PyQt6.QtGui import QFont, QColor
 
-from canbus.messages import CANMessage
+from canbus.messages import CANMessage, FrameRing
 from utils.message_decoder import MessageDecoder
 
 
@@ -26,7 +27,7 @@ class LogTextWidget(QTextEdit):
     def __init__(self, network_manager=None):
         super().__init__()
         self.network_manager = network_manager
-        self.messages = []  # Store message objects for tooltip lookup
+        self.frames = FrameRing()  # Recent displayed frames for tooltip lookup
         self.setMouseTracking(True)
         self.header_lines = 2  # Number of header lines to skip
         
@@ -47,12 +48,28 @@ class LogTextWidget(QTextEdit):
         
     def add_message_line(self, msg, line_text):
         """Add a message line with associated message data"""
-        self.messages.append((msg, line_text))
+        self.frames.append(msg)
         self.append(line_text)
         
+    def add_message_lines(self, entries, chunk_chars: int = 65536):
+        """Add (message, line text) pairs, appending the text in ~64KB chunks"""
+        # One append per chunk instead of one per line keeps layout work bounded
+        chunk = []
+        chunk_size = 0
+        for msg, line_text in entries:
+            self.frames.append(msg)
+            chunk.append(line_text)
+            chunk_size += len(line_text) + 1
+            if chunk_size >= chunk_chars:
+                self.append("\n".join(chunk))
+                chunk = []
+                chunk_size = 0
+        if chunk:
+            self.append("\n".join(chunk))
+        
     def clear_messages(self):
         """Clear all messages but keep header"""
-        self.messages.clear()
+        self.frames.clear()
         # Reset to header only
         header_text = "  #    Time (rel.)       Bus  ID        Message Name                     Dir Type DLC  Data (hex.)\n"
         header_text += "-" * 135 + "\n"
@@ -61,7 +78,7 @@ class LogTextWidget(QTextEdit):
     def mouseMoveEvent(self, event):
         """Handle mouse move for hover tooltips"""
         try:
-            if self.network_manager and self.messages:
+            if self.network_manager and self.frames.total:
                 cursor = self.cursorForPosition(event.pos())
                 line_number = cursor.blockNumber()
                 
@@ -69,10 +86,10 @@ class LogTextWidget(QTextEdit):
                 message_index = line_number - self.header_lines - 1
                 
                 # Debug info (uncomment to troubleshoot)
-                # print(f"Tooltip debug - Line: {line_number}, Message index: {message_index}, Total messages: {len(self.messages)}")
+                # print(f"Tooltip debug - Line: {line_number}, Message index: {message_index}, Total messages: {self.frames.total}")
                 
-                if 0 <= message_index < len(self.messages):
-                    msg, line_text = self.messages[message_index]
+                msg = self.frames.get(message_index)
+                if msg is not None:
                     decoded = self.decode_message_for_tooltip(msg)
                     if decoded and decoded.strip():
                         # Use simple plain text tooltip for maximum compatibility
@@ -105,26 +122,27 @@ class LogTextWidget(QTextEdit):
         sym_parser = self.get_symbol_parser_for_message(msg)
         if not sym_parser or not sym_parser.messages:
             # Return basic info if no SYM file
-            return f"ID: 0x{msg.arbitration_id:X}\nData: {' '.join(f'{b:02X}' for b in msg.data)}\nNo SYM file loaded for bus {msg.bus_number}"
+            return f"ID: 0x{msg.arbitration_id:X}\nData: {msg.data_hex}\nNo SYM file loaded for bus {msg.bus_number}"
             
         # Find matching message definition
-        for msg_name, msg_def in sym_parser.messages.items():
-            if msg_def.can_id == msg.arbitration_id:
-                decoded_lines = [f"Message: {msg_name} (0x{msg.arbitration_id:X})"]
-                decoded_lines.append("")  # Empty line for spacing
-                
-                # Use shared decoder
-                signals = MessageDecoder.decode_message_signals(msg, sym_parser)
-                for signal_name, signal_value in signals:
-                    decoded_lines.append(f"  {signal_name}: {signal_value}")
-                
-                if len(decoded_lines) > 2:  # More than just header and empty line
-                    return "\n".join(decoded_lines)
-                else:
-                    return f"Message: {msg_name} (0x{msg.arbitration_id:X})\n\nNo variables decoded"
+        msg_def = sym_parser.get_message_by_id(msg.arbitration_id)
+        if msg_def is not None:
+            msg_name = msg_def.name
+            decoded_lines = [f"Message: {msg_name} (0x{msg.arbitration_id:X})"]
+            decoded_lines.append("")  # Empty line for spacing
+            
+            # Use shared decoder
+            signals = MessageDecoder.decode_message_signals(msg, sym_parser)
+            for signal_name, signal_value in signals:
+                decoded_lines.append(f"  {signal_name}: {signal_value}")
+            
+            if len(decoded_lines) > 2:  # More than just header and empty line
+                return "\n".join(decoded_lines)
+            else:
+                return f"Message: {msg_name} (0x{msg.arbitration_id:X})\n\nNo variables decoded"
         
         # Unknown message
-        return f"Unknown Message\nID: 0x{msg.arbitration_id:X}\nData: {' '.join(f'{b:02X}' for b in msg.data)}"
+        return f"Unknown Message\nID: 0x{msg.arbitration_id:X}\nData: {msg.data_hex}"
     
 
 
@@ -186,63 +204,64 @@ class LogWriter(QThread):
         
         return ole_date
             
+    def write_lines(self, f, lines, chunk_size: int = 1024):
+        """Write one formatted line per message in chunks, reporting progress per chunk"""
+        chunk = []
+        for i, line in enumerate(lines):
+            chunk.append(line)
+            if len(chunk) == chunk_size:
+                f.write(''.join(chunk))
+                chunk.clear()
+                
+                # Update progress
+                progress = int((i / len(self.messages)) * 100)
+                self.progress_updated.emit(progress)
+                
+        if chunk:
+            f.write(''.join(chunk))
+            
     def write_csv(self):
         """Write messages in CSV format"""
         with open(self.filename, 'w', newline='') as f:
-            writer = csv.writer(f)
-            
             # Write header
-            writer.writerow(['Timestamp', 'ID', 'DLC', 'Data', 'Direction', 'Extended', 'Remote', 'Error'])
+            f.write("Timestamp,ID,DLC,Data,Direction,Extended,Remote,Error\r\n")
             
-            # Write messages
-            for i, msg in enumerate(self.messages):
-                data_hex = ' '.join(f'{b:02X}' for b in msg.data)
-                writer.writerow([
-                    self.get_relative_timestamp(msg),
-                    f'0x{msg.arbitration_id:X}',
-                    len(msg.data),
-                    data_hex,
-                    msg.direction,
-                    msg.is_extended_id,
-                    msg.is_remote_frame,
-                    msg.is_error_frame
-                ])
-                
-                # Update progress
-                if i % 100 == 0:
-                    progress = int((i / len(self.messages)) * 100)
-                    self.progress_updated.emit(progress)
+            # Write messages (same fields and line endings as csv.writer)
+            self.write_lines(f, (
+                f"{self.get_relative_timestamp(msg)},0x{msg.arbitration_id:X},{len(msg.data)},"
+                f"{msg.data_hex},{msg.direction},"
+                f"{msg.is_extended_id},{msg.is_remote_frame},{msg.is_error_frame}\r\n"
+                for msg in self.messages
+            ))
                     
     def write_json(self):
-        """Write messages in JSON format"""
-        data = {
+        """Write messages in JSON format, streaming one record at a time"""
+        header = {
             'version': '1.0',
             'timestamp': datetime.now().isoformat(),
-            'message_count': len(self.messages),
-            'messages': []
+            'message_count': len(self.messages)
         }
         
-        for i, msg in enumerate(self.messages):
-            msg_data = {
-                'timestamp': self.get_relative_timestamp(msg),
-                'id': msg.arbitration_id,
-                'data': list(msg.data),
-                'dlc': len(msg.data),
-                'direction': msg.direction,
-                'extended_id': msg.is_extended_id,
-                'remote_frame': msg.is_remote_frame,
-                'error_frame': msg.is_error_frame,
-                'channel': msg.channel
-            }
-            data['messages'].append(msg_data)
-            
-            # Update progress
-            if i % 100 == 0:
-                progress = int((i / len(self.messages)) * 100)
-                self.progress_updated.emit(progress)
-                
         with open(self.filename, 'w') as f:
-            json.dump(data, f, indent=2)
+            # Same layout as json.dump(..., indent=2) without building the whole document
+            f.write(json.dumps(header, indent=2)[:-2] + ',\n  "messages": [')
+            
+            self.write_lines(f, (
+                ('\n    ' if i == 0 else ',\n    ') + json.dumps({
+                    'timestamp': self.get_relative_timestamp(msg),
+                    'id': msg.arbitration_id,
+                    'data': list(msg.data),
+                    'dlc': len(msg.data),
+                    'direction': msg.direction,
+                    'extended_id': msg.is_extended_id,
+                    'remote_frame': msg.is_remote_frame,
+                    'error_frame': msg.is_error_frame,
+                    'channel': msg.channel
+                }, indent=2).replace('\n', '\n    ')
+                for i, msg in enumerate(self.messages)
+            ))
+                    
+            f.write('\n  ]\n}' if self.messages else ']\n}')
             
     def write_asc(self):
         """Write messages in ASC format (Vector format)"""
@@ -254,20 +273,13 @@ class LogWriter(QThread):
             f.write("Begin Triggerblock Wed Jan 01 12:00:00.000 2025\n")
             
             # Write messages
-            for i, msg in enumerate(self.messages):
-                timestamp_ms = self.get_relative_timestamp(msg) * 1000
-                data_hex = ''.join(f'{b:02X}' for b in msg.data)
-                
-                direction = 'Rx' if msg.direction == 'rx' else 'Tx'
-                extended = 'x' if msg.is_extended_id else ''
-                
-                f.write(f"{timestamp_ms:10.3f} 1  {msg.arbitration_id:X}{extended}             "
-                       f"{direction}   d {len(msg.data)} {data_hex}\n")
-                
-                # Update progress
-                if i % 100 == 0:
-                    progress = int((i / len(self.messages)) * 100)
-                    self.progress_updated.emit(progress)
+            self.write_lines(f, (
+                f"{self.get_relative_timestamp(msg) * 1000:10.3f} 1  "
+                f"{msg.arbitration_id:X}{'x' if msg.is_extended_id else ''}             "
+                f"{'Rx' if msg.direction == 'rx' else 'Tx'}   d {len(msg.data)} "
+                f"{msg.data_hex.replace(' ', '')}\n"
+                for msg in self.messages
+            ))
                     
             f.write("End TriggerBlock\n")
             
@@ -301,19 +313,12 @@ class LogWriter(QThread):
             f.write(";---+--- ------+------ +- +- --+----- +- +- +--- +- -- -- -- -- -- -- --\n")
             
             # Write messages - TRC format uses relative timestamps by design
-            for i, msg in enumerate(self.messages):
-                timestamp_ms = self.get_relative_timestamp(msg) * 1000
-                data_hex = ' '.join(f'{b:02X}' for b in msg.data)
-                
-                direction = 'Rx' if msg.direction == 'rx' else 'Tx'
-                
-                f.write(f"{i+1:8d} {timestamp_ms:10.3f} DT 1 {msg.arbitration_id:08X} {direction} - "
-                       f"{len(msg.data):2d}    {data_hex}\n")
-                
-                # Update progress
-                if i % 100 == 0:
-                    progress = int((i / len(self.messages)) * 100)
-                    self.progress_updated.emit(progress)
+            self.write_lines(f, (
+                f"{i+1:8d} {self.get_relative_timestamp(msg) * 1000:10.3f} DT 1 {msg.arbitration_id:08X} "
+                f"{'Rx' if msg.direction == 'rx' else 'Tx'} - "
+                f"{len(msg.data):2d}    {msg.data_hex}\n"
+                for i, msg in enumerate(self.messages)
+            ))
 
 
 class LogReader(QThread):
@@ -321,6 +326,7 @@ class LogReader(QThread):
     
     progress_updated = pyqtSignal(int)
     message_loaded = pyqtSignal(object)
+    batch_loaded = pyqtSignal(object)  # List[CANMessage], emitted once per file
     finished = pyqtSignal(int)
     error_occurred = pyqtSignal(str)
     
@@ -345,6 +351,7 @@ class LogReader(QThread):
             else:
                 raise ValueError(f"Unsupported file format: {file_ext}")
                 
+            self.batch_loaded.emit(self.messages)
             self.finished.emit(len(self.messages))
             
         except Exception as e:
@@ -515,6 +522,11 @@ class LoggingTab(QWidget):
         self.playback_timer = QTimer()
         self.playback_timer.timeout.connect(self.playback_next_message)
         
+        # Live display buffer: RX/TX slots only enqueue, the GUI drains in batches
+        self.pending_display = deque()
+        self.display_timer = QTimer()
+        self.display_timer.timeout.connect(self.flush_pending_display)
+        
         # Background threads
         self.log_writer = None
         self.log_reader = None
@@ -938,13 +950,14 @@ class LoggingTab(QWidget):
                 messages_to_display.append((i, msg))
                 
         # Populate display efficiently
+        display_lines = []
         for msg_index, msg in messages_to_display:
             # Calculate relative time
             relative_time = msg.timestamp - self.playback_start_time
             time_str = f"{relative_time:.4f}" if msg_index > 0 else "0.0000"
             
             id_str = f"0x{msg.arbitration_id:06X}"
-            data_str = " ".join(f"{b:02X}" for b in msg.data)
+            data_str = msg.data_hex
             direction_str = msg.direction.upper()
             
             # Get message name from SYM parser
@@ -953,9 +966,10 @@ class LoggingTab(QWidget):
             
             # Create line with proper column alignment
             line_text = f"{msg_index+1:4d} {time_str:16s} {msg.bus_number:3d}  {id_str:9s} {name_str:30s} {direction_str:3s} Data {len(msg.data):2d}  {data_str}"
+            display_lines.append((msg, line_text))
             
-            # Add to text widget
-            self.playback_text.add_message_line(msg, line_text)
+        # Add to text widget in a few large appends
+        self.playback_text.add_message_lines(display_lines)
             
         # Update status
         total_messages = len(self.playback_messages)
@@ -1026,34 +1040,35 @@ class LoggingTab(QWidget):
     def setup_connections(self):
         """Set up signal connections"""
         # Connect to multi-network manager signals for logging
-        self.network_manager.message_received.connect(self.on_message_received)
-        self.network_manager.message_transmitted.connect(self.on_message_transmitted)
+        self.network_manager.messages_exchanged.connect(self.on_messages)
         
-    @pyqtSlot(str, object)
-    def on_message_received(self, network_id: str, msg):
-        """Handle received CAN message for logging"""
+    @pyqtSlot(list)
+    def on_messages(self, batch):
+        """Handle a batch of (network_id, message) pairs received or transmitted, for logging"""
         if self.is_logging:
-            self.logged_messages.append(msg)
-            self.update_statistics()
+            for _, msg in batch:
+                self.logged_messages.append(msg)
+                self.pending_display.append((len(self.logged_messages), msg))
             
-            # Also display in playback area for real-time view
-            self.add_message_to_display(msg)
+    def flush_pending_display(self, max_rows: int = 1000):
+        """Drain queued messages into the playback display in one batch"""
+        pending = self.pending_display
+        batch_size = min(len(pending), max_rows)
+        if batch_size:
+            self.add_messages_to_display([pending.popleft() for _ in range(batch_size)])
             
-    @pyqtSlot(str, object)
-    def on_message_transmitted(self, network_id: str, msg):
-        """Handle transmitted CAN message for logging"""
-        if self.is_logging:
-            self.logged_messages.append(msg)
-            self.update_statistics()
-            
-            # Also display in playback area for real-time view
-            self.add_message_to_display(msg)
+    def add_messages_to_display(self, entries):
+        """Add (message number, message) pairs to the playback text display"""
+        self.playback_text.add_message_lines(
+            [(msg, self.format_message_line(msg, msg_num)) for msg_num, msg in entries])
             
     def add_message_to_display(self, msg):
         """Add message to the playback text display"""
-        # Format message for text display with distinct columns and message name
-        msg_num = len(self.logged_messages)
+        line_text = self.format_message_line(msg, len(self.logged_messages))
+        self.playback_text.add_message_line(msg, line_text)
         
+    def format_message_line(self, msg, msg_num: int) -> str:
+        """Format a logged message as a playback display line"""
         # Calculate relative time from log start
         if self.log_start_time is not None:
             relative_time = msg.timestamp - self.log_start_time
@@ -1062,7 +1077,7 @@ class LoggingTab(QWidget):
             time_str = f"{msg.timestamp:.4f}"
             
         id_str = f"0x{msg.arbitration_id:06X}"
-        data_str = " ".join(f"{b:02X}" for b in msg.data)
+        data_str = msg.data_hex
         direction_str = msg.direction.upper()
         
         # Get message name from SYM parser
@@ -1071,10 +1086,7 @@ class LoggingTab(QWidget):
         
         # Create line with proper column alignment including bus number and message name
         # Format: Number  Time            Bus  ID        MessageName      Dir Type DLC  Data
-        line_text = f"{msg_num:4d} {time_str:16s} {msg.bus_number:3d}  {id_str:9s} {name_str:30s} {direction_str:3s} Data {len(msg.data):2d}  {data_str}"
-        
-        # Add to text widget
-        self.playback_text.add_message_line(msg, line_text)
+        return f"{msg_num:4d} {time_str:16s} {msg.bus_number:3d}  {id_str:9s} {name_str:30s} {direction_str:3s} Data {len(msg.data):2d}  {data_str}"
         
     def start_logging(self):
         """Start logging CAN messages"""
@@ -1086,11 +1098,15 @@ class LoggingTab(QWidget):
         # Clear previous log and set start time
         self.logged_messages.clear()
         self.log_start_time = time.time()  # Record start time for relative timestamps
+        self.pending_display.clear()
         self.playback_text.clear_messages()
+        self.display_timer.start(16)  # Drain queued rows about once per frame
         
     def stop_logging(self):
         """Stop logging CAN messages"""
         self.is_logging = False
+        self.display_timer.stop()
+        self.flush_pending_display(max_rows=len(self.pending_display))
         self.start_log_btn.setEnabled(True)
         self.stop_log_btn.setEnabled(False)
         self.log_status_label.setText(f"Status: Stopped ({len(self.logged_messages)} messages)")
@@ -1098,6 +1114,7 @@ class LoggingTab(QWidget):
     def clear_log(self):
         """Clear logged messages"""
         self.logged_messages.clear()
+        self.pending_display.clear()
         self.log_start_time = None  # Reset start time
         self.playback_text.clear_messages()
         self.log_status_label.setText("Status: Cleared")
@@ -79,7 +79,6 @@ class MainWindow(QMainWindow):
         # Symbol files are now managed per-network in the Network Manager
         
         # Connect multi-network manager signals
-        self.multi_network_manager.message_received.connect(self.on_multi_network_message_received)
         self.multi_network_manager.error_occurred.connect(self.on_multi_network_error)
         
     def setup_menu(self):
@@ -231,7 +230,7 @@ class MainWindow(QMainWindow):
             if not network.is_connected() and available_hardware:
                 # Try to assign the first available hardware
                 hardware = available_hardware.pop(0)
-                hardware_key = f"{hardware.interface_type}:{hardware.channel}"
+                hardware_key = hardware.key
                 if self.multi_network_manager.connect_network(network_id, hardware_key):
                     connected_count += 1
                     
@@ -247,7 +246,7 @@ class MainWindow(QMainWindow):
         
     def refresh_hardware(self):
         """Refresh hardware interface discovery"""
-        self.multi_network_manager.discover_hardware()
+        self.multi_network_manager.discover_hardware(force=True)
         self.status_bar.showMessage("Hardware interfaces refreshed", 2000)
             
     def update_status(self):
@@ -303,12 +302,6 @@ class MainWindow(QMainWindow):
         
         about_dialog.exec()
         
-    def on_multi_network_message_received(self, network_id: str, message):
-        """Handle messages received from multi-network manager"""
-        # Forward to existing tabs that expect CAN messages
-        # This provides integration between new multi-network system and existing tabs
-        pass  # For now, existing tabs use the legacy interface
-        
     def on_multi_network_error(self, network_id: str, error: str):
         """Handle errors from multi-network manager"""
         self.status_bar.showMessage(f"Network {network_id}: {error}", 5000)
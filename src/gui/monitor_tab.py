@@ -2,9 +2,10 @@
 Monitor Tab - Real-time CAN message monitoring
 """
 
+import re
 import time
 from datetime import datetime
-from typing import Dict, List
+from typing import Dict, FrozenSet, List, Optional, Tuple
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget, 
                              QTableWidgetItem, QHeaderView, QPushButton, QLabel,
                              QLineEdit, QCheckBox, QComboBox, QSplitter, QTextEdit,
@@ -18,6 +19,45 @@ from utils.sym_parser import SymParser
 from utils.message_decoder import MessageDecoder
 
 
+# ID filter tokens are separated by commas and/or whitespace
+_ID_FILTER_SPLIT = re.compile(r'[\s,]+')
+
+# Ranges up to this many IDs are expanded into the lookup set
+_MAX_EXPANDED_RANGE = 4096
+
+
+def parse_id_filter(text: str) -> Optional[Tuple[FrozenSet[int], Tuple[Tuple[int, int], ...]]]:
+    """Parse an ID filter like "0x123, 291, 0x100-0x1FF" into (id set, wide ranges)
+    
+    IDs are decimal or 0x-prefixed hex; unparseable tokens and negative IDs are ignored.
+    Returns None when the filter is empty or "*" (everything passes).
+    """
+    text = text.strip()
+    if not text or text == '*':
+        return None
+        
+    ids = set()
+    ranges = []
+    for token in _ID_FILTER_SPLIT.split(text):
+        try:
+            if '-' in token:
+                low, high = (int(part, 0) for part in token.split('-', 1))
+                if low > high:
+                    low, high = high, low
+                if low < 0:
+                    continue
+                if high - low < _MAX_EXPANDED_RANGE:
+                    ids.update(range(low, high + 1))
+                else:
+                    ranges.append((low, high))
+            elif token:
+                ids.add(int(token, 0))
+        except ValueError:
+            continue
+            
+    return frozenset(ids), tuple(ranges)
+
+
 class MessageTreeWidget(QTreeWidget):
     """Expandable tree widget for CAN messages with signal details"""
     
@@ -99,9 +139,51 @@ class MessageTreeWidget(QTreeWidget):
         
     def add_message(self, msg: CANMessage):
         """Add a new CAN message to the tree"""
+        stats = self._update_message_stats(msg)
+        
+        # Check if message ID already exists in tree
+        if stats['item'] is not None:
+            # Update existing item
+            self.update_tree_item(stats['item'], msg, stats)
+        else:
+            # Add new top-level item
+            item = QTreeWidgetItem(self)
+            stats['item'] = item
+            self.update_tree_item(item, msg, stats)
+            
+    def add_messages(self, messages: List[CANMessage]):
+        """Add a batch of CAN messages with a single layout pass"""
+        sorting_enabled = self.isSortingEnabled()
+        self.setUpdatesEnabled(False)
+        self.setSortingEnabled(False)
+        self.blockSignals(True)
+        try:
+            # Statistics see every message, but each row is redrawn once with its latest frame
+            latest = {}
+            for msg in messages:
+                stats = self._update_message_stats(msg)
+                latest[id(stats)] = (stats, msg)
+                
+            new_items = []
+            for stats, msg in latest.values():
+                if stats['item'] is None:
+                    # Build detached and insert all new rows at once below
+                    stats['item'] = QTreeWidgetItem()
+                    new_items.append(stats['item'])
+                self.update_tree_item(stats['item'], msg, stats)
+                
+            if new_items:
+                self.addTopLevelItems(new_items)
+        finally:
+            self.blockSignals(False)
+            self.setSortingEnabled(sorting_enabled)
+            self.setUpdatesEnabled(True)
+            
+    def _update_message_stats(self, msg: CANMessage) -> Dict:
+        """Update count and period statistics for a message and return them"""
         # Use combination of bus number and message ID as unique key
         msg_key = f"bus{msg.bus_number}_id{msg.arbitration_id}"
-        current_time = time.time()
+        current_time = msg.timestamp  # Frame time, so batched updates keep true periods
         
         # Update statistics
         if msg_key not in self.message_stats:
@@ -121,15 +203,7 @@ class MessageTreeWidget(QTreeWidget):
             stats['period'] = period * 1000  # Convert to milliseconds
         stats['last_time'] = current_time
         
-        # Check if message ID already exists in tree
-        if stats['item'] is not None:
-            # Update existing item
-            self.update_tree_item(stats['item'], msg, stats)
-        else:
-            # Add new top-level item
-            item = QTreeWidgetItem(self)
-            stats['item'] = item
-            self.update_tree_item(item, msg, stats)
+        return stats
                 
     def update_tree_item(self, item: QTreeWidgetItem, msg: CANMessage, stats: Dict):
         """Update a tree item with message data"""
@@ -157,7 +231,7 @@ class MessageTreeWidget(QTreeWidget):
         item.setText(3, str(len(msg.data)))
         
         # Data (format as hex bytes)
-        data_str = " ".join(f"{byte:02X}" for byte in msg.data)
+        data_str = msg.data_hex
         item.setText(4, data_str)
         
         # Direction
@@ -347,7 +421,7 @@ class MessageTableWidget(QTableWidget):
         self.setItem(row, 3, QTableWidgetItem(str(len(msg.data))))
         
         # Data (format as hex bytes)
-        data_str = " ".join(f"{byte:02X}" for byte in msg.data)
+        data_str = msg.data_hex
         self.setItem(row, 4, QTableWidgetItem(data_str))
         
         # Direction
@@ -386,12 +460,18 @@ class MonitorTab(QWidget):
         self.network_manager = network_manager
         self.setup_ui()
         self.setup_connections()
+        self.apply_filters()
         
         # Auto-scroll and update settings
         self.auto_scroll = True
         self.max_messages = 1000
         self.monitoring_active = False
         
+        # Messages queued by the RX/TX slots, applied to the tree at ~30 FPS
+        self.pending_messages = []
+        self.flush_timer = QTimer()
+        self.flush_timer.timeout.connect(self.flush_pending_messages)
+        
     def setup_ui(self):
         """Set up the monitor tab UI"""
         layout = QVBoxLayout(self)
@@ -525,8 +605,8 @@ class MonitorTab(QWidget):
         """Set up signal connections"""
         # Use QueuedConnection for thread-safe signal handling
         from PyQt6.QtCore import Qt
-        self.network_manager.message_received.connect(self.on_message_received, Qt.ConnectionType.QueuedConnection)
-        self.network_manager.message_transmitted.connect(self.on_message_transmitted, Qt.ConnectionType.QueuedConnection)
+        self.network_manager.messages_received.connect(self.on_messages_received, Qt.ConnectionType.QueuedConnection)
+        self.network_manager.messages_transmitted.connect(self.on_messages_transmitted, Qt.ConnectionType.QueuedConnection)
         self.network_manager.network_state_changed.connect(self.on_network_state_changed, Qt.ConnectionType.QueuedConnection)
         
         # Update symbol status when networks change
@@ -535,99 +615,82 @@ class MonitorTab(QWidget):
         # Initial symbol status update
         self.update_symbol_status()
         
+    @pyqtSlot(list)
+    def on_messages_received(self, batch):
+        """Handle a batch of (network_id, message) pairs from multi-network manager"""
+        if self.monitoring_active:
+            self.pending_messages.extend(msg for _, msg in batch if self.passes_filters(msg))
+            
     @pyqtSlot(str, object)
     def on_message_received(self, network_id: str, msg: CANMessage):
         """Handle received CAN message from multi-network manager"""
         if self.monitoring_active and self.passes_filters(msg):
-            # Store current selection and scroll position
-            current_item = self.message_table.currentItem()
-            
-            self.message_table.add_message(msg)
-            
-            # Handle auto-scroll and selection preservation
-            if self.auto_scroll:
-                if self.smart_scroll_cb.isChecked():
-                    # Smart scroll: only auto-scroll if no manual selection or user is at bottom
-                    should_auto_scroll = (current_item is None or 
-                                        (self.message_table.topLevelItemCount() > 0 and
-                                         current_item == self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 2)))
-                    
-                    if should_auto_scroll and self.message_table.topLevelItemCount() > 0:
-                        last_item = self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 1)
-                        self.message_table.scrollToItem(last_item)
-                    else:
-                        # Restore selection if smart scroll is preventing auto-scroll
-                        if current_item is not None and current_item.parent() is None:
-                            try:
-                                self.message_table.setCurrentItem(current_item)
-                            except:
-                                pass
-                else:
-                    # Traditional auto-scroll: always scroll to bottom
-                    if self.message_table.topLevelItemCount() > 0:
-                        last_item = self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 1)
-                        self.message_table.scrollToItem(last_item)
-            else:
-                # No auto-scroll: always preserve selection
-                if current_item is not None and current_item.parent() is None:
-                    try:
-                        self.message_table.setCurrentItem(current_item)
-                    except:
-                        pass
-                
-            # Limit number of messages
-            if self.message_table.topLevelItemCount() > self.max_messages:
-                # Remove oldest message (first item)
-                item = self.message_table.takeTopLevelItem(0)
-                if item:
-                    # Remove from stats tracking
-                    msg_id = None
-                    for mid, stats in self.message_table.message_stats.items():
-                        if stats.get('item') == item:
-                            msg_id = mid
-                            break
-                    if msg_id:
-                        del self.message_table.message_stats[msg_id]
+            # Queue only; flush_pending_messages applies the batch on the next tick
+            self.pending_messages.append(msg)
                 
-    @pyqtSlot(str, object)
-    def on_message_transmitted(self, network_id: str, msg: CANMessage):
-        """Handle transmitted CAN message from multi-network manager"""
-        if self.monitoring_active and self.passes_filters(msg):
-            # Store current selection
-            current_item = self.message_table.currentItem()
+    @pyqtSlot(list)
+    def on_messages_transmitted(self, batch):
+        """Handle a batch of (network_id, message) pairs transmitted by multi-network manager"""
+        if self.monitoring_active:
+            self.pending_messages.extend(msg for _, msg in batch if self.passes_filters(msg))
             
-            self.message_table.add_message(msg)
+    def flush_pending_messages(self):
+        """Apply all queued messages to the tree in one update"""
+        if not self.pending_messages:
+            return
             
-            # Handle auto-scroll and selection preservation
-            if self.auto_scroll:
-                if self.smart_scroll_cb.isChecked():
-                    # Smart scroll: only auto-scroll if no manual selection or user is at bottom
-                    should_auto_scroll = (current_item is None or 
-                                        (self.message_table.topLevelItemCount() > 0 and
-                                         current_item == self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 2)))
-                    
-                    if should_auto_scroll and self.message_table.topLevelItemCount() > 0:
-                        last_item = self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 1)
-                        self.message_table.scrollToItem(last_item)
-                    else:
-                        # Restore selection if smart scroll is preventing auto-scroll
-                        if current_item is not None and current_item.parent() is None:
-                            try:
-                                self.message_table.setCurrentItem(current_item)
-                            except:
-                                pass
+        messages = self.pending_messages
+        self.pending_messages = []
+        
+        # Store current selection and scroll position
+        current_item = self.message_table.currentItem()
+        
+        self.message_table.add_messages(messages)
+        
+        # Handle auto-scroll and selection preservation
+        if self.auto_scroll:
+            if self.smart_scroll_cb.isChecked():
+                # Smart scroll: only auto-scroll if no manual selection or user is at bottom
+                should_auto_scroll = (current_item is None or 
+                                    (self.message_table.topLevelItemCount() > 0 and
+                                     current_item == self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 2)))
+                
+                if should_auto_scroll and self.message_table.topLevelItemCount() > 0:
+                    last_item = self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 1)
+                    self.message_table.scrollToItem(last_item)
                 else:
-                    # Traditional auto-scroll: always scroll to bottom
-                    if self.message_table.topLevelItemCount() > 0:
-                        last_item = self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 1)
-                        self.message_table.scrollToItem(last_item)
+                    # Restore selection if smart scroll is preventing auto-scroll
+                    if current_item is not None and current_item.parent() is None:
+                        try:
+                            self.message_table.setCurrentItem(current_item)
+                        except:
+                            pass
             else:
-                # No auto-scroll: always preserve selection
-                if current_item is not None and current_item.parent() is None:
-                    try:
-                        self.message_table.setCurrentItem(current_item)
-                    except:
-                        pass
+                # Traditional auto-scroll: always scroll to bottom
+                if self.message_table.topLevelItemCount() > 0:
+                    last_item = self.message_table.topLevelItem(self.message_table.topLevelItemCount() - 1)
+                    self.message_table.scrollToItem(last_item)
+        else:
+            # No auto-scroll: always preserve selection
+            if current_item is not None and current_item.parent() is None:
+                try:
+                    self.message_table.setCurrentItem(current_item)
+                except:
+                    pass
+            
+        # Limit number of messages
+        while self.message_table.topLevelItemCount() > self.max_messages:
+            # Remove oldest message (first item)
+            item = self.message_table.takeTopLevelItem(0)
+            if item:
+                # Remove from stats tracking
+                msg_id = None
+                for mid, stats in self.message_table.message_stats.items():
+                    if stats.get('item') == item:
+                        msg_id = mid
+                        break
+                if msg_id:
+                    del self.message_table.message_stats[msg_id]
                 
     @pyqtSlot(str, object)
     def on_network_state_changed(self, network_id: str, state):
@@ -647,15 +710,19 @@ class MonitorTab(QWidget):
         self.monitoring_active = True
         self.start_btn.setEnabled(False)
         self.stop_btn.setEnabled(True)
+        self.flush_timer.start(33)
         
     def stop_monitoring(self):
         """Stop message monitoring"""
         self.monitoring_active = False
+        self.flush_timer.stop()
+        self.flush_pending_messages()
         self.start_btn.setEnabled(True)
         self.stop_btn.setEnabled(False)
         
     def clear_messages(self):
         """Clear all messages"""
+        self.pending_messages = []
         self.message_table.clear_messages()
         self.details_text.clear()
         
@@ -668,34 +735,34 @@ class MonitorTab(QWidget):
         self.max_messages = value
         
     def apply_filters(self):
-        """Apply message filters"""
-        # This would implement filtering logic
-        # For now, just a placeholder
-        pass
+        """Compile the filter widgets into lookups used by passes_filters"""
+        # ID filter: a set keyed on the integer arbitration ID, plus any wide ranges
+        self.id_filter = parse_id_filter(self.id_filter_edit.text())
+        
+        # Direction filter: the one direction allowed, or None for all
+        self.direction_filter = {"RX Only": 'rx', "TX Only": 'tx'}.get(self.direction_combo.currentText())
+        
+        # Data filter (basic implementation): substring of the hex payload
+        data_filter = self.data_filter_edit.text().strip()
+        self.data_filter = data_filter.upper() if data_filter and data_filter != "*" else None
         
     def passes_filters(self, msg: CANMessage) -> bool:
         """Check if message passes current filters"""
         # ID filter
-        id_filter = self.id_filter_edit.text().strip()
-        if id_filter and id_filter != "*":
-            # Simple implementation - could be enhanced
-            if not str(msg.arbitration_id) in id_filter and not f"0x{msg.arbitration_id:X}" in id_filter:
+        if self.id_filter is not None:
+            ids, ranges = self.id_filter
+            arbitration_id = msg.arbitration_id
+            if arbitration_id not in ids and not any(low <= arbitration_id <= high for low, high in ranges):
                 return False
                 
         # Direction filter
-        direction_filter = self.direction_combo.currentText()
-        if direction_filter == "RX Only" and msg.direction != 'rx':
+        if self.direction_filter is not None and msg.direction != self.direction_filter:
             return False
-        elif direction_filter == "TX Only" and msg.direction != 'tx':
+            
+        # Data filter
+        if self.data_filter is not None and self.data_filter not in msg.data_hex:
             return False
             
-        # Data filter (basic implementation)
-        data_filter = self.data_filter_edit.text().strip()
-        if data_filter and data_filter != "*":
-            data_hex = " ".join(f"{byte:02X}" for byte in msg.data)
-            if data_filter.upper() not in data_hex:
-                return False
-                
         return True
         
     def on_message_selected(self):
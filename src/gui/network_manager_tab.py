@@ -178,8 +178,8 @@ class NetworkManagerTab(QWidget):
     
     # Signals
     network_selected = pyqtSignal(str)  # network_id
-    message_received = pyqtSignal(str, object)  # network_id, CANMessage
-    message_transmitted = pyqtSignal(str, object)  # network_id, CANMessage
+    messages_received = pyqtSignal(list)  # [(network_id, CANMessage), ...]
+    messages_transmitted = pyqtSignal(list)  # [(network_id, CANMessage), ...]
     
     def __init__(self):
         super().__init__()
@@ -415,8 +415,8 @@ class NetworkManagerTab(QWidget):
         self.network_manager.network_added.connect(self.on_network_added)
         self.network_manager.network_removed.connect(self.on_network_removed)
         self.network_manager.network_state_changed.connect(self.on_network_state_changed)
-        self.network_manager.message_received.connect(self.message_received.emit)
-        self.network_manager.message_transmitted.connect(self.message_transmitted.emit)
+        self.network_manager.messages_received.connect(self.messages_received.emit)
+        self.network_manager.messages_transmitted.connect(self.messages_transmitted.emit)
         self.network_manager.error_occurred.connect(self.on_error_occurred)
         self.network_manager.hardware_discovered.connect(self.on_hardware_discovered)
         
@@ -451,8 +451,9 @@ class NetworkManagerTab(QWidget):
         if network:
             dialog = NetworkConfigDialog(network.config, parent=self)
             if dialog.exec() == QDialog.DialogCode.Accepted:
-                # Update network configuration
+                # Update network configuration (the bus number may have changed)
                 network.config = dialog.get_config()
+                self.network_manager.reindex_networks()
                 self.refresh_network_list()
                 
     def remove_network(self):
@@ -539,8 +540,8 @@ class NetworkManagerTab(QWidget):
                 self.refresh_network_list()
                 self.update_network_details()
                 
-                # Auto-save configuration
-                self.network_manager.save_configuration()
+                # Auto-save configuration (debounced)
+                self.network_manager.schedule_save()
                 
     def remove_symbol_file(self):
         """Remove symbol file from selected network"""
@@ -563,8 +564,8 @@ class NetworkManagerTab(QWidget):
                 self.refresh_network_list()
                 self.update_network_details()
                 
-                # Auto-save configuration
-                self.network_manager.save_configuration()
+                # Auto-save configuration (debounced)
+                self.network_manager.schedule_save()
     
     def on_hardware_selection_changed(self):
         """Handle hardware selection change"""
@@ -613,7 +614,7 @@ class NetworkManagerTab(QWidget):
         
     def refresh_hardware(self):
         """Refresh hardware interface discovery"""
-        self.network_manager.discover_hardware()
+        self.network_manager.discover_hardware(force=True)
         
     def save_configuration(self):
         """Save network configuration"""
@@ -719,7 +720,7 @@ class NetworkManagerTab(QWidget):
                 
             # Hardware
             if network.hardware:
-                item.setText(3, f"{network.hardware.interface_type}:{network.hardware.channel}")
+                item.setText(3, network.hardware.key)
             else:
                 item.setText(3, "None")
                 
@@ -764,7 +765,7 @@ class NetworkManagerTab(QWidget):
                     
                 # Update hardware column if needed
                 if network.hardware:
-                    item.setText(3, f"{network.hardware.interface_type}:{network.hardware.channel}")
+                    item.setText(3, network.hardware.key)
                 else:
                     item.setText(3, "None")
                     
@@ -790,7 +791,7 @@ class NetworkManagerTab(QWidget):
             self.hardware_table.setItem(row, 2, QTableWidgetItem(interface.name))
             
             # Check if this interface is bound to a network
-            hardware_key = f"{interface.interface_type}:{interface.channel}"
+            hardware_key = interface.key
             
             if hardware_key in bound_interfaces:
                 # Interface is bound to a network
@@ -831,8 +832,7 @@ class NetworkManagerTab(QWidget):
         for network_id, network in self.network_manager.get_all_networks().items():
             if network.is_connected() and network.connection and network.connection.hardware:
                 # Get the hardware key from the connection's hardware interface
-                hardware = network.connection.hardware
-                hardware_key = f"{hardware.interface_type}:{hardware.channel}"
+                hardware_key = network.connection.hardware.key
                 bound_interfaces[hardware_key] = network.config.name
                 
         return bound_interfaces
@@ -845,8 +845,7 @@ class NetworkManagerTab(QWidget):
         
         # Get the hardware key for the currently selected network if connected
         if current_network and current_network.is_connected() and current_network.connection and current_network.connection.hardware:
-            hardware = current_network.connection.hardware
-            current_network_hardware = f"{hardware.interface_type}:{hardware.channel}"
+            current_network_hardware = current_network.connection.hardware.key
         
         bound_interfaces = self.get_bound_interfaces()
         
@@ -856,8 +855,8 @@ class NetworkManagerTab(QWidget):
         
         for interface in interfaces:
             if interface.available:
-                hardware_key = f"{interface.interface_type}:{interface.channel}"
-                base_text = f"{interface.name} ({interface.interface_type}:{interface.channel})"
+                hardware_key = interface.key
+                base_text = f"{interface.name} ({hardware_key})"
                 
                 # Check if this interface is bound to a network
                 if hardware_key in bound_interfaces:
@@ -939,7 +938,7 @@ class NetworkManagerTab(QWidget):
                 
             if network.hardware:
                 self.network_hardware_label.setText(
-                    f"{network.hardware.name} ({network.hardware.interface_type}:{network.hardware.channel})"
+                    f"{network.hardware.name} ({network.hardware.key})"
                 )
             else:
                 self.network_hardware_label.setText("None")
@@ -6,6 +6,7 @@ import time
 import os
 from typing import Dict, List, Optional, Tuple
 from collections import deque
+import numpy as np
 import pyqtgraph as pg
 from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QPushButton, QLabel,
                              QLineEdit, QCheckBox, QComboBox, QSplitter, QTextEdit,
@@ -238,13 +239,22 @@ class SignalData:
         self.can_id = can_id
         self.bus_number = bus_number
         self.color = color
-        self.times = deque(maxlen=max_points)  # Configurable buffer size
-        self.values = deque(maxlen=max_points)
         self.enabled = True
         self.y_axis = 'left'  # 'left' or 'right' for multiple axes
         self.plot_item = None  # pyqtgraph plot item
         
+        # Ring buffers written twice (at i and i + max_points) so the newest
+        # max_points samples are always one contiguous, chronological slice.
+        # Values are float32 (ample for display); times stay float64 so long
+        # captures keep sub-millisecond resolution in plots and CSV export.
+        self.max_points = max_points  # Configurable buffer size
+        self._time_buffer = np.zeros(2 * max_points)
+        self._value_buffer = np.zeros(2 * max_points, dtype=np.float32)
+        self._write_index = 0
+        self._length = 0
+        
         # Statistics tracking
+        self.current_value = 0.0
         self.min_value = float('inf')
         self.max_value = float('-inf')
         self.sum_values = 0.0
@@ -257,10 +267,15 @@ class SignalData:
         
     def add_point(self, timestamp: float, value: float):
         """Add a new data point with statistics and rate tracking"""
-        self.times.append(timestamp)
-        self.values.append(value)
-        
-        # Update statistics
+        index = self._write_index
+        mirror = index + self.max_points
+        self._time_buffer[index] = self._time_buffer[mirror] = timestamp
+        self._value_buffer[index] = self._value_buffer[mirror] = value
+        self._write_index = (index + 1) % self.max_points
+        self._length = min(self._length + 1, self.max_points)
+        
+        # Update statistics (exact value kept, since the buffer is float32)
+        self.current_value = value
         self.min_value = min(self.min_value, value)
         self.max_value = max(self.max_value, value)
         self.sum_values += value
@@ -279,7 +294,7 @@ class SignalData:
         if self.point_count == 0:
             return {'current': 0, 'min': 0, 'max': 0, 'avg': 0, 'rms': 0, 'rate': 0}
             
-        current = list(self.values)[-1] if self.values else 0
+        current = self.current_value
         avg = self.sum_values / self.point_count
         rms = (self.sum_squares / self.point_count) ** 0.5
         
@@ -298,14 +313,43 @@ class SignalData:
             'rate': rate
         }
         
+    @property
+    def times(self) -> np.ndarray:
+        """Buffered timestamps, oldest first (a view into the ring buffer)"""
+        start = (self._write_index - self._length) % self.max_points
+        return self._time_buffer[start:start + self._length]
+        
+    @property
+    def values(self) -> np.ndarray:
+        """Buffered values, oldest first (a view into the ring buffer)"""
+        start = (self._write_index - self._length) % self.max_points
+        return self._value_buffer[start:start + self._length]
+        
     def get_data_arrays(self):
         """Get data as arrays for plotting"""
-        return list(self.times), list(self.values)
+        # Copies, since the plot item keeps the arrays it is given
+        return self.times.copy(), self.values.copy()
+        
+    def resize(self, max_points: int):
+        """Change the buffer size, keeping the newest points"""
+        times, values = self.get_data_arrays()
+        times, values = times[-max_points:], values[-max_points:]
+        
+        self.max_points = max_points
+        self._time_buffer = np.zeros(2 * max_points)
+        self._value_buffer = np.zeros(2 * max_points, dtype=np.float32)
+        self._length = len(times)
+        self._write_index = self._length % max_points
+        
+        self._time_buffer[:self._length] = times
+        self._value_buffer[:self._length] = values
+        self._time_buffer[max_points:max_points + self._length] = times
+        self._value_buffer[max_points:max_points + self._length] = values
         
     def clear_data(self):
         """Clear all data points and reset statistics"""
-        self.times.clear()
-        self.values.clear()
+        self._write_index = 0
+        self._length = 0
         
         # Reset statistics
         self.min_value = float('inf')
@@ -669,7 +713,7 @@ class PlottingTab(QWidget):
     def setup_connections(self):
         """Set up signal connections"""
         # Connect to CAN manager for real-time data
-        self.network_manager.message_received.connect(self.on_message_received, Qt.ConnectionType.QueuedConnection)
+        self.network_manager.messages_received.connect(self.on_messages_received, Qt.ConnectionType.QueuedConnection)
         
         # Update symbol status when networks change
         self.network_manager.network_state_changed.connect(self.update_symbol_status, Qt.ConnectionType.QueuedConnection)
@@ -830,6 +874,15 @@ class PlottingTab(QWidget):
                 
         self.update_stats()
         
+    @pyqtSlot(list)
+    def on_messages_received(self, batch):
+        """Handle a batch of (network_id, message) pairs for plotting"""
+        if not self.is_recording:
+            return
+            
+        for network_id, msg in batch:
+            self.on_message_received(network_id, msg)
+            
     @pyqtSlot(str, object)
     def on_message_received(self, network_id: str, msg: CANMessage):
         """Handle received CAN message for plotting - optimized for performance"""
@@ -892,7 +945,7 @@ class PlottingTab(QWidget):
             return
             
         for signal_data in self.signals.values():
-            if signal_data.plot_item and signal_data.times:
+            if signal_data.plot_item and len(signal_data.times):
                 times, values = signal_data.get_data_arrays()
                 signal_data.plot_item.setData(times, values)
                 
@@ -926,7 +979,7 @@ class PlottingTab(QWidget):
         for signal_key in self.pending_updates:
             if signal_key in self.signals:
                 signal_data = self.signals[signal_key]
-                if signal_data.plot_item and signal_data.times:
+                if signal_data.plot_item and len(signal_data.times):
                     times, values = signal_data.get_data_arrays()
                     signal_data.plot_item.setData(times, values)
         
@@ -959,8 +1012,8 @@ class PlottingTab(QWidget):
         # Get latest time from all signals
         latest_times = []
         for signal_data in self.signals.values():
-            if signal_data.times:
-                latest_times.append(max(signal_data.times))
+            if len(signal_data.times):
+                latest_times.append(signal_data.times.max())
                 
         if latest_times:
             max_time = max(latest_times)
@@ -992,7 +1045,7 @@ class PlottingTab(QWidget):
             # Get time range
             all_times = []
             for signal_data in self.signals.values():
-                if signal_data.times:
+                if len(signal_data.times):
                     all_times.extend(signal_data.times)
             
             if all_times:
@@ -1005,8 +1058,8 @@ class PlottingTab(QWidget):
                 
                 # Set horizontal cursor to middle of first signal's range
                 first_signal = next(iter(self.signals.values()))
-                if first_signal.values:
-                    mid_value = (min(first_signal.values) + max(first_signal.values)) / 2
+                if len(first_signal.values):
+                    mid_value = (first_signal.values.min() + first_signal.values.max()) / 2
                     self.h_cursor.setPos(mid_value)
         
     def update_measurements(self):
@@ -1091,8 +1144,8 @@ class PlottingTab(QWidget):
                 seconds = 30  # Default
             
             # Set fixed time window
-            if self.signals and any(signal.times for signal in self.signals.values()):
-                max_time = max(max(signal.times) for signal in self.signals.values() if signal.times)
+            if self.signals and any(len(signal.times) for signal in self.signals.values()):
+                max_time = max(signal.times.max() for signal in self.signals.values() if len(signal.times))
                 self.plot_widget.setXRange(max_time - seconds, max_time)
             
     def on_buffer_size_changed(self, size_text: str):
@@ -1106,9 +1159,7 @@ class PlottingTab(QWidget):
         
         # Update existing signals (this will truncate if smaller)
         for signal_data in self.signals.values():
-            # Create new deques with new size
-            signal_data.times = deque(signal_data.times, maxlen=new_size)
-            signal_data.values = deque(signal_data.values, maxlen=new_size)
+            signal_data.resize(new_size)
             
         print(f"📊 Buffer size changed to {size_text} ({new_size} points)")
         
@@ -1131,7 +1182,7 @@ class PlottingTab(QWidget):
         # Get all signal values for auto-scaling
         all_values = []
         for signal_data in self.signals.values():
-            if signal_data.values and signal_data.enabled:
+            if len(signal_data.values) and signal_data.enabled:
                 all_values.extend(list(signal_data.values))
         
         # Scale main plot to fit all visible signals
@@ -1369,7 +1420,7 @@ class PlottingTab(QWidget):
         if self.signals:
             all_times = []
             for signal_data in self.signals.values():
-                if signal_data.times:
+                if len(signal_data.times):
                     all_times.extend(signal_data.times)
             
             if all_times:
@@ -1738,13 +1789,13 @@ class PlottingTab(QWidget):
         # Update all plots with trace data
         plots_updated = 0
         for signal_key, signal_data in self.signals.items():
-            if signal_data.plot_item and signal_data.times:
+            if signal_data.plot_item and len(signal_data.times):
                 times, values = signal_data.get_data_arrays()
                 signal_data.plot_item.setData(times, values)
                 plots_updated += 1
                 print(f"Updated plot for {signal_key}: {len(times)} points")
             else:
-                print(f"No plot item or data for {signal_key}: plot_item={signal_data.plot_item is not None}, times={len(signal_data.times) if signal_data.times else 0}")
+                print(f"No plot item or data for {signal_key}: plot_item={signal_data.plot_item is not None}, times={len(signal_data.times)}")
                 
         self.update_stats()
         print(f"✅ Updated {plots_updated} plots with trace data (total points added: {points_added})")
@@ -1784,12 +1835,12 @@ class PlottingTab(QWidget):
             self.add_signal_to_plot(signal_data)
         
         # Update the plot
-        if signal_data.plot_item and signal_data.times:
+        if signal_data.plot_item and len(signal_data.times):
             times, values = signal_data.get_data_arrays()
             signal_data.plot_item.setData(times, values)
             print(f"Updated plot with {len(times)} points for {signal_data.signal_name}")
         else:
-            print(f"No plot item or no data for {signal_data.signal_name}: plot_item={signal_data.plot_item is not None}, data_points={len(signal_data.times) if signal_data.times else 0}")
+            print(f"No plot item or no data for {signal_data.signal_name}: plot_item={signal_data.plot_item is not None}, data_points={len(signal_data.times)}")
 
 
 class SignalManagementDialog(QDialog):
@@ -9,7 +9,7 @@ from PyQt6.QtWidgets import (QWidget, QVBoxLayout, QHBoxLayout, QTableWidget,
                              QLineEdit, QCheckBox, QComboBox, QSplitter, QTextEdit,
                              QGroupBox, QSpinBox, QMessageBox, QFileDialog, QTreeWidget,
                              QTreeWidgetItem, QTabWidget)
-from PyQt6.QtCore import Qt, QTimer, pyqtSlot, pyqtSignal
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot, pyqtSignal, QThread
 from PyQt6.QtGui import QFont, QColor
 
 # Network manager will be passed in constructor
@@ -17,6 +17,29 @@ from canbus.messages import CANMessage
 from utils.sym_parser import SymParser, SymMessage, SymEnum
 
 
+class SymLoader(QThread):
+    """Background thread for parsing SYM files"""
+    
+    loaded = pyqtSignal(object)  # SymParser
+    error_occurred = pyqtSignal(str)
+    
+    def __init__(self, filename: str):
+        super().__init__()
+        self.filename = filename
+        
+    def run(self):
+        """Parse the SYM file"""
+        try:
+            parser = SymParser()
+            if parser.parse_file(self.filename):
+                self.loaded.emit(parser)
+            else:
+                self.error_occurred.emit("Failed to parse SYM file")
+                
+        except Exception as e:
+            self.error_occurred.emit(f"Failed to load SYM file: {str(e)}")
+
+
 class MessageTreeWidget(QTreeWidget):
     """Tree widget for displaying SYM message structure"""
     
@@ -165,6 +188,7 @@ class SymbolsTab(QWidget):
         # SYM parser
         self.sym_parser = None
         self.loaded_file = None
+        self.sym_loader = None  # Background SYM parsing thread
         
         # Message cache for decoding
         self.message_cache = {}
@@ -300,8 +324,7 @@ class SymbolsTab(QWidget):
         
     def setup_connections(self):
         """Set up signal connections"""
-        self.network_manager.message_received.connect(self.on_message_received)
-        self.network_manager.message_transmitted.connect(self.on_message_transmitted)
+        self.network_manager.messages_exchanged.connect(self.on_messages)
         
     def load_sym_file(self):
         """Load SYM file"""
@@ -310,35 +333,42 @@ class SymbolsTab(QWidget):
         )
         
         if filename:
-            try:
-                # Load SYM file
-                self.sym_parser = SymParser()
-                success = self.sym_parser.parse_file(filename)
-                
-                if success:
-                    self.loaded_file = filename
-                    
-                    # Update UI
-                    self.load_sym_btn.setEnabled(False)
-                    self.unload_sym_btn.setEnabled(True)
-                    self.sym_file_label.setText(f"Loaded: {os.path.basename(filename)}")
-                    
-                    # Update database structure
-                    self.message_tree.load_database(self.sym_parser)
-                    self.update_database_info()
-                    self.update_message_combo()
-                    self.update_statistics()
-                    
-                    # Emit signal to notify other tabs
-                    self.sym_parser_changed.emit(self.sym_parser)
-                    
-                    QMessageBox.information(self, "Success", 
-                                          f"Loaded SYM file with {len(self.sym_parser.messages)} messages")
-                else:
-                    QMessageBox.critical(self, "Error", "Failed to parse SYM file")
-                    
-            except Exception as e:
-                QMessageBox.critical(self, "Error", f"Failed to load SYM file: {str(e)}")
+            # Parse in the background so the GUI keeps drawing
+            self.load_sym_btn.setEnabled(False)
+            self.sym_file_label.setText(f"Loading: {os.path.basename(filename)}...")
+            
+            self.sym_loader = SymLoader(filename)
+            self.sym_loader.loaded.connect(self.on_sym_loaded)
+            self.sym_loader.error_occurred.connect(self.on_sym_load_error)
+            self.sym_loader.start()
+            
+    def on_sym_loaded(self, sym_parser: SymParser):
+        """Handle a SYM file parsed by the loader thread"""
+        self.sym_parser = sym_parser
+        self.loaded_file = self.sym_loader.filename
+        
+        # Update UI
+        self.load_sym_btn.setEnabled(False)
+        self.unload_sym_btn.setEnabled(True)
+        self.sym_file_label.setText(f"Loaded: {os.path.basename(self.loaded_file)}")
+        
+        # Update database structure
+        self.message_tree.load_database(self.sym_parser)
+        self.update_database_info()
+        self.update_message_combo()
+        self.update_statistics()
+        
+        # Emit signal to notify other tabs
+        self.sym_parser_changed.emit(self.sym_parser)
+        
+        QMessageBox.information(self, "Success", 
+                              f"Loaded SYM file with {len(self.sym_parser.messages)} messages")
+        
+    def on_sym_load_error(self, error: str):
+        """Handle a SYM file that could not be parsed"""
+        self.load_sym_btn.setEnabled(True)
+        self.sym_file_label.setText("No SYM file loaded")
+        QMessageBox.critical(self, "Error", error)
                 
     def unload_sym_file(self):
         """Unload current SYM file"""
@@ -472,17 +502,14 @@ Signal Assignments ({len(message.signals)}):
         self.message_cache.clear()
         self.update_statistics()
         
-    @pyqtSlot(str, object)
-    def on_message_received(self, network_id: str, msg: CANMessage):
-        """Handle received CAN message"""
-        if self.auto_decode_cb.isChecked():
-            self.decode_message(msg)
-            
-    @pyqtSlot(str, object)
-    def on_message_transmitted(self, network_id: str, msg: CANMessage):
-        """Handle transmitted CAN message"""
+    @pyqtSlot(list)
+    def on_messages(self, batch):
+        """Handle a batch of (network_id, message) pairs received or transmitted"""
         if self.auto_decode_cb.isChecked():
-            self.decode_message(msg)
+            # Only the newest frame per ID is shown, so older ones in the batch are skipped
+            latest = {msg.arbitration_id: msg for _, msg in batch}
+            for msg in latest.values():
+                self.decode_message(msg)
             
     def decode_message(self, msg: CANMessage):
         """Decode CAN message using SYM database"""
@@ -10,6 +10,7 @@ from PyQt6.QtCore import Qt, QTimer, pyqtSlot
 from PyQt6.QtGui import QFont, QColor
 import json
 import time
+from collections import Counter
 
 # Network manager will be passed in constructor
 
@@ -267,7 +268,7 @@ class TransmitTab(QWidget):
         
     def setup_connections(self):
         """Set up signal connections"""
-        self.network_manager.message_transmitted.connect(self.on_message_transmitted)
+        self.network_manager.messages_transmitted.connect(self.on_messages_transmitted)
         self.network_manager.error_occurred.connect(self.on_error_occurred)
         self.network_manager.network_state_changed.connect(self.on_network_state_changed)
         
@@ -419,7 +420,7 @@ class TransmitTab(QWidget):
             
         # Clear existing periodic tasks from all networks
         for network in connected_networks:
-            network.periodic_tasks.clear()
+            network.clear_periodic_messages()
         
         # Add enabled messages to periodic tasks
         enabled_count = 0
@@ -453,7 +454,7 @@ class TransmitTab(QWidget):
         self.periodic_timer.stop()
         # Clear periodic tasks from all networks
         for network in self.network_manager.get_all_networks().values():
-            network.periodic_tasks.clear()
+            network.clear_periodic_messages()
         
         # Update UI
         self.start_periodic_btn.setEnabled(True)
@@ -538,18 +539,22 @@ class TransmitTab(QWidget):
             except Exception as e:
                 QMessageBox.critical(self, "Error", f"Failed to save file: {str(e)}")
                 
-    @pyqtSlot(str, object)
-    def on_message_transmitted(self, network_id: str, msg):
-        """Handle transmitted message"""
-        # Update count in table if it's a periodic message
+    @pyqtSlot(list)
+    def on_messages_transmitted(self, batch):
+        """Handle a batch of (network_id, message) pairs that were transmitted"""
+        # Update counts in the table in one pass; the first row with an ID gets its frames
+        sent = Counter(msg.arbitration_id for _, msg in batch)
         for row in range(self.transmit_table.rowCount()):
+            if not sent:
+                break
+                
             msg_data = self.transmit_table.get_message_data(row)
-            if msg_data and msg_data['id'] == msg.arbitration_id:
+            if msg_data and msg_data['id'] in sent:
+                count = sent.pop(msg_data['id'])
                 count_item = self.transmit_table.item(row, 6)
                 if count_item:
                     current_count = int(count_item.text())
-                    count_item.setText(str(current_count + 1))
-                break
+                    count_item.setText(str(current_count + count))
                 
     @pyqtSlot(str, str)
     def on_error_occurred(self, network_id: str, error_msg: str):
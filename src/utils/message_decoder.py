@@ -17,21 +17,17 @@ class MessageDecoder:
             
         # CAN messages use big-endian bit ordering within bytes
         # Bit 0 is the MSB of byte 0, bit 7 is LSB of byte 0, bit 8 is MSB of byte 1, etc.
-        
-        value = 0
-        for i in range(bit_length):
-            bit_pos = start_bit + i
-            if bit_pos >= len(data) * 8:
-                break
-                
-            byte_index = bit_pos // 8
-            bit_index = 7 - (bit_pos % 8)  # MSB is bit 7, LSB is bit 0
+        # so the payload reads as one big-endian integer and a field is a shift and mask
+        total_bits = len(data) * 8
+        available = min(bit_length, total_bits - start_bit)
+        if available <= 0:
+            return 0
             
-            if byte_index < len(data):
-                bit_value = (data[byte_index] >> bit_index) & 1
-                value |= bit_value << (bit_length - 1 - i)
-                
-        return value
+        raw = int.from_bytes(data, byteorder='big')
+        value = (raw >> (total_bits - start_bit - available)) & ((1 << available) - 1)
+        
+        # Bits past the end of the payload read as zero in the low positions
+        return value << (bit_length - available)
     
     @staticmethod
     def decode_signal_value(sym_parser, data: bytes, start_bit: int, bit_length: int, 
@@ -85,37 +81,37 @@ class MessageDecoder:
             return []
         
         # Find matching message definition
-        for msg_name, msg_def in sym_parser.messages.items():
-            if msg_def.can_id == msg.arbitration_id:
-                signals = []
-                
-                # Decode each variable (Var= entries)
-                for var in msg_def.variables:
-                    try:
-                        value_str = MessageDecoder.decode_signal_value(
-                            sym_parser, msg.data, var.start_bit, var.bit_length, 
-                            var.factor, var.offset, var.enum_name, var.unit
-                        )
-                        signals.append((var.name, value_str))
-                    except Exception:
-                        signals.append((var.name, "Error decoding"))
-                
-                # Decode signal assignments (Sig= entries)
-                for signal_name, start_bit in msg_def.signals:
-                    if signal_name in sym_parser.signals:
-                        signal_def = sym_parser.signals[signal_name]
-                        try:
-                            value_str = MessageDecoder.decode_signal_value(
-                                sym_parser, msg.data, start_bit, signal_def.bit_length, 
-                                signal_def.factor, signal_def.offset, signal_def.enum_name, signal_def.unit
-                            )
-                            signals.append((signal_name, value_str))
-                        except Exception:
-                            signals.append((signal_name, "Error decoding"))
-                
-                return signals
+        msg_def = sym_parser.get_message_by_id(msg.arbitration_id)
+        if msg_def is None:
+            return []
+            
+        signals = []
+        
+        # Decode each variable (Var= entries)
+        for var in msg_def.variables:
+            try:
+                value_str = MessageDecoder.decode_signal_value(
+                    sym_parser, msg.data, var.start_bit, var.bit_length, 
+                    var.factor, var.offset, var.enum_name, var.unit
+                )
+                signals.append((var.name, value_str))
+            except Exception:
+                signals.append((var.name, "Error decoding"))
+        
+        # Decode signal assignments (Sig= entries)
+        for signal_name, start_bit in msg_def.signals:
+            if signal_name in sym_parser.signals:
+                signal_def = sym_parser.signals[signal_name]
+                try:
+                    value_str = MessageDecoder.decode_signal_value(
+                        sym_parser, msg.data, start_bit, signal_def.bit_length, 
+                        signal_def.factor, signal_def.offset, signal_def.enum_name, signal_def.unit
+                    )
+                    signals.append((signal_name, value_str))
+                except Exception:
+                    signals.append((signal_name, "Error decoding"))
         
-        return []
+        return signals
     
     @staticmethod
     def get_message_name(msg_id: int, bus_number: int, network_manager) -> str:
@@ -129,8 +125,8 @@ class MessageDecoder:
             if network.config.bus_number == bus_number:
                 sym_parser = network.get_symbol_parser()
                 if sym_parser and sym_parser.messages:
-                    for msg_name, msg_def in sym_parser.messages.items():
-                        if msg_def.can_id == msg_id:
-                            return msg_name
+                    msg_def = sym_parser.get_message_by_id(msg_id)
+                    if msg_def is not None:
+                        return msg_def.name
         
         return f"Unknown_0x{msg_id:X}"
@@ -3,9 +3,21 @@ PCAN Symbol File (.sym) Parser
 Parses PCAN Symbol Editor format files for CAN message definitions
 """
 
+import hashlib
+import json
+import os
 import re
+import stat
+from functools import lru_cache
 from typing import Dict, List, Optional, Tuple, Any
-from dataclasses import dataclass
+from dataclasses import asdict, dataclass
+
+
+# Parsed-file cache shared across launches, stored as plain JSON in the user's own
+# cache directory (never a shared temp dir) so loading it can never run code
+_DISK_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or os.path.join(os.path.expanduser('~'), '.cache'),
+                               'qcan-explorer', 'symcache')
+_DISK_CACHE_VERSION = 2
 
 
 @dataclass
@@ -71,21 +83,95 @@ class SymParser:
         self.enums: Dict[str, SymEnum] = {}
         self.signals: Dict[str, SymSignal] = {}
         self.messages: Dict[str, SymMessage] = {}
+        self.messages_by_id: Dict[int, SymMessage] = {}  # CAN ID index over messages
         self.version: str = ""
         self.title: str = ""
         
-    def parse_file(self, file_path: str) -> bool:
-        """Parse a .sym file and populate the internal structures"""
+    def parse_file(self, file_path: str, use_disk_cache: bool = False) -> bool:
+        """Parse a .sym file and populate the internal structures, optionally through the per-user disk cache"""
         try:
+            cache_path = self._disk_cache_path(file_path) if use_disk_cache else None
+            if cache_path and self._load_disk_cache(cache_path):
+                return True
+                
             with open(file_path, 'r', encoding='utf-8') as f:
                 content = f.read()
                 
-            return self.parse_content(content)
+            if not self.parse_content(content):
+                return False
+                
+            if cache_path:
+                self._save_disk_cache(cache_path)
+            return True
             
         except Exception as e:
             print(f"Error parsing .sym file: {e}")
             return False
             
+    @staticmethod
+    def _disk_cache_path(file_path: str) -> str:
+        """Cache file name keyed on path, modification time and size"""
+        st = os.stat(file_path)
+        key = f"{os.path.realpath(file_path)}:{st.st_mtime_ns}:{st.st_size}:{_DISK_CACHE_VERSION}"
+        return os.path.join(_DISK_CACHE_DIR, f"{hashlib.sha256(key.encode()).hexdigest()}.json")
+        
+    @staticmethod
+    def _is_private(path: str) -> bool:
+        """Whether path is owned by this user and not writable by group or others (POSIX)"""
+        if not hasattr(os, 'getuid'):
+            return True
+        st = os.lstat(path)
+        return st.st_uid == os.getuid() and not st.st_mode & (stat.S_IWGRP | stat.S_IWOTH)
+        
+    def _load_disk_cache(self, cache_path: str) -> bool:
+        """Restore parsed state from a previous launch; any failure falls back to parsing"""
+        try:
+            if not (self._is_private(_DISK_CACHE_DIR) and self._is_private(cache_path)):
+                return False
+                
+            with open(cache_path, 'r', encoding='utf-8') as f:
+                state = json.load(f)
+                
+            enums = {name: SymEnum(name, {int(value): text for value, text in values.items()})
+                     for name, values in state['enums'].items()}
+            signals = {name: SymSignal(**fields) for name, fields in state['signals'].items()}
+            messages = {}
+            for name, fields in state['messages'].items():
+                fields['variables'] = [SymVariable(**var) for var in fields['variables']]
+                fields['signals'] = [tuple(assignment) for assignment in fields['signals']]
+                messages[name] = SymMessage(**fields)
+        except Exception:
+            return False
+            
+        self.enums, self.signals, self.messages = enums, signals, messages
+        self.version, self.title = state['version'], state['title']
+        self._build_id_index()
+        return True
+        
+    def _save_disk_cache(self, cache_path: str):
+        """Store parsed state for the next launch (best effort)"""
+        try:
+            os.makedirs(_DISK_CACHE_DIR, mode=0o700, exist_ok=True)
+            if not self._is_private(_DISK_CACHE_DIR):
+                print(f"⚠️ Not writing .sym cache: {_DISK_CACHE_DIR} is not private to this user")
+                return
+                
+            state = {
+                'version': self.version,
+                'title': self.title,
+                'enums': {name: enum.values for name, enum in self.enums.items()},
+                'signals': {name: asdict(signal) for name, signal in self.signals.items()},
+                'messages': {name: asdict(message) for name, message in self.messages.items()},
+            }
+            
+            # Write beside the target and rename so readers never see a partial file
+            tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                json.dump(state, f, separators=(',', ':'))
+            os.replace(tmp_path, cache_path)
+        except Exception as e:
+            print(f"⚠️ Could not write .sym cache: {e}")
+            
     def parse_content(self, content: str) -> bool:
         """Parse .sym file content"""
         try:
@@ -105,6 +191,7 @@ class SymParser:
             if 'SENDRECEIVE' in sections:
                 self._parse_messages(sections['SENDRECEIVE'])
                 
+            self._build_id_index()
             return True
             
         except Exception as e:
@@ -237,6 +324,12 @@ class SymParser:
             if message:
                 self.messages[message_name] = message
                 
+    def _build_id_index(self):
+        """Index message definitions by CAN ID (first definition wins)"""
+        self.messages_by_id = {}
+        for message in self.messages.values():
+            self.messages_by_id.setdefault(message.can_id, message)
+            
     def _parse_single_message(self, name: str, content: str) -> Optional[SymMessage]:
         """Parse a single message definition"""
         try:
@@ -362,12 +455,7 @@ class SymParser:
     def decode_message(self, can_id: int, data: bytes) -> Optional[Dict[str, Any]]:
         """Decode a CAN message using the loaded symbol definitions"""
         # Find message by CAN ID
-        message = None
-        for msg in self.messages.values():
-            if msg.can_id == can_id:
-                message = msg
-                break
-                
+        message = self.messages_by_id.get(can_id)
         if not message:
             return None
             
@@ -461,10 +549,7 @@ class SymParser:
         
     def get_message_by_id(self, can_id: int) -> Optional[SymMessage]:
         """Get message definition by CAN ID"""
-        for message in self.messages.values():
-            if message.can_id == can_id:
-                return message
-        return None
+        return self.messages_by_id.get(can_id)
         
     def get_statistics(self) -> Dict[str, int]:
         """Get statistics about the loaded symbol file"""
@@ -474,3 +559,32 @@ class SymParser:
             'messages': len(self.messages),
             'total_variables': sum(len(msg.variables) for msg in self.messages.values())
         }
+
+
+@lru_cache(maxsize=8)
+def _parse_file_cached(real_path: str, mtime_ns: int) -> SymParser:
+    """Parse a .sym file; keyed on modification time so edits invalidate the entry
+    
+    Raises ValueError on failure so that lru_cache does not remember it.
+    """
+    parser = SymParser()
+    if not parser.parse_file(real_path, use_disk_cache=True):
+        raise ValueError(f"could not parse {real_path}")
+    return parser
+
+
+def load_sym_file_cached(file_path: str) -> Optional[SymParser]:
+    """Parse a .sym file, reusing the previous result while the file is unchanged
+    
+    The returned parser is shared between callers and must be treated as read-only.
+    """
+    try:
+        mtime_ns = os.stat(file_path).st_mtime_ns
+    except OSError as e:
+        print(f"Error parsing .sym file: {e}")
+        return None
+        
+    try:
+        return _parse_file_cached(os.path.realpath(file_path), mtime_ns)
+    except ValueError:
+        return None
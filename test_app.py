@@ -89,6 +89,288 @@ def test_message_parsing():
     print()
 
 
+def test_frame_ring():
+    """Test the fixed-capacity frame ring used for tooltip lookup"""
+    print("Testing Frame Ring...")
+    
+    from canbus.messages import FrameRing
+    
+    def make(i, data=b'\x01\x02', is_extended=False):
+        return CANMessage(float(i), 0x100 + i, data, is_extended, False, False, 'test', 'rx', bus_number=1)
+        
+    # Capacity rounds up to a power of two and wraps, dropping the oldest frames
+    ring = FrameRing(5)
+    assert len(ring.frames) == 8, "Capacity should round up to a power of two"
+    for i in range(10):
+        ring.append(make(i))
+    assert len(ring) == 8, "Ring should hold at most its capacity"
+    assert ring.get(0) is None and ring.get(1) is None, "Overwritten frames should be gone"
+    assert ring.get(10) is None and ring.get(-1) is None, "Out-of-range indexes should return None"
+    assert [ring.get(i).arbitration_id for i in range(2, 10)] == [0x100 + i for i in range(2, 10)], \
+        "Surviving frames should come back in order"
+    ring.clear()
+    assert len(ring) == 0 and ring.get(0) is None, "Cleared ring should be empty"
+    print("✓ Wrap-around at power-of-two capacity")
+    
+    # Classic frames are rebuilt from the array row
+    ring = FrameRing(4)
+    msg = CANMessage(12.5, 0x1ABCDEF0, bytes(range(1, 9)), True, False, False, 'can0', 'tx', bus_number=3)
+    ring.append(msg)
+    loaded = ring.get(0)
+    assert loaded is not msg, "Classic frames should be rebuilt from the array"
+    assert (loaded.timestamp, loaded.arbitration_id, loaded.data, loaded.is_extended_id,
+            loaded.is_remote_frame, loaded.is_error_frame, loaded.direction, loaded.bus_number) == \
+           (msg.timestamp, msg.arbitration_id, msg.data, msg.is_extended_id,
+            msg.is_remote_frame, msg.is_error_frame, msg.direction, msg.bus_number), "Extended frame should round-trip"
+    assert loaded.channel == '', "Rebuilt frames do not keep the channel"
+    ring.append(make(1, b'\xAA'))
+    assert ring.get(1).data == b'\xAA', "Short payloads should keep their length"
+    print("✓ Extended classic frame round-trip")
+    
+    # CAN FD frames come back as the original message until their slot is reused
+    fd_msg = make(2, bytes(range(64)))
+    ring.append(fd_msg)
+    assert ring.get(2) is fd_msg, "CAN FD frame should come back as the original message"
+    for i in range(3, 7):
+        ring.append(make(i))
+    assert ring.get(2) is None and not ring.long_frames, "Overwritten CAN FD frame should be released"
+    print("✓ CAN FD frame kept whole")
+    
+    print()
+
+
+def test_extract_bits():
+    """Test signal bit extraction against the original per-bit loop"""
+    print("Testing Signal Bit Extraction...")
+    
+    import random
+    from utils.message_decoder import MessageDecoder
+    
+    def extract_bits_loop(data, start_bit, bit_length):
+        # Reference: the per-bit loop the shift/mask version replaced
+        value = 0
+        for i in range(bit_length):
+            bit_pos = start_bit + i
+            if bit_pos >= len(data) * 8:
+                break
+            byte_index = bit_pos // 8
+            bit_index = 7 - (bit_pos % 8)
+            if byte_index < len(data):
+                value |= ((data[byte_index] >> bit_index) & 1) << (bit_length - 1 - i)
+        return value
+        
+    rng = random.Random(1234)
+    payloads = [b'', b'\x80', b'\xFF' * 8, b'\xAA\x55' * 4, bytes(range(1, 9)),
+                bytes(rng.randrange(256) for _ in range(8)), bytes(rng.randrange(256) for _ in range(64))]
+    cases = 0
+    for data in payloads:
+        total_bits = len(data) * 8
+        # Every start and length, including fields that run past the end of the data
+        for start_bit in range(0, total_bits + 9, 1 if len(data) <= 8 else 7):
+            for bit_length in range(0, 66):
+                expected = extract_bits_loop(data, start_bit, bit_length)
+                assert MessageDecoder.extract_bits_can_format(data, start_bit, bit_length) == expected, \
+                    f"Mismatch for data={data.hex()} start={start_bit} length={bit_length}"
+                cases += 1
+    print(f"✓ Matches the per-bit loop on {cases} fields")
+    
+    # Fields with the top bit set come back as unsigned raw values
+    assert MessageDecoder.extract_bits_can_format(b'\xF0\x0F', 0, 8) == 0xF0
+    assert MessageDecoder.extract_bits_can_format(b'\x80\x01', 0, 16) == 0x8001
+    assert MessageDecoder.extract_bits_can_format(b'\xFF', 4, 8) == 0xF0, "Missing bits should read as low zeros"
+    print("✓ Raw values unsigned, truncated fields zero-filled")
+    
+    print()
+
+
+def _run_events(app, seconds):
+    """Process Qt events for a while, so timers fire"""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+class _StubCyclicTask:
+    """Backend cyclic sender that only counts stop() calls"""
+    
+    def __init__(self):
+        self.stopped = 0
+        
+    def stop(self):
+        self.stopped += 1
+
+
+class _StubBus:
+    """Records sends; send_periodic raises unless cyclic sending is supported"""
+    
+    def __init__(self, cyclic_supported=False):
+        self.cyclic_supported = cyclic_supported
+        self.sent = []
+        self.cyclic_tasks = []
+        
+    def send(self, msg, timeout=None):
+        self.sent.append(msg.arbitration_id)
+        
+    def send_periodic(self, msg, period, store_task=True):
+        if not self.cyclic_supported:
+            raise NotImplementedError("no cyclic sender")
+        self.cyclic_tasks.append(_StubCyclicTask())
+        return self.cyclic_tasks[-1]
+
+
+def test_network_periodic_scheduling():
+    """Test the CANNetwork periodic heap and its cyclic-sender fallback"""
+    print("Testing Network Periodic Scheduling...")
+    
+    from PyQt6.QtCore import QCoreApplication
+    from canbus.network import (CANConnection, CANNetwork, ConnectionState,
+                                HardwareInterface, NetworkConfiguration)
+    
+    app = QCoreApplication.instance() or QCoreApplication([])
+    
+    def network_with_bus(bus):
+        network = CANNetwork(NetworkConfiguration(name="Periodic"))
+        connection = CANConnection(network.config.network_id, network.config,
+                                   HardwareInterface('socketcan', 'stub0', 'Stub', 'Stub bus'))
+        connection.bus = bus
+        connection.state = ConnectionState.CONNECTED
+        network.connection = connection
+        return network
+        
+    # send_periodic raising falls back to the timer heap
+    bus = _StubBus()
+    network = network_with_bus(bus)
+    network.add_periodic_message(0x100, b'\x01', 10)
+    task = network.periodic_tasks[0]
+    assert not task['cyclic'] and task['scheduled'], "Unsupported cyclic send should use the timer heap"
+    for enabled in (False, True, False, True):
+        network.set_periodic_message_enabled(0x100, enabled)
+    assert len(network._periodic_heap) == 1, "Enable toggles should not schedule a task twice"
+    _run_events(app, 0.2)
+    assert bus.sent.count(0x100) >= 2, "Timer heap should send the task repeatedly"
+    print("✓ Falls back to the timer heap")
+    
+    network.set_periodic_message_enabled(0x100, False)
+    _run_events(app, 0.05)
+    sent = len(bus.sent)
+    _run_events(app, 0.1)
+    assert len(bus.sent) == sent, "Disabled task should not be sent"
+    network.remove_periodic_message(0x100)
+    assert task['removed'] and not network.periodic_tasks, "Removed task should be dropped"
+    _run_events(app, 0.05)
+    assert not network._periodic_heap and not task['scheduled'], "Removed task should leave the heap"
+    assert not network.periodic_timer.isActive(), "Empty heap should stop the timer"
+    print("✓ Disable and remove")
+    
+    # A supported cyclic sender takes over, and toggles stop and restart it
+    bus = _StubBus(cyclic_supported=True)
+    network = network_with_bus(bus)
+    network.add_periodic_message(0x101, b'\x02', 10)
+    task = network.periodic_tasks[0]
+    assert task['cyclic'] and not network._periodic_heap, "Supported cyclic send should bypass the heap"
+    network.set_periodic_message_enabled(0x101, False)
+    assert bus.cyclic_tasks[0].stopped == 1 and not task['cyclic'], "Disabling should stop the cyclic sender"
+    network.set_periodic_message_enabled(0x101, True)
+    assert task['cyclic'] and len(bus.cyclic_tasks) == 2, "Enabling should restart the cyclic sender"
+    network.set_periodic_message_enabled(0x101, True)
+    assert len(bus.cyclic_tasks) == 2, "Enabling twice should not start a second sender"
+    network.remove_periodic_message(0x101)
+    assert bus.cyclic_tasks[1].stopped == 1, "Removing should stop the cyclic sender"
+    network.periodic_timer.stop()
+    print("✓ Cyclic sender toggles")
+    
+    print()
+
+
+def test_manager_periodic_scheduling():
+    """Test the CANInterfaceManager periodic heap and its cyclic-sender fallback"""
+    print("Testing Manager Periodic Scheduling...")
+    
+    from PyQt6.QtCore import QCoreApplication
+    
+    app = QCoreApplication.instance() or QCoreApplication([])
+    
+    # The virtual bus has no backend cyclic sender, so tasks run from the timer heap
+    manager = CANInterfaceManager()
+    if manager.connect('virtual', 'periodic_test', 500000):
+        try:
+            manager.add_periodic_message(0x200, b'\x03', 10)
+            for enabled in (False, True, False, True):
+                manager.set_periodic_message_enabled(0x200, enabled)
+            assert len(manager._pt_heap) == 1, "Enable toggles should not schedule a task twice"
+            _run_events(app, 0.2)
+            assert manager.stats.tx_count >= 2, "Virtual bus should send the periodic task"
+            manager.remove_periodic_message(0x200)
+            _run_events(app, 0.05)
+            sent = manager.stats.tx_count
+            _run_events(app, 0.1)
+            assert manager.stats.tx_count == sent, "Removed task should not be sent"
+            assert not manager._pt_heap, "Removed task should leave the heap"
+            print("✓ Timer heap on the virtual bus")
+        finally:
+            manager.disconnect()
+            
+    # send_periodic raising falls back to the heap; supported senders restart on enable
+    manager = CANInterfaceManager()
+    manager.bus = _StubBus()
+    manager.add_periodic_message(0x201, b'\x04', 10)
+    assert manager._pt_tasks[0].cyclic is None and len(manager._pt_heap) == 1, \
+        "Unsupported cyclic send should use the timer heap"
+    manager.bus = bus = _StubBus(cyclic_supported=True)
+    manager.add_periodic_message(0x202, b'\x05', 10)
+    task = manager._pt_tasks[1]
+    assert task.cyclic is bus.cyclic_tasks[0] and len(manager._pt_heap) == 1, \
+        "Supported cyclic send should bypass the heap"
+    manager.set_periodic_message_enabled(0x202, False)
+    assert bus.cyclic_tasks[0].stopped == 1, "Disabling should stop the cyclic sender"
+    manager.set_periodic_message_enabled(0x202, True)
+    assert task.cyclic is bus.cyclic_tasks[1], "Enabling should restart the cyclic sender"
+    manager._clear_periodic_tasks()
+    assert bus.cyclic_tasks[1].stopped == 1 and not manager._pt_heap, "Clearing should stop every sender"
+    manager.bus = None
+    print("✓ Cyclic sender fallback and toggles")
+    
+    print()
+
+
+def test_id_filter_parsing():
+    """Test parsing of the monitor's ID filter"""
+    print("Testing ID Filter Parsing...")
+    
+    from gui.monitor_tab import parse_id_filter
+    
+    # Empty and wildcard filters let everything through
+    assert parse_id_filter("") is None and parse_id_filter("   ") is None, "Empty filter should pass everything"
+    assert parse_id_filter(" * ") is None, "Wildcard filter should pass everything"
+    
+    # Single IDs, hex and decimal, separated by commas and/or whitespace
+    assert parse_id_filter("0x123") == (frozenset({0x123}), ()), "Hex ID"
+    assert parse_id_filter("291") == (frozenset({291}), ()), "Decimal ID"
+    assert parse_id_filter("0x10, 17 0X12,,  19") == (frozenset({16, 17, 18, 19}), ()), "Mixed separators"
+    print("✓ Single hex and decimal IDs")
+    
+    # Narrow ranges are expanded into the set, reversed bounds are swapped
+    assert parse_id_filter("0x100-0x103") == (frozenset({0x100, 0x101, 0x102, 0x103}), ()), "Hex range"
+    assert parse_id_filter("20-18, 5") == (frozenset({5, 18, 19, 20}), ()), "Reversed range"
+    ids, ranges = parse_id_filter("0x0-0xFFF")
+    assert len(ids) == 0x1000 and ranges == (), "Range at the expansion limit should be expanded"
+    print("✓ Ranges expanded into the ID set")
+    
+    # Wide ranges are kept as bounds
+    assert parse_id_filter("0-0x1FFFFFFF, 0x7") == (frozenset({7}), ((0, 0x1FFFFFFF),)), "Wide range"
+    assert parse_id_filter("0x2000-0x1000") == (frozenset(), ((0x1000, 0x2000),)), "Reversed wide range"
+    print("✓ Wide ranges kept as bounds")
+    
+    # Invalid tokens are ignored; a filter of only invalid tokens passes nothing
+    assert parse_id_filter("abc, 0x10, 0xZZ") == (frozenset({16}), ()), "Invalid tokens should be skipped"
+    assert parse_id_filter("1-2-3, 0x-5, -5, 1--2") == (frozenset(), ()), "Malformed and negative ranges should be skipped"
+    assert parse_id_filter("0x") == (frozenset(), ()), "Bare prefix should match nothing"
+    print("✓ Invalid input ignored")
+    
+    print()
+
+
 def test_gui_imports():
     """Test GUI component imports"""
     print("Testing GUI Imports...")
@@ -115,6 +397,127 @@ def test_gui_imports():
     print()
 
 
+def test_sym_parser_cache():
+    """Test cached SYM file parsing"""
+    print("Testing SYM Parser Cache...")
+    
+    import tempfile
+    from utils import sym_parser
+    from utils.sym_parser import SymParser, load_sym_file_cached
+    
+    sym_path = os.path.join(os.path.dirname(__file__), 'examples', 'sym', 'virtual_can_network.sym')
+    
+    # Keep the disk cache out of the user's home directory
+    saved_cache_dir = sym_parser._DISK_CACHE_DIR
+    with tempfile.TemporaryDirectory() as cache_dir:
+        sym_parser._DISK_CACHE_DIR = os.path.join(cache_dir, 'symcache')
+        try:
+            parser = load_sym_file_cached(sym_path)
+            
+            assert parser is not None, "SYM file should parse"
+            assert load_sym_file_cached(sym_path) is parser, "Unchanged SYM file should not be re-parsed"
+            print("✓ Cached SYM parser reused")
+            
+            assert len(os.listdir(sym_parser._DISK_CACHE_DIR)) == 1, "Cached parse should be written to disk"
+            cached = SymParser()
+            assert cached.parse_file(sym_path, use_disk_cache=True), "Disk cache should load"
+            assert cached.get_statistics() == parser.get_statistics(), "Disk cache should match the parse"
+            print("✓ Disk cache round-trip")
+            
+            plain_dir = os.path.join(cache_dir, 'plain')
+            os.mkdir(plain_dir)
+            sym_parser._DISK_CACHE_DIR = plain_dir
+            assert SymParser().parse_file(sym_path), "SYM file should parse without the disk cache"
+            assert not os.listdir(plain_dir), "parse_file should not write the disk cache by default"
+            print("✓ Disk cache is opt-in")
+            
+            # A failed parse is retried even if the file keeps its modification time
+            bad_path = os.path.join(cache_dir, 'bad.sym')
+            with open(bad_path, 'wb') as f:
+                f.write(b'\xff\xfe not utf-8')
+            os.utime(bad_path, ns=(1, 1))
+            assert load_sym_file_cached(bad_path) is None, "Undecodable SYM file should fail"
+            with open(sym_path, 'rb') as src, open(bad_path, 'wb') as f:
+                f.write(src.read())
+            os.utime(bad_path, ns=(1, 1))
+            assert load_sym_file_cached(bad_path) is not None, "Failed parses should not be cached"
+            print("✓ Failed parse not cached")
+        finally:
+            sym_parser._DISK_CACHE_DIR = saved_cache_dir
+    
+    print()
+
+
+def test_configuration_persistence():
+    """Test saving and loading network profiles"""
+    print("Testing Configuration Persistence...")
+    
+    import gzip
+    import tempfile
+    from pathlib import Path
+    from PyQt6.QtCore import QCoreApplication, QThreadPool
+    from canbus.multi_network_manager import MultiNetworkManager, PROFILE_GZIP_THRESHOLD
+    from canbus.network import NetworkConfiguration
+    
+    app = QCoreApplication.instance() or QCoreApplication([])
+    
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        config_file = Path(tmp_dir) / 'profiles.json'
+        backup_file = Path(tmp_dir) / 'profiles.json.bak'
+        
+        manager = MultiNetworkManager()
+        manager.auto_save = False
+        manager.config_file = config_file
+        try:
+            def saved_profiles():
+                return {network_id: network.config.to_dict() for network_id, network in manager.networks.items()}
+                
+            for bus_number in (1, 2):
+                manager.create_network(NetworkConfiguration(name=f"Bus {bus_number}", bus_number=bus_number))
+            first = saved_profiles()
+            
+            # Save then load round-trips every field
+            assert manager.save_configuration(), "Save should succeed"
+            assert not backup_file.exists(), "First save has no previous file to back up"
+            assert manager.load_configuration(), "Load should succeed"
+            assert saved_profiles() == first, "Loaded profiles should match the saved ones"
+            print("✓ Save/load round-trip")
+            
+            # A second save keeps the first as .bak; a truncated primary falls back to it
+            manager.create_network(NetworkConfiguration(name="Bus 3", bus_number=3))
+            assert manager.save_configuration(), "Save should succeed"
+            assert backup_file.exists(), "Explicit save should keep a .bak of the previous file"
+            raw = config_file.read_bytes()
+            config_file.write_bytes(raw[:len(raw) // 2])
+            assert manager.load_configuration(), "Truncated profile should load from .bak"
+            assert saved_profiles() == first, "Fallback should load the backed-up profiles"
+            assert config_file.read_bytes() == backup_file.read_bytes(), "Fallback should restore the primary"
+            print("✓ Truncated profile falls back to .bak")
+            
+            # Large profiles are gzipped, and still load
+            network = next(iter(manager.networks.values()))
+            network.config.description = "x" * PROFILE_GZIP_THRESHOLD
+            large = saved_profiles()
+            assert manager.save_configuration(), "Save should succeed"
+            raw = config_file.read_bytes()
+            assert raw[:2] == b'\x1f\x8b', "Profiles over the threshold should be gzipped"
+            assert len(gzip.decompress(raw)) >= PROFILE_GZIP_THRESHOLD, "Gzip payload should hold the full profile"
+            assert manager.load_configuration(), "Gzipped profile should load"
+            assert saved_profiles() == large, "Gzipped profile should round-trip"
+            print("✓ Large profile gzipped")
+            
+            # A truncated gzip stream also falls back to .bak
+            config_file.write_bytes(raw[:len(raw) // 2])
+            assert manager.load_configuration(), "Truncated gzip profile should load from .bak"
+            assert saved_profiles() == first, "Fallback should load the backed-up profiles"
+            print("✓ Truncated gzip profile falls back to .bak")
+        finally:
+            manager.shutdown()
+            QThreadPool.globalInstance().waitForDone()
+            
+    print()
+
+
 def test_file_examples():
     """Test example files exist"""
     print("Testing Example Files...")
@@ -141,7 +544,14 @@ def main():
     
     test_can_manager()
     test_message_parsing()
+    test_frame_ring()
+    test_extract_bits()
+    test_network_periodic_scheduling()
+    test_manager_periodic_scheduling()
+    test_id_filter_parsing()
     test_gui_imports()
+    test_sym_parser_cache()
+    test_configuration_persistence()
     test_file_examples()
     
     print("Test suite completed!")